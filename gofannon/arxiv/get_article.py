@@ -1,12 +1,24 @@
-from..base import BaseTool
-import requests
+from..base import BaseTool, ToolResult
+from ..base.cache import ResultCache, make_cache_key
 from ..config import FunctionRegistry
 import logging
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
+BASE_URL = "http://export.arxiv.org/api/query"
+# Ids per bulk request in execute_batch.
+BATCH_SIZE = 50
+
+ENTRY_RE = re.compile(r"[ \t]*<entry\b.*?</entry>[ \t]*\n?", re.DOTALL)
+ENTRY_ID_RE = re.compile(r"<id>\s*(.*?)\s*</id>", re.DOTALL)
+COUNT_RE = re.compile(r"(<opensearch:(?:totalResults|itemsPerPage)\b[^>]*>)\s*\d+\s*(<)")
+
 @FunctionRegistry.register
 class GetArticle(BaseTool):
+    cache_ttl = 60 * 60
+
     def __init__(self, name="get_article"):
         super().__init__()
         self.name = name
@@ -33,9 +45,118 @@ class GetArticle(BaseTool):
 
     def fn(self, id):
         logger.debug("Fetching Article '%s' from ArXiv", id)
-        base_url = "http://export.arxiv.org/api/query"
-        params = {
-            "id_list": id
-        }
-        response = requests.get(base_url, params=params)
-        return response.text  
\ No newline at end of file
+        response = self.http_session.get(BASE_URL, params={"id_list": id})
+        return response.text
+
+    async def afn(self, id):
+        logger.debug("Fetching Article '%s' from ArXiv", id)
+        response = await self.async_http_client.get(BASE_URL, params={"id_list": id})
+        return response.text
+
+    # arXiv's query API takes a comma-separated id_list, so a batch of ids is
+    # fetched with one request per BATCH_SIZE ids rather than one per id. Each
+    # item gets a single-entry feed; ids missing from the bulk response (bad
+    # ids, failed requests) fall back to individual calls. Those feeds are
+    # not byte-identical to what fn returns for the same id, so they are
+    # cached under their own key.
+    def execute_batch(self, context, list_of_kwargs, max_concurrency=8):
+        list_of_kwargs = list(list_of_kwargs)
+        results, pending = self._cached_batch_results(context, list_of_kwargs)
+        for chunk in self._chunks(pending):
+            ids = [list_of_kwargs[index]["id"] for index in chunk]
+            start_time = time.time()
+            try:
+                response = self.http_session.get(BASE_URL, params={"id_list": ",".join(ids), "max_results": len(ids)})
+                feeds = self._split_feed(response, ids)
+            except Exception as e:
+                logger.warning("Bulk arXiv request for %d ids failed: %s", len(ids), e)
+                feeds = {}
+            self._store_batch_results(context, list_of_kwargs, chunk, feeds, results, time.time() - start_time)
+        missing = [index for index, result in enumerate(results) if result is None]
+        fallback = super().execute_batch(context, [list_of_kwargs[index] for index in missing], max_concurrency)
+        for index, result in zip(missing, fallback):
+            results[index] = result
+        return results
+
+    async def aexecute_batch(self, context, list_of_kwargs, max_concurrency=8):
+        list_of_kwargs = list(list_of_kwargs)
+        results, pending = self._cached_batch_results(context, list_of_kwargs)
+        for chunk in self._chunks(pending):
+            ids = [list_of_kwargs[index]["id"] for index in chunk]
+            start_time = time.time()
+            try:
+                response = await self.async_http_client.get(BASE_URL, params={"id_list": ",".join(ids), "max_results": len(ids)})
+                feeds = self._split_feed(response, ids)
+            except Exception as e:
+                logger.warning("Bulk arXiv request for %d ids failed: %s", len(ids), e)
+                feeds = {}
+            self._store_batch_results(context, list_of_kwargs, chunk, feeds, results, time.time() - start_time)
+        missing = [index for index, result in enumerate(results) if result is None]
+        fallback = await super().aexecute_batch(context, [list_of_kwargs[index] for index in missing], max_concurrency)
+        for index, result in zip(missing, fallback):
+            results[index] = result
+        return results
+
+    def _cached_batch_results(self, context, list_of_kwargs):
+        """Results served from the cache, plus the indexes still to fetch in bulk."""
+        results = [None] * len(list_of_kwargs)
+        pending = []
+        cache = self._get_result_cache()
+        for index, kwargs in enumerate(list_of_kwargs):
+            if set(kwargs) != {"id"}:
+                continue  # left to the per-call fallback
+            if cache is not None:
+                cached = cache.get(self._batch_cache_key(kwargs))
+                if cached is not ResultCache.MISSING:
+                    context.log_execution(self.__class__.__name__, 0.0, kwargs, cached)
+                    results[index] = ToolResult(success=True, output=cached)
+                    continue
+            pending.append(index)
+        return results, pending
+
+    @staticmethod
+    def _chunks(indexes):
+        for start in range(0, len(indexes), BATCH_SIZE):
+            yield indexes[start:start + BATCH_SIZE]
+
+    def _batch_cache_key(self, arguments):
+        return make_cache_key("execute_batch", self._cache_key(arguments))
+
+    @staticmethod
+    def _split_feed(response, ids):
+        """Map each requested id to a feed holding only its entry."""
+        response.raise_for_status()
+        # The feed is cut up as text, so every entry keeps its exact bytes and
+        # the namespace declarations of the original feed element.
+        text = response.text
+        matches = list(ENTRY_RE.finditer(text))
+        if not matches:
+            return {}
+        head = COUNT_RE.sub(r"\g<1>1\g<2>", text[:matches[0].start()])
+        tail = text[matches[-1].end():]
+        entries = {}
+        for match in matches:
+            id_match = ENTRY_ID_RE.search(match.group())
+            if id_match is None:
+                continue
+            entry_id = id_match.group(1).split("/abs/")[-1]
+            entries[entry_id] = entries[re.sub(r"v\d+$", "", entry_id)] = match.group()
+
+        feeds = {}
+        for article_id in ids:
+            entry = entries.get(article_id)
+            if entry is not None:
+                feeds[article_id] = head + entry + tail
+        return feeds
+
+    def _store_batch_results(self, context, list_of_kwargs, chunk, feeds, results, duration):
+        cache = self._get_result_cache()
+        for index in chunk:
+            kwargs = list_of_kwargs[index]
+            feed = feeds.get(kwargs["id"])
+            if feed is None:
+                continue
+            context.log_execution(self.__class__.__name__, duration, kwargs, feed)
+            results[index] = ToolResult(success=True, output=feed)
+            if cache is not None:
+                cache.set(self._batch_cache_key(kwargs), feed, self.cache_ttl)
@@ -1,13 +1,16 @@
 
 from..base import BaseTool
-import requests
 from ..config import FunctionRegistry
 import logging
 
 logger = logging.getLogger(__name__)
 
+BASE_URL = "http://export.arxiv.org/api/query"
+
 @FunctionRegistry.register
 class Search(BaseTool):
+    cache_ttl = 60 * 60
+
     def __init__(self, name="search"):
         super().__init__()
         self.name = name
@@ -79,7 +82,17 @@ class Search(BaseTool):
 
     def fn(self, query, start=0, max_results=10, submittedDateFrom=None, submittedDateTo=None, ti=None, au=None, abs=None, co=None, jr=None, cat=None):
         logger.debug("Querying ArXiv for '%s'", query)
-        base_url = "http://export.arxiv.org/api/query"
+        params = self._build_params(query, start, max_results, submittedDateFrom, submittedDateTo, ti, au, abs, co, jr, cat)
+        response = self.http_session.get(BASE_URL, params=params)
+        return response.text
+
+    async def afn(self, query, start=0, max_results=10, submittedDateFrom=None, submittedDateTo=None, ti=None, au=None, abs=None, co=None, jr=None, cat=None):
+        logger.debug("Querying ArXiv for '%s'", query)
+        params = self._build_params(query, start, max_results, submittedDateFrom, submittedDateTo, ti, au, abs, co, jr, cat)
+        response = await self.async_http_client.get(BASE_URL, params=params)
+        return response.text
+
+    def _build_params(self, query, start, max_results, submittedDateFrom, submittedDateTo, ti, au, abs, co, jr, cat):
         params = {
             "search_query": query,
             "start": start,
@@ -111,5 +124,4 @@ class Search(BaseTool):
         if cat:
             params["search_query"] += f" AND cat:{cat}"
 
-        response = requests.get(base_url, params=params)
-        return response.text
\ No newline at end of file
+        return params
\ No newline at end of file
@@ -1,4 +1,7 @@
 import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Callable
@@ -9,6 +12,8 @@ from pathlib import Path
 import anyio
 
 from .adk_mixin import AdkMixin
+from .cache import MemoryCache, ResultCache, get_default_cache, make_cache_key
+from .http import get_async_client, get_session
 from ..config import ToolConfig
 
 from .smol_agents import SmolAgentsMixin
@@ -77,6 +82,21 @@ class BaseTool(SmolAgentsMixin,
                LlamaStackMixin,
                AdkMixin,
                ABC):
+    # Whether one instance may serve concurrent calls. Tools that keep
+    # per-call state on ``self`` should set this to False so pools hand each
+    # caller its own instance.
+    thread_safe = True
+    # Seconds to cache results for; None means the tool is not cacheable.
+    # Only set this on tools whose results depend solely on their arguments
+    # and on the identity returned by ``_cache_scope``.
+    cache_ttl = None
+    # Per-instance cache backend; falls back to cache.get_default_cache().
+    result_cache = None
+    # Optional native coroutine with the same signature as ``fn``. Async
+    # callers (``aexecute``, ``execute_async``) await it instead of running
+    # ``fn`` in a worker thread.
+    afn = None
+
     def __init__(self, **kwargs):
         self.logger = logging.getLogger(
             f"{self.__class__.__module__}.{self.__class__.__name__}"
@@ -96,6 +116,28 @@ class BaseTool(SmolAgentsMixin,
         if hasattr(self, "API_SERVICE"):
             self.api_key = ToolConfig.get(f"{self.API_SERVICE}_api_key")
 
+    def open(self):
+        """
+        Acquire long-lived resources (HTTP sessions, SDK clients, ...).
+
+        Called once by tool pools before the first call on this instance.
+        """
+        pass
+
+    def close(self):
+        """Release resources acquired in ``open`` or ``__init__``."""
+        pass
+
+    @property
+    def http_session(self):
+        """Pooled keep-alive session shared by tools with the same ``API_SERVICE``."""
+        return get_session(getattr(self, "API_SERVICE", None))
+
+    @property
+    def async_http_client(self):
+        """Pooled async counterpart of ``http_session``, for use from ``afn``."""
+        return get_async_client(getattr(self, "API_SERVICE", None))
+
     @property
     @abstractmethod
     def definition(self):
@@ -109,10 +151,131 @@ class BaseTool(SmolAgentsMixin,
     def fn(self, *args, **kwargs):
         pass
 
+    def _get_result_cache(self):
+        if self.cache_ttl is None:
+            return None
+        if self.result_cache is not None:
+            return self.result_cache
+        return get_default_cache()
+
+    def _should_cache(self, result):
+        """Whether ``result`` may be cached; error payloads are not."""
+        return not (isinstance(result, dict) and "error" in result)
+
+    def _cache_scope(self):
+        """
+        Credential and endpoint identity mixed into result cache keys, so
+        callers with different tokens or environments never share entries.
+        Tools whose results depend on other instance state should extend it.
+        """
+        scope = {}
+        for attribute in ("api_key", "base_url"):
+            value = getattr(self, attribute, None)
+            if value:
+                scope[attribute] = value
+        return scope
+
+    def _cache_key(self, arguments):
+        scope = self._cache_scope()
+        if scope:
+            # The key is a hash, so the token itself is never stored.
+            arguments = {"arguments": arguments, "scope": scope}
+        return make_cache_key(f"{self.__class__.__module__}.{self.__class__.__qualname__}", arguments)
+
+    def _native_coroutine(self):
+        """The coroutine function async callers should await, if the tool has one."""
+        if self.afn is not None:
+            return self.afn
+        if inspect.iscoroutinefunction(self.fn):
+            return self.fn
+        return None
+
+    def _call_fn(self, **kwargs):
+        if inspect.iscoroutinefunction(self.fn):
+            # e.g. tools imported from ADK, whose only implementation is async
+            return anyio.run(functools.partial(self.fn, **kwargs))
+        return self.fn(**kwargs)
+
+    def invoke(self, **kwargs):
+        """
+        Call ``fn``, serving repeated calls from the result cache when the tool
+        is cacheable and a cache backend is configured.
+        """
+        cache = self._get_result_cache()
+        if cache is None:
+            return self._call_fn(**kwargs)
+
+        key = self._cache_key(kwargs)
+        cached = cache.get(key)
+        if cached is not ResultCache.MISSING:
+            self.logger.debug("Result cache hit for %s", self.__class__.__name__)
+            return cached
+
+        result = self._call_fn(**kwargs)
+        if self._should_cache(result):
+            cache.set(key, result, self.cache_ttl)
+        return result
+
+    async def ainvoke(self, **kwargs):
+        """Async counterpart of ``invoke``."""
+        return await self._ainvoke(kwargs)
+
+    async def _ainvoke(self, arguments, limiter=None):
+        coroutine_fn = self._native_coroutine()
+        if coroutine_fn is None:
+            # No native implementation: run the sync path in a worker thread,
+            # bounded by ``limiter`` (an ``anyio.CapacityLimiter``) if given.
+            return await anyio.to_thread.run_sync(
+                functools.partial(self.invoke, **arguments), limiter=limiter
+            )
+
+        cache = self._get_result_cache()
+        if cache is None:
+            return await coroutine_fn(**arguments)
+
+        key = self._cache_key(arguments)
+        cached = await self._acache_call(cache, cache.get, key)
+        if cached is not ResultCache.MISSING:
+            self.logger.debug("Result cache hit for %s", self.__class__.__name__)
+            return cached
+
+        result = await coroutine_fn(**arguments)
+        if self._should_cache(result):
+            await self._acache_call(cache, cache.set, key, result, self.cache_ttl)
+        return result
+
+    @staticmethod
+    async def _acache_call(cache, method, *args):
+        """Call a cache method without blocking the event loop on disk or network I/O."""
+        if isinstance(cache, MemoryCache):
+            return method(*args)
+        return await anyio.to_thread.run_sync(functools.partial(method, *args))
+
     def execute(self, context: WorkflowContext, **kwargs) -> ToolResult:
         try:
             start_time = time.time()
-            result = self.fn(**kwargs)
+            result = self.invoke(**kwargs)
+            duration = time.time() - start_time
+
+            context.log_execution(
+                tool_name=self.__class__.__name__,
+                duration=duration,
+                input_data=kwargs,
+                output_data=result,
+            )
+
+            return ToolResult(success=True, output=result)
+        except Exception as e:
+            return ToolResult(success=False, output=None, error=str(e), retryable=True)
+
+    async def aexecute(self, context: WorkflowContext, **kwargs) -> ToolResult:
+        """
+        Async counterpart of ``execute``. Awaits ``afn`` (or a coroutine
+        ``fn``) when the tool has one, otherwise runs ``fn`` in a worker thread.
+        """
+        try:
+            start_time = time.time()
+            result = await self.ainvoke(**kwargs)
             duration = time.time() - start_time
 
             context.log_execution(
@@ -126,5 +289,50 @@ class BaseTool(SmolAgentsMixin,
         except Exception as e:
             return ToolResult(success=False, output=None, error=str(e), retryable=True)
 
-    async def execute_async(self, arguments: dict):
-        return await anyio.to_thread.run_sync(self.fn, **arguments)
+    def _batch_workers(self, max_concurrency, size):
+        # Instances that keep per-call state on self can't serve calls concurrently.
+        workers = max_concurrency if self.thread_safe else 1
+        return max(1, min(workers, size))
+
+    def execute_batch(self, context: WorkflowContext, list_of_kwargs, max_concurrency=8) -> list:
+        """
+        Run the tool once per kwargs dict in ``list_of_kwargs``, up to
+        ``max_concurrency`` calls at a time (one at a time for tools that
+        aren't ``thread_safe``).
+
+        Returns one ``ToolResult`` per input, in input order; a failing call
+        only fails its own result. Tools whose upstream API has a bulk
+        endpoint can override this.
+        """
+        list_of_kwargs = list(list_of_kwargs)
+        workers = self._batch_workers(max_concurrency, len(list_of_kwargs))
+        if workers == 1:
+            return [self.execute(context, **kwargs) for kwargs in list_of_kwargs]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda kwargs: self.execute(context, **kwargs), list_of_kwargs))
+
+    async def aexecute_batch(self, context: WorkflowContext, list_of_kwargs, max_concurrency=8) -> list:
+        """Async counterpart of ``execute_batch``, built on ``aexecute``."""
+        list_of_kwargs = list(list_of_kwargs)
+        limiter = anyio.CapacityLimiter(self._batch_workers(max_concurrency, len(list_of_kwargs)))
+        results = [None] * len(list_of_kwargs)
+
+        async def run(index, kwargs):
+            async with limiter:
+                results[index] = await self.aexecute(context, **kwargs)
+
+        async with anyio.create_task_group() as task_group:
+            for index, kwargs in enumerate(list_of_kwargs):
+                task_group.start_soon(run, index, kwargs)
+        return results
+
+    async def execute_async(self, arguments: dict, limiter=None):
+        """
+        Await the tool with ``arguments`` and return its raw result.
+
+        Native coroutines (``afn``, or a coroutine ``fn`` such as on tools
+        imported from ADK) are awaited directly; synchronous tools run in a
+        worker thread, bounded by ``limiter`` (an ``anyio.CapacityLimiter``)
+        when one is given.
+        """
+        return await self._ainvoke(arguments, limiter=limiter)
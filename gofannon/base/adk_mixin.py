@@ -216,9 +216,9 @@ class AdkMixin:
                 f"ADK ToolContext features will not be available or may require a dummy context. "
                 f"Ensure this tool can operate correctly with args only."
             )
-            # This wrapper will become self.fn. If self.fn is async, Gofannon's
-            # execute_async can await it directly. Gofannon's sync execute
-            # would need to handle running this async fn (e.g., using anyio.run).
+            # This wrapper will become self.fn. BaseTool awaits a coroutine fn
+            # directly in aexecute/execute_async and runs it with anyio.run
+            # from the sync execute.
             async def adk_run_async_wrapper(**kwargs):
                 # This simplified call assumes the tool can function with a None ToolContext
                 # or that its core logic doesn't strictly depend on it.
@@ -253,7 +253,8 @@ class AdkMixin:
 
         gofannon_params_schema = gofannon_def.get("parameters", {"type": "object", "properties": {}})
 
-        original_gofannon_fn = self.fn # type: ignore
+        # Prefer the tool's native coroutine, when it has one.
+        original_gofannon_fn = getattr(self, "afn", None) or self.fn # type: ignore
         is_gofannon_fn_async = inspect.iscoroutinefunction(original_gofannon_fn)
 
         # Define a custom ADK Tool class
@@ -0,0 +1,299 @@
+"""
+Result caching for idempotent tools.
+
+A tool opts in by setting a ``cache_ttl`` (seconds) class attribute. Its
+results are then cached by ``BaseTool.invoke`` - which ``execute``,
+``execute_async`` and the orchestrators go through - once a backend has been
+configured, either globally with ``set_default_cache`` or per instance through
+the ``result_cache`` attribute. Calling ``fn`` directly always bypasses the
+cache.
+
+Backends:
+
+* ``MemoryCache``: in-process LRU
+* ``SQLiteCache``: on-disk, shared between processes on one machine
+* ``RedisCache``: any client exposing Redis' ``get``/``set(..., px=)``/``delete``/``scan_iter``
+"""
+import copy
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def make_cache_key(tool_name, arguments):
+    """Canonical hash of a tool name plus its (order-independent) arguments."""
+    canonical = json.dumps(
+        {"tool": tool_name, "arguments": arguments},
+        sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    sets: int = 0
+
+    def as_dict(self):
+        return asdict(self)
+
+
+class ResultCache:
+    """
+    Interface for result cache backends.
+
+    ``get`` returns the cached value or ``MISSING``; values must be JSON
+    serialisable for the persistent backends.
+    """
+    MISSING = _MISSING
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, field, n=1):
+        with self._stats_lock:
+            setattr(self.stats, field, getattr(self.stats, field) + n)
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value, ttl):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class MemoryCache(ResultCache):
+    """
+    Thread-safe in-memory LRU with per-entry expiry. Values are copied on
+    the way in and out, so, as with the JSON-backed caches, a caller that
+    modifies a result never changes what later hits receive.
+    """
+    def __init__(self, max_entries=1024):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self._count("hits")
+                    return copy.deepcopy(value)
+                del self._entries[key]
+                self._count("evictions")
+        self._count("misses")
+        return _MISSING
+
+    def set(self, key, value, ttl):
+        expires_at = time.time() + ttl if ttl else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._count("evictions")
+        self._count("sets")
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteCache(ResultCache):
+    """
+    On-disk LRU backed by SQLite; values are stored as JSON. Bounded by
+    ``max_entries`` and, optionally, by ``max_bytes`` of stored JSON. Each
+    row records its size, and the entry count and byte total are kept in a
+    one-row table updated in the same transaction, so a write never scans
+    the whole cache.
+    """
+    def __init__(self, path=None, max_entries=10000, max_bytes=None):
+        super().__init__()
+        self.path = Path(path).expanduser() if path else Path.home() / ".gofannon" / "cache" / "results.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL, size INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at)")
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(results)")]
+            if "size" not in columns:
+                # Caches written before sizes were recorded.
+                self._conn.execute("ALTER TABLE results ADD COLUMN size INTEGER NOT NULL DEFAULT 0")
+                self._conn.execute("UPDATE results SET size = LENGTH(CAST(value AS BLOB))")
+                self._conn.execute("DROP TABLE IF EXISTS results_totals")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results_totals ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL, bytes INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO results_totals (id, entries, bytes) "
+                "SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            )
+
+    def _delete_rows(self, rows):
+        """Delete ``(key, size)`` rows and take them off the totals."""
+        if not rows:
+            return
+        self._conn.executemany("DELETE FROM results WHERE key = ?", [(key,) for key, _ in rows])
+        self._conn.execute(
+            "UPDATE results_totals SET entries = entries - ?, bytes = bytes - ?",
+            (len(rows), sum(size for _, size in rows))
+        )
+
+    def get(self, key):
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at, size FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                value, expires_at, size = row
+                if expires_at is None or expires_at > now:
+                    self._conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+                    self._count("hits")
+                    return json.loads(value)
+                self._delete_rows([(key, size)])
+                self._count("evictions")
+        self._count("misses")
+        return _MISSING
+
+    def set(self, key, value, ttl):
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug("Not caching non JSON-serialisable result for %s", key)
+            return
+        size = len(payload.encode("utf-8"))
+        now = time.time()
+        with self._lock, self._conn:
+            old = self._conn.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, expires_at, accessed_at, size) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, now + ttl if ttl else None, now, size)
+            )
+            self._conn.execute(
+                "UPDATE results_totals SET entries = entries + ?, bytes = bytes + ?",
+                (0 if old else 1, size - (old[0] if old else 0))
+            )
+            count, total = self._conn.execute("SELECT entries, bytes FROM results_totals").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                rows = self._conn.execute(
+                    "SELECT key, size FROM results ORDER BY accessed_at ASC LIMIT ?", (overflow,)
+                ).fetchall()
+                self._delete_rows(rows)
+                self._count("evictions", len(rows))
+                total -= sum(size for _, size in rows)
+            if self.max_bytes is not None and total > self.max_bytes:
+                self._evict_bytes(total)
+        self._count("sets")
+
+    def _evict_bytes(self, total):
+        evicted = []
+        for key, size in self._conn.execute("SELECT key, size FROM results ORDER BY accessed_at ASC"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key, size))
+            total -= size
+        self._delete_rows(evicted)
+        self._count("evictions", len(evicted))
+
+    def delete(self, key):
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._delete_rows([(key, row[0])])
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+            self._conn.execute("UPDATE results_totals SET entries = 0, bytes = 0")
+
+    def close(self):
+        self._conn.close()
+
+
+class RedisCache(ResultCache):
+    """
+    Cache on a Redis-compatible server. Expiry and eviction are left to the
+    server, so ``stats.evictions`` stays at zero.
+    """
+    def __init__(self, client, prefix="gofannon:result:"):
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            self._count("misses")
+            return _MISSING
+        self._count("hits")
+        return json.loads(raw)
+
+    def set(self, key, value, ttl):
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug("Not caching non JSON-serialisable result for %s", key)
+            return
+        # Milliseconds, so sub-second TTLs don't round down to an invalid ex=0.
+        self.client.set(self.prefix + key, payload, px=max(1, int(ttl * 1000)) if ttl else None)
+        self._count("sets")
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+_default_cache = None
+
+
+def set_default_cache(cache):
+    """Use ``cache`` for every cacheable tool without its own ``result_cache``; None disables."""
+    global _default_cache
+    _default_cache = cache
+
+
+def get_default_cache():
+    return _default_cache
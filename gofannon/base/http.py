@@ -0,0 +1,322 @@
+"""
+Shared, pooled HTTP sessions for REST-backed tools.
+
+Tools should issue requests through ``get_session()`` (or
+``BaseTool.http_session``) instead of the module-level ``requests.get``/``post``
+helpers, which open a new connection (and TLS handshake) for every call. Each
+session keeps connections alive per host, retries 429/5xx responses with
+exponential backoff, applies a default timeout and paces requests through the
+shared per-service/host rate limiter (see ``gofannon.base.rate_limit``), which
+also takes care of ``Retry-After``.
+
+Async tools use ``get_async_client()`` (or ``BaseTool.async_http_client``),
+which applies the same pooling, retry and timeout policy on top of ``httpx``
+and hands back ``requests.Response`` objects, raising ``requests`` exceptions,
+so response handling can be shared between a tool's ``fn`` and ``afn``.
+
+Defaults can be changed with ``configure_http`` or through the environment:
+``GOFANNON_HTTP_TIMEOUT``, ``GOFANNON_HTTP_RETRIES``,
+``GOFANNON_HTTP_BACKOFF_FACTOR`` and ``GOFANNON_HTTP_POOL_MAXSIZE``.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+from .rate_limit import RateLimitError, get_rate_limiter
+
+try:
+    import httpx
+
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_http_config = {
+    'timeout': float(os.getenv('GOFANNON_HTTP_TIMEOUT', 30)),
+    'retries': int(os.getenv('GOFANNON_HTTP_RETRIES', 3)),
+    'backoff_factor': float(os.getenv('GOFANNON_HTTP_BACKOFF_FACTOR', 0.5)),
+    'pool_connections': 10,
+    'pool_maxsize': int(os.getenv('GOFANNON_HTTP_POOL_MAXSIZE', 10)),
+    'pool_block': True,
+}
+_sessions = {}
+# event loop -> {service: AsyncHttpClient}; httpx pools are bound to one loop
+_async_clients = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _should_retry(method, response, attempt, retries):
+    if attempt >= retries or method.upper() not in Retry.DEFAULT_ALLOWED_METHODS:
+        return False
+    if response.status_code in RETRY_STATUS_CODES:
+        return True
+    # GitHub reports (secondary) rate limits as 403s
+    return response.status_code == 403 and _rate_limited(response)
+
+
+def _rate_limited(response):
+    return 'Retry-After' in response.headers or response.headers.get('X-RateLimit-Remaining') == '0'
+
+
+def _retry_delay(response, attempt, backoff_factor):
+    # The rate limiter already holds callers back for as long as the server asked.
+    if _rate_limited(response):
+        return 0
+    return backoff_factor * (2 ** attempt)
+
+
+class HttpSession(requests.Session):
+    """
+    ``requests.Session`` that applies a default timeout, the rate limiter of
+    ``service`` and retries of 429/5xx (and rate-limited 403) responses.
+    """
+    def __init__(self, timeout=None, service=None, retries=0, backoff_factor=0):
+        super().__init__()
+        self.timeout = timeout
+        self.service = service
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        limiter = get_rate_limiter(self.service, url)
+        limiter.acquire()
+        attempt = 0
+        while True:
+            response = super().request(method, url, **kwargs)
+            limiter.observe(response.status_code, response.headers)
+            if not _should_retry(method, response, attempt, self.retries):
+                return response
+            time.sleep(_retry_delay(response, attempt, self.backoff_factor))
+            try:
+                limiter.acquire()
+            except RateLimitError:
+                # Hand the last response back so the tool's status handling applies.
+                return response
+            response.close()
+            attempt += 1
+
+
+def _build_session(service=None):
+    config = _http_config
+    # urllib3 only retries connection and read errors; status retries happen
+    # in HttpSession.request so every attempt goes through the rate limiter.
+    retry = Retry(
+        total=config['retries'],
+        connect=config['retries'],
+        read=config['retries'],
+        status=0,
+        backoff_factor=config['backoff_factor'],
+        raise_on_status=False,
+    )
+    # pool_maxsize caps connections per host; with pool_block the extra
+    # callers wait for a free connection instead of opening throwaway ones.
+    adapter = HTTPAdapter(
+        pool_connections=config['pool_connections'],
+        pool_maxsize=config['pool_maxsize'],
+        pool_block=config['pool_block'],
+        max_retries=retry,
+    )
+    session = HttpSession(
+        timeout=config['timeout'],
+        service=service,
+        retries=config['retries'],
+        backoff_factor=config['backoff_factor'],
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session(service=None):
+    """
+    Return the process-wide session for ``service`` (e.g. a tool's
+    ``API_SERVICE``), creating it on first use. Tools without a service share
+    the default session.
+    """
+    key = service or 'default'
+    session = _sessions.get(key)
+    if session is None:
+        with _lock:
+            session = _sessions.get(key)
+            if session is None:
+                logger.debug("Creating pooled HTTP session for %s", key)
+                session = _sessions[key] = _build_session(service)
+    return session
+
+
+class AsyncHttpClient:
+    """
+    Pooled ``httpx.AsyncClient`` with the retry and timeout policy of
+    ``HttpSession``, sharing its rate limiters. Responses are returned as
+    ``requests.Response`` and transport errors raised as the matching
+    ``requests.exceptions`` type.
+    """
+    def __init__(self, config, service=None):
+        if not _HAS_HTTPX:
+            raise RuntimeError(
+                "httpx is not installed or could not be imported. "
+                "Install it (pip install gofannon[async]) to use async HTTP tools."
+            )
+        self.service = service
+        self.retries = config['retries']
+        self.backoff_factor = config['backoff_factor']
+        limits = httpx.Limits(
+            max_connections=config['pool_connections'] * config['pool_maxsize'],
+            max_keepalive_connections=config['pool_maxsize'],
+        )
+        # No pool timeout: like pool_block, callers wait for a free connection.
+        timeout = httpx.Timeout(config['timeout'], pool=None)
+        self._client = httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True)
+
+    async def request(self, method, url, params=None, data=None, json=None, headers=None, timeout=None):
+        method = method.upper()
+        if isinstance(params, dict):
+            # requests drops None-valued parameters; httpx would send them empty
+            params = {key: value for key, value in params.items() if value is not None}
+        kwargs = {'params': params, 'json': json, 'headers': headers}
+        if isinstance(data, (bytes, str)):
+            kwargs['content'] = data
+        else:
+            kwargs['data'] = data
+        if timeout is not None:
+            kwargs['timeout'] = httpx.Timeout(timeout, pool=None)
+
+        limiter = get_rate_limiter(self.service, str(url))
+        await limiter.aacquire()
+        idempotent = method in Retry.DEFAULT_ALLOWED_METHODS
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except httpx.HTTPError as e:
+                # Failed connects never reached the server, so are always safe to retry.
+                retryable = isinstance(e, httpx.ConnectError) or (
+                    idempotent and isinstance(e, httpx.TransportError))
+                if not retryable or attempt >= self.retries:
+                    raise _to_requests_exception(e) from e
+                await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+            else:
+                result = _to_requests_response(response, method)
+                limiter.observe(result.status_code, result.headers)
+                if not _should_retry(method, result, attempt, self.retries):
+                    return result
+                await asyncio.sleep(_retry_delay(result, attempt, self.backoff_factor))
+                try:
+                    await limiter.aacquire()
+                except RateLimitError:
+                    return result
+            attempt += 1
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request('PUT', url, **kwargs)
+
+    async def patch(self, url, **kwargs):
+        return await self.request('PATCH', url, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request('DELETE', url, **kwargs)
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+def _to_requests_response(response, method):
+    result = requests.Response()
+    result.status_code = response.status_code
+    result.reason = response.reason_phrase
+    result._content = response.content
+    result.headers = CaseInsensitiveDict(response.headers)
+    result.encoding = get_encoding_from_headers(result.headers)
+    result.url = str(response.url)
+    result.elapsed = response.elapsed
+    result.request = requests.Request(method, result.url).prepare()
+    return result
+
+
+def _to_requests_exception(error):
+    exceptions = requests.exceptions
+    if isinstance(error, httpx.ConnectTimeout):
+        return exceptions.ConnectTimeout(str(error))
+    if isinstance(error, httpx.TimeoutException):
+        return exceptions.ReadTimeout(str(error))
+    if isinstance(error, httpx.NetworkError):
+        return exceptions.ConnectionError(str(error))
+    if isinstance(error, httpx.TooManyRedirects):
+        return exceptions.TooManyRedirects(str(error))
+    if isinstance(error, (httpx.InvalidURL, httpx.UnsupportedProtocol)):
+        return exceptions.InvalidURL(str(error))
+    return exceptions.RequestException(str(error))
+
+
+def get_async_client(service=None):
+    """
+    Return the pooled async client for ``service`` on the running event loop,
+    creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    key = service or 'default'
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            logger.debug("Creating pooled async HTTP client for %s", key)
+            client = clients[key] = AsyncHttpClient(_http_config, service)
+    return client
+
+
+async def aclose_clients():
+    """Close the async clients that belong to the running event loop."""
+    with _lock:
+        clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+def configure_http(**options):
+    """
+    Change the defaults used for sessions created from now on.
+
+    Accepts ``timeout``, ``retries``, ``backoff_factor``, ``pool_connections``,
+    ``pool_maxsize`` and ``pool_block``. Existing sessions are closed (and
+    async clients dropped) so the next ``get_session``/``get_async_client``
+    call picks up the new settings.
+    """
+    unknown = set(options) - set(_http_config)
+    if unknown:
+        raise ValueError(f"Unknown HTTP options: {sorted(unknown)}")
+    _http_config.update(options)
+    close_sessions()
+
+
+def close_sessions():
+    """
+    Close every pooled session and drop it from the cache. Async clients can
+    only be closed on their own loop (see ``aclose_clients``), so they are
+    just dropped.
+    """
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+        _async_clients.clear()
+    for session in sessions:
+        session.close()
@@ -0,0 +1,201 @@
+"""
+Shared outbound rate limiting, keyed by API service and host.
+
+Every request sent through ``gofannon.base.http`` (sync sessions and async
+clients) first takes a token from the ``RateLimiter`` for its
+``(API_SERVICE, host)`` pair, then reports the response back so the limiter
+can follow the server's own signals:
+
+* ``Retry-After`` on a 403/429/503 pauses every caller for that host
+* ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` (or the ``RateLimit-*``
+  draft headers) pause callers once the quota is spent, and spread the rest
+  of the quota over the window once it runs low
+
+Services without a configured rate are only paced by those headers. Rates are
+changed with ``configure_rate_limit``.
+"""
+import asyncio
+import email.utils
+import logging
+import math
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# requests per second, burst size
+DEFAULT_RATE_LIMITS = {
+    # Secondary limit: 900 points (GET requests) per minute per endpoint.
+    'github': (15.0, 15),
+    # Custom Search JSON API default quota: 100 queries per minute.
+    'google_search': (100 / 60, 10),
+    'simpler_grants': (5.0, 5),
+}
+# Once fewer than this share of the quota is left, spread the remainder
+# evenly over the time left until the window resets.
+LOW_QUOTA_FRACTION = 0.1
+# Pause after a 429 that carries no hint of how long to wait.
+DEFAULT_THROTTLE_PAUSE = 1.0
+
+_rate_config = {
+    'limits': dict(DEFAULT_RATE_LIMITS),
+    # Longest a caller will wait for a token before giving up.
+    'max_wait': 60.0,
+}
+_limiters = {}
+_lock = threading.Lock()
+
+
+class RateLimitError(requests.exceptions.RequestException):
+    """Raised when a request would have to wait longer than ``max_wait``."""
+
+
+class RateLimiter:
+    """
+    Token bucket for one service/host. Callers reserve a token and then sleep
+    outside the lock, so the same bucket serves threads and coroutines.
+    """
+    def __init__(self, name, rate=None, burst=1, max_wait=60.0):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        # Rate derived from the server's remaining quota, when it runs low.
+        self._quota_rate = None
+        self._lock = threading.Lock()
+
+    def _current_rate(self):
+        rates = [rate for rate in (self.rate, self._quota_rate) if rate]
+        return min(rates) if rates else None
+
+    def reserve(self):
+        """Take a token and return how many seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            rate = self._current_rate()
+            if rate is not None:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / rate)
+            self._updated = now
+            if wait > self.max_wait:
+                if rate is not None:
+                    self._tokens += 1
+                raise RateLimitError(f"Rate limit for {self.name} would need a {wait:.0f}s wait")
+            return wait
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait:
+            logger.debug("Rate limiting %s: waiting %.2fs", self.name, wait)
+            time.sleep(wait)
+
+    async def aacquire(self):
+        wait = self.reserve()
+        if wait:
+            logger.debug("Rate limiting %s: waiting %.2fs", self.name, wait)
+            await asyncio.sleep(wait)
+
+    def observe(self, status_code, headers):
+        """Adapt to the rate-limit headers of a response."""
+        headers = CaseInsensitiveDict(headers or {})
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        remaining = _to_int(headers.get('X-RateLimit-Remaining', headers.get('RateLimit-Remaining')))
+        reset_in = _reset_in(headers.get('X-RateLimit-Reset', headers.get('RateLimit-Reset')))
+        limit = _to_int(headers.get('X-RateLimit-Limit', headers.get('RateLimit-Limit')))
+
+        pause = None
+        if status_code in (403, 429, 503) and retry_after is not None:
+            pause = retry_after
+        elif remaining == 0 and reset_in is not None:
+            pause = reset_in
+        elif status_code == 429:
+            pause = DEFAULT_THROTTLE_PAUSE
+
+        with self._lock:
+            if pause:
+                logger.info("%s asked to back off for %.1fs", self.name, pause)
+                self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+            if remaining is not None and reset_in is not None:
+                low_water = max(limit * LOW_QUOTA_FRACTION, 1) if limit else 10
+                if 0 < remaining < low_water:
+                    self._quota_rate = remaining / max(reset_in, 1.0)
+                else:
+                    self._quota_rate = None
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            parsed = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, parsed.timestamp() - time.time())
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _reset_in(value):
+    # GitHub sends an epoch timestamp, the RateLimit-* draft a delta.
+    reset = _to_int(value)
+    if reset is None:
+        return None
+    if reset > 10 ** 9:
+        return max(0.0, reset - time.time())
+    return float(reset)
+
+
+def get_rate_limiter(service, url_or_host):
+    """Return the shared limiter for ``service`` (may be None) and a URL's host."""
+    host = urlsplit(url_or_host).hostname if '//' in url_or_host else url_or_host
+    key = (service or 'default', host)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        with _lock:
+            limiter = _limiters.get(key)
+            if limiter is None:
+                rate, burst = _rate_config['limits'].get(service, (None, 1))
+                limiter = _limiters[key] = RateLimiter(
+                    f"{key[0]}@{host}", rate=rate, burst=burst, max_wait=_rate_config['max_wait']
+                )
+    return limiter
+
+
+def configure_rate_limit(service=None, rate=None, burst=None, max_wait=None):
+    """
+    Set the rate (requests per second, None for header-driven only) and burst
+    size for ``service``, and/or the longest a caller may wait for a token.
+    Existing limiters are dropped so new calls use the new settings.
+    """
+    if service is not None:
+        if rate is None:
+            _rate_config['limits'].pop(service, None)
+        else:
+            _rate_config['limits'][service] = (rate, burst or max(1, math.ceil(rate)))
+    if max_wait is not None:
+        _rate_config['max_wait'] = max_wait
+    reset_rate_limiters()
+
+
+def reset_rate_limiters():
+    with _lock:
+        _limiters.clear()
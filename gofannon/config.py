@@ -1,4 +1,6 @@
 import os
+import copy
+import inspect
 from dotenv import load_dotenv
 import logging
 
@@ -26,16 +28,59 @@ class ToolConfig:
         return cls._instance.config.get(key)
 
 class FunctionRegistry:
+    """
+    Registry of the tool classes exposed to the orchestrator and MCP servers.
+
+    Registration records each tool's name and OpenAI-style definition once,
+    without running the tool's ``__init__`` (which would load config, set up
+    loggers and build API clients). ``get_tools`` serves a cached list that is
+    only rebuilt after a new registration. Callers get deep copies, so
+    editing a definition never changes the registry.
+    """
     _tools = {}
+    _definitions = {}
+    _definitions_list = None
 
     @classmethod
     def register(cls, tool_class):
-        cls._tools[tool_class().definition['function']['name']] = tool_class
+        definition = cls._describe(tool_class)
+        name = definition['function']['name']
+        cls._tools[name] = tool_class
+        cls._definitions[name] = definition
+        cls._definitions_list = None
         return tool_class
 
     @classmethod
     def get_tools(cls):
-        return [cls._tools[name]().definition for name in cls._tools]
+        if cls._definitions_list is None:
+            cls._definitions_list = [cls._definitions[name] for name in cls._tools]
+        return copy.deepcopy(cls._definitions_list)
+
+    @classmethod
+    def get_definition(cls, name):
+        return copy.deepcopy(cls._definitions[name])
+
+    @staticmethod
+    def _describe(tool_class):
+        """
+        Build a tool's definition from a bare instance that skips ``__init__``.
+
+        The ``name`` default of the constructor is applied so that definitions
+        reading ``self.name`` resolve as they would on a real instance. Tools
+        whose definition depends on other constructor state fall back to a
+        regular instantiation.
+        """
+        stub = tool_class.__new__(tool_class)
+        name_param = inspect.signature(tool_class.__init__).parameters.get('name')
+        if name_param is not None and name_param.default is not inspect.Parameter.empty:
+            stub.name = name_param.default
+        try:
+            return type(stub).definition.fget(stub)
+        except AttributeError:
+            logging.getLogger(__name__).debug(
+                "Instantiating %s to read its definition", tool_class.__name__
+            )
+            return tool_class().definition
 
 def setup_logging():
     """Configure logging for the gofannon package."""
@@ -5,6 +5,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/91.0.4472.124 Safari/537.36'
+    )
+}
+
 """Fetches the text content of a given URL.
 
 This tool makes a simple GET request and returns the raw text content.
@@ -42,29 +50,38 @@ class GetUrlContent(BaseTool):
     def fn(self, url: str):
         logger.debug(f"Attempting to fetch content from URL: {url}")
         try:
-            headers = {
-                'User-Agent': (
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                    'AppleWebKit/537.36 (KHTML, like Gecko) '
-                    'Chrome/91.0.4472.124 Safari/537.36'
-                )
-            }
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            logger.info(f"Successfully fetched content from URL: {url}")
-            return response.text
-        except requests.exceptions.HTTPError as e:
+            response = self.http_session.get(url, headers=HEADERS, timeout=15)
+            return self._content(url, response)
+        except Exception as e:
+            return self._error_message(url, e)
+
+    async def afn(self, url: str):
+        logger.debug(f"Attempting to fetch content from URL: {url}")
+        try:
+            response = await self.async_http_client.get(url, headers=HEADERS, timeout=15)
+            return self._content(url, response)
+        except Exception as e:
+            return self._error_message(url, e)
+
+    @staticmethod
+    def _content(url, response):
+        response.raise_for_status()
+        logger.info(f"Successfully fetched content from URL: {url}")
+        return response.text
+
+    @staticmethod
+    def _error_message(url, e):
+        if isinstance(e, requests.exceptions.HTTPError):
             logger.error(f"HTTP error fetching URL {url}: {e}")
             return f"Error: HTTP error - {e}"
-        except requests.exceptions.ConnectionError as e:
+        if isinstance(e, requests.exceptions.ConnectionError):
             logger.error(f"Connection error fetching URL {url}: {e}")
             return f"Error: Connection error - {e}"
-        except requests.exceptions.Timeout as e:
+        if isinstance(e, requests.exceptions.Timeout):
             logger.error(f"Timeout fetching URL {url}: {e}")
             return f"Error: Timeout - {e}"
-        except requests.exceptions.RequestException as e:
+        if isinstance(e, requests.exceptions.RequestException):
             logger.error(f"Request error fetching URL {url}: {e}")
             return f"Error: Request error - {e}"
-        except Exception as e:
-            logger.error(f"Unexpected error fetching URL {url}: {e}")
-            return f"Error: Unexpected error - {e}"
\ No newline at end of file
+        logger.error(f"Unexpected error fetching URL {url}: {e}")
+        return f"Error: Unexpected error - {e}"
@@ -1,4 +1,7 @@
 import git
+import hashlib
+import re
+import threading
 from pathlib import Path
 
 from..base import BaseTool
@@ -7,6 +10,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# One lock per mirror, so concurrent clones of a URL don't update it at once.
+_mirror_locks = {}
+_mirror_locks_guard = threading.Lock()
+
 @FunctionRegistry.register
 class CloneRepo(BaseTool):
     """
@@ -15,10 +22,20 @@ class CloneRepo(BaseTool):
     then clones the repository into that directory using GitPython.
     Returns a success message if the operation completes successfully,
     or an error message if it fails.
+
+    Clones can be shallow (``depth``), single-branch, blob-less (file
+    contents fetched on demand) and sparse (only ``sparse_paths`` checked
+    out). With ``mirror_dir`` set, every URL is first mirrored there as a
+    bare repository, updated with a fetch on later calls, and clones borrow
+    its objects through ``--reference`` so only new objects are downloaded.
     """
-    def __init__(self, name="clone_github_repo"):
+    def __init__(self, name="clone_github_repo", mirror_dir=None, dissociate=False):
         super().__init__()
         self.name = name
+        self.mirror_dir = Path(mirror_dir).expanduser() if mirror_dir else None
+        # Copy borrowed objects into each clone, so it survives the mirror
+        # being deleted (slower, and uses more disk).
+        self.dissociate = dissociate
 
     @property
     def definition(self):
@@ -37,6 +54,27 @@ class CloneRepo(BaseTool):
                         "local_dir": {
                             "type": "string",
                             "description": "The local directory where the repository should be cloned."
+                        },
+                        "branch": {
+                            "type": "string",
+                            "description": "Optional. The branch or tag to check out. Defaults to the remote's default branch."
+                        },
+                        "depth": {
+                            "type": "integer",
+                            "description": "Optional. Only fetch this many commits of history (a shallow clone)."
+                        },
+                        "single_branch": {
+                            "type": "boolean",
+                            "description": "Optional. Only fetch the history of one branch. Default false."
+                        },
+                        "blobless": {
+                            "type": "boolean",
+                            "description": "Optional. Partial clone that downloads file contents only when they are checked out. Default false."
+                        },
+                        "sparse_paths": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Optional. Only check out these directories."
                         }
                     },
                     "required": ["repo_url", "local_dir"]
@@ -44,7 +82,8 @@ class CloneRepo(BaseTool):
             }
         }
 
-    def fn(self, repo_url, local_dir):
+    def fn(self, repo_url, local_dir, branch=None, depth=None, single_branch=False,
+           blobless=False, sparse_paths=None):
         logger.debug(f"Cloning repository {repo_url} to {local_dir}")
 
         # Ensure the local directory exists
@@ -52,13 +91,51 @@ class CloneRepo(BaseTool):
         if not local_dir_path.exists():
             local_dir_path.mkdir(parents=True, exist_ok=True)
 
+        options = {}
+        if branch:
+            options['branch'] = branch
+        if depth:
+            options['depth'] = int(depth)
+        if single_branch:
+            options['single_branch'] = True
+        if blobless:
+            options['filter'] = 'blob:none'
+        if sparse_paths:
+            options['sparse'] = True
+
         try:
+            if self.mirror_dir is not None:
+                options['reference'] = str(self._update_mirror(repo_url))
+                if self.dissociate:
+                    options['dissociate'] = True
             # Clone the repository
-            repo = git.Repo.clone_from(repo_url, local_dir_path)
+            repo = git.Repo.clone_from(repo_url, local_dir_path, **options)
+            if sparse_paths:
+                repo.git.sparse_checkout('set', *sparse_paths)
             return f"Repository cloned successfully to {local_dir}"
         except git.exc.GitCommandError as e:
             logger.error(f"Error cloning repository: {e}")
             return f"Error cloning repository: {e}"
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
-            return f"Unexpected error: {e}"
\ No newline at end of file
+            return f"Unexpected error: {e}"
+
+    def _mirror_path(self, repo_url):
+        name = re.sub(r'[^A-Za-z0-9._-]+', '-', repo_url.rstrip('/').split('/')[-1])
+        digest = hashlib.sha256(repo_url.encode('utf-8')).hexdigest()[:16]
+        return self.mirror_dir / f"{digest}-{name}"
+
+    def _update_mirror(self, repo_url):
+        """Create or fetch the bare mirror of ``repo_url`` and return its path."""
+        mirror_path = self._mirror_path(repo_url)
+        with _mirror_locks_guard:
+            lock = _mirror_locks.setdefault(str(mirror_path), threading.Lock())
+        with lock:
+            if (mirror_path / 'HEAD').exists():
+                logger.debug(f"Updating mirror {mirror_path}")
+                git.Repo(mirror_path).git.fetch('--prune', 'origin')
+            else:
+                logger.debug(f"Creating mirror {mirror_path}")
+                self.mirror_dir.mkdir(parents=True, exist_ok=True)
+                git.Repo.clone_from(repo_url, mirror_path, mirror=True)
+        return mirror_path
@@ -1,6 +1,7 @@
 
-import requests
+import base64
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from..base import BaseTool
 from ..config import FunctionRegistry
@@ -10,13 +11,23 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class CommitFile(BaseTool):
+    """
+    Commits one file through the contents API, or many files at once (pass
+    ``files``) through the Git Data API: the blobs are uploaded concurrently,
+    then a single tree, a single commit and a single ref update make the
+    change atomic. If the branch moved in the meantime the ref update is
+    rejected and nothing is committed.
+    """
     def __init__(self,
                  api_key=None,
-                 name="commit_file",):
+                 name="commit_file",
+                 max_workers=8):
         super().__init__()
         self.api_key = api_key
         self.name = name
         self.API_SERVICE = 'github'
+        # Concurrent blob uploads in batch mode.
+        self.max_workers = max_workers
 
     @property
     def definition(self):
@@ -24,7 +35,7 @@ class CommitFile(BaseTool):
             "type": "function",
             "function": {
                 "name": self.name,
-                "description": "Commit a file to a GitHub repository on a specified branch. If the branch does not exist, it will be created from the base branch (default: main). If the file already exists, it will be updated.",
+                "description": "Commit a file, or several files in a single commit, to a GitHub repository on a specified branch. If the branch does not exist, it will be created from the base branch (default: main). If a file already exists, it will be updated.",
                 "parameters": {
                     "type": "object",
                     "properties": {
@@ -56,9 +67,21 @@ class CommitFile(BaseTool):
                             "type": "string",
                             "description": "The base branch to create the new branch from if it doesn't exist (default: 'main')",
                             "default": "main"
+                        },
+                        "files": {
+                            "type": "array",
+                            "description": "Instead of file_path and file_content: the files to commit together in one commit. A null content deletes the file.",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "path": {"type": "string"},
+                                    "content": {"type": ["string", "null"]}
+                                },
+                                "required": ["path", "content"]
+                            }
                         }
                     },
-                    "required": ["owner", "repo", "file_path", "file_content", "commit_message", "branch"],
+                    "required": ["owner", "repo", "commit_message", "branch"],
                     "additionalProperties": False
                 }
             }
@@ -67,23 +90,30 @@ class CommitFile(BaseTool):
     def fn(self, 
             owner: str,
             repo: str,
-            file_path: str,
-            file_content: str,
-            commit_message: str,
-            branch: str,
-            base_branch: str = "main") -> str:
+            file_path: str = None,
+            file_content: str = None,
+            commit_message: str = None,
+            branch: str = None,
+            base_branch: str = "main",
+            files=None) -> str:
+        if not commit_message or not branch:
+            raise ValueError("commit_message and branch are required")
+        if files is not None:
+            return self.commit_files(owner, repo, files, commit_message, branch, base_branch)
+        if file_path is None or file_content is None:
+            raise ValueError("Either file_path and file_content, or files, are required")
         logger.debug(f"Committing file {file_path} to {owner}/{repo} on branch {branch}")
         api_url = f"https://api.github.com/repos/{owner}/{repo}"
         headers = {"Authorization": f"token {self.api_key}"}
     
         # --- Step 1: Ensure the branch exists ---
         branch_url = f"{api_url}/git/ref/heads/{branch}"
-        branch_resp = requests.get(branch_url, headers=headers)
+        branch_resp = self.http_session.get(branch_url, headers=headers)
     
         if branch_resp.status_code == 404:
             # Branch doesn't exist -> create it
             base_branch_url = f"{api_url}/git/ref/heads/{base_branch}"
-            base_resp = requests.get(base_branch_url, headers=headers)
+            base_resp = self.http_session.get(base_branch_url, headers=headers)
             if base_resp.status_code != 200:
                 raise Exception(f"Base branch '{base_branch}' not found: {base_resp.text}")
             
@@ -93,7 +123,7 @@ class CommitFile(BaseTool):
                 "ref": f"refs/heads/{branch}",
                 "sha": base_sha
             }
-            create_resp = requests.post(f"{api_url}/git/refs", headers=headers, json=create_branch_payload)
+            create_resp = self.http_session.post(f"{api_url}/git/refs", headers=headers, json=create_branch_payload)
             if create_resp.status_code != 201:
                 raise Exception(f"Error creating branch '{branch}': {create_resp.text}")
             print(f"Branch '{branch}' created from '{base_branch}'.")
@@ -102,7 +132,7 @@ class CommitFile(BaseTool):
     
         # --- Step 2: Check if the file exists on that branch ---
         file_url = f"{api_url}/contents/{file_path}"
-        response = requests.get(file_url, headers=headers, params={"ref": branch})
+        response = self.http_session.get(file_url, headers=headers, params={"ref": branch})
     
         if response.status_code == 200:
             sha = response.json()["sha"]
@@ -121,10 +151,131 @@ class CommitFile(BaseTool):
             payload["sha"] = sha
     
         # --- Step 4: Commit the file ---
-        put_response = requests.put(file_url, headers=headers, json=payload)
+        put_response = self.http_session.put(file_url, headers=headers, json=payload)
         
         if put_response.status_code in [200, 201]:
             print("File committed successfully!")
             return put_response.json()
         else:
             raise Exception(f"Error committing file: {put_response.status_code} {put_response.text}")
+
+    def commit_files(self, owner, repo, files, commit_message, branch, base_branch="main"):
+        """
+        Commit many files in one commit. ``files`` is a dict of path to
+        content, or a list of ``(path, content)`` pairs or ``{"path",
+        "content"}`` dicts; content may be ``str``, ``bytes``, or None to
+        delete the file. A dict may also give the file's ``mode`` (e.g.
+        ``"100755"``); otherwise a file that already exists keeps its mode
+        and a new one gets ``"100644"``. Returns the new commit.
+
+        Requests: two reads (ref and parent commit), one read of the base
+        tree unless every file gives its mode, one blob upload per file (run
+        concurrently), then one tree, one commit and one ref write.
+        """
+        logger.debug(f"Committing {len(files)} files to {owner}/{repo} on branch {branch}")
+        api_url = f"https://api.github.com/repos/{owner}/{repo}"
+        headers = {"Authorization": f"token {self.api_key}"}
+        if isinstance(files, dict):
+            files = list(files.items())
+        files = [(item["path"], item["content"], item.get("mode")) if isinstance(item, dict) else (*item, None)
+                 for item in files]
+        if not files:
+            raise ValueError("No files to commit")
+
+        # --- Step 1: Find the parent commit; a new branch starts at its base ---
+        branch_resp = self.http_session.get(f"{api_url}/git/ref/heads/{branch}", headers=headers)
+        create_branch = branch_resp.status_code == 404
+        if create_branch:
+            branch_resp = self.http_session.get(f"{api_url}/git/ref/heads/{base_branch}", headers=headers)
+            if branch_resp.status_code != 200:
+                raise Exception(f"Base branch '{base_branch}' not found: {branch_resp.text}")
+        elif branch_resp.status_code != 200:
+            raise Exception(f"Error checking branch: {branch_resp.status_code} {branch_resp.text}")
+        parent_sha = branch_resp.json()["object"]["sha"]
+
+        parent_resp = self.http_session.get(f"{api_url}/git/commits/{parent_sha}", headers=headers)
+        if parent_resp.status_code != 200:
+            raise Exception(f"Error reading commit {parent_sha}: {parent_resp.status_code} {parent_resp.text}")
+        base_tree = parent_resp.json()["tree"]["sha"]
+        unknown = [path for path, _, mode in files if mode is None]
+        modes = self._existing_modes(api_url, headers, base_tree, unknown) if unknown else {}
+
+        # --- Step 2: Upload the blobs concurrently ---
+        def create_blob(content):
+            if isinstance(content, str):
+                content = content.encode()
+            payload = {"content": base64.b64encode(content).decode(), "encoding": "base64"}
+            blob_resp = self.http_session.post(f"{api_url}/git/blobs", headers=headers, json=payload)
+            if blob_resp.status_code != 201:
+                raise Exception(f"Error creating blob: {blob_resp.status_code} {blob_resp.text}")
+            return blob_resp.json()["sha"]
+
+        uploads = [content for _, content, _ in files if content is not None]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(uploads)))) as pool:
+            blob_shas = iter(list(pool.map(create_blob, uploads)))
+        # A null sha removes the path from the base tree.
+        tree = [{"path": path, "mode": mode or modes.get(path, "100644"), "type": "blob",
+                 "sha": next(blob_shas) if content is not None else None}
+                for path, content, mode in files]
+
+        # --- Step 3: One tree, one commit ---
+        tree_resp = self.http_session.post(f"{api_url}/git/trees", headers=headers,
+                                           json={"base_tree": base_tree, "tree": tree})
+        if tree_resp.status_code != 201:
+            raise Exception(f"Error creating tree: {tree_resp.status_code} {tree_resp.text}")
+        commit_resp = self.http_session.post(f"{api_url}/git/commits", headers=headers, json={
+            "message": commit_message,
+            "tree": tree_resp.json()["sha"],
+            "parents": [parent_sha],
+        })
+        if commit_resp.status_code != 201:
+            raise Exception(f"Error creating commit: {commit_resp.status_code} {commit_resp.text}")
+        commit = commit_resp.json()
+
+        # --- Step 4: Point the branch at the commit (fast-forward only) ---
+        if create_branch:
+            ref_resp = self.http_session.post(f"{api_url}/git/refs", headers=headers,
+                                              json={"ref": f"refs/heads/{branch}", "sha": commit["sha"]})
+            expected = 201
+        else:
+            ref_resp = self.http_session.patch(f"{api_url}/git/refs/heads/{branch}", headers=headers,
+                                               json={"sha": commit["sha"], "force": False})
+            expected = 200
+        if ref_resp.status_code != expected:
+            raise Exception(f"Error updating branch '{branch}': {ref_resp.status_code} {ref_resp.text}")
+        logger.debug(f"Committed {len(files)} files as {commit['sha']}")
+        return commit
+
+    def _existing_modes(self, api_url, headers, base_tree, paths):
+        """Map each of ``paths`` present in ``base_tree`` to its file mode."""
+        def get_tree(sha, recursive=False):
+            tree_resp = self.http_session.get(f"{api_url}/git/trees/{sha}", headers=headers,
+                                              params={"recursive": "1"} if recursive else None)
+            if tree_resp.status_code != 200:
+                raise Exception(f"Error reading tree {sha}: {tree_resp.status_code} {tree_resp.text}")
+            return tree_resp.json()
+
+        listing = get_tree(base_tree, recursive=True)
+        if not listing.get("truncated"):
+            wanted = set(paths)
+            return {entry["path"]: entry["mode"] for entry in listing["tree"] if entry["path"] in wanted}
+
+        # Too large to list in one go: walk down to each path's directory instead.
+        trees = {}
+        modes = {}
+        for path in paths:
+            sha = base_tree
+            parts = path.split("/")
+            for depth, part in enumerate(parts, 1):
+                if sha not in trees:
+                    trees[sha] = {entry["path"]: entry for entry in get_tree(sha)["tree"]}
+                entry = trees[sha].get(part)
+                if entry is None:
+                    break
+                if depth == len(parts):
+                    modes[path] = entry["mode"]
+                elif entry["type"] == "tree":
+                    sha = entry["sha"]
+                else:
+                    break
+        return modes
@@ -0,0 +1,146 @@
+"""
+Content-addressed cache for GitHub reads.
+
+Content at a commit, tree or blob SHA never changes, so it can be cached
+without expiry. Only the mapping from a branch or tag to its commit SHA
+changes; it is kept in memory for ``ref_ttl`` seconds and then resolved
+again with one small request. Refs that already are commit SHAs need no
+request at all, so repeated reads of a pinned ref cost no network calls.
+
+``ReadFile``, ``GetRepoContents`` and ``ListRepoFiles`` use the cache passed
+as their ``content_cache`` or, failing that, the one set with
+``set_default_content_cache``. The two tree listers fetch through
+``fetch_tree``/``afetch_tree``, with or without a cache.
+"""
+import logging
+import re
+from pathlib import Path
+
+from ..base.cache import MemoryCache, ResultCache, SQLiteCache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+_SHA_RE = re.compile(r'[0-9a-f]{40}')
+
+
+class ContentCache:
+    """
+    Immutable GitHub content in a size-bounded on-disk LRU (by default a
+    ``SQLiteCache``), plus a short-lived in-memory map of refs to SHAs.
+    """
+    def __init__(self, path=None, max_entries=100000, max_bytes=512 * 1024 * 1024, ref_ttl=60, store=None):
+        if store is None:
+            path = path or Path.home() / ".gofannon" / "cache" / "github-content.sqlite"
+            store = SQLiteCache(path, max_entries=max_entries, max_bytes=max_bytes)
+        self.store = store
+        self.ref_ttl = ref_ttl
+        self._refs = MemoryCache(max_entries=1024)
+
+    @staticmethod
+    def is_sha(ref):
+        return bool(ref) and _SHA_RE.fullmatch(ref) is not None
+
+    def _ref_request(self, owner, repo, ref, headers):
+        url = f"https://api.github.com/repos/{owner}/{repo}/commits/{ref or 'HEAD'}"
+        # This media type returns just the SHA, not the whole commit.
+        return url, dict(headers, Accept='application/vnd.github.sha')
+
+    def _cached_ref(self, owner, repo, ref):
+        if self.is_sha(ref):
+            return make_cache_key("github-ref", [owner, repo, ref]), ref
+        key = make_cache_key("github-ref", [owner, repo, ref or "HEAD"])
+        sha = self._refs.get(key)
+        return key, None if sha is ResultCache.MISSING else sha
+
+    def resolve_ref(self, session, owner, repo, ref, headers):
+        """Return the commit SHA of ``ref`` (None for the default branch)."""
+        key, sha = self._cached_ref(owner, repo, ref)
+        if sha is None:
+            url, headers = self._ref_request(owner, repo, ref, headers)
+            response = session.get(url, headers=headers)
+            response.raise_for_status()
+            sha = response.text.strip()
+            self._refs.set(key, sha, self.ref_ttl)
+            logger.debug(f"Resolved {owner}/{repo}@{ref or 'HEAD'} to {sha}")
+        return sha
+
+    async def aresolve_ref(self, client, owner, repo, ref, headers):
+        """Async counterpart of ``resolve_ref``."""
+        key, sha = self._cached_ref(owner, repo, ref)
+        if sha is None:
+            url, headers = self._ref_request(owner, repo, ref, headers)
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            sha = response.text.strip()
+            self._refs.set(key, sha, self.ref_ttl)
+        return sha
+
+    def get(self, kind, *parts):
+        """The cached ``kind`` ("file", "tree", "blob") for ``parts``, or None."""
+        value = self.store.get(make_cache_key(f"github-{kind}", parts))
+        return None if value is ResultCache.MISSING else value
+
+    def set(self, kind, *parts, value):
+        self.store.set(make_cache_key(f"github-{kind}", parts), value, None)
+
+    def clear(self):
+        self.store.clear()
+        self._refs.clear()
+
+
+_default_content_cache = None
+
+
+def set_default_content_cache(cache):
+    """Use ``cache`` for GitHub read tools without their own ``content_cache``; None disables."""
+    global _default_content_cache
+    _default_content_cache = cache
+
+
+def get_default_content_cache():
+    return _default_content_cache
+
+
+def content_cache_or_default(cache):
+    """``cache`` if given, else the default content cache (which may be None)."""
+    return cache if cache is not None else get_default_content_cache()
+
+
+def _tree_request(owner, repo, tree_ish, recursive):
+    # The trees API accepts a branch, tag or SHA; HEAD is the default branch.
+    url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{tree_ish or 'HEAD'}"
+    return url, {"recursive": "1"} if recursive else None
+
+
+def _keep_tree(response, cache, owner, repo, tree_ish, recursive):
+    response.raise_for_status()
+    tree_data = response.json()
+    # A truncated listing is incomplete, so it isn't kept.
+    if cache is not None and not tree_data.get('truncated'):
+        cache.set("tree", owner, repo, tree_ish, recursive, value=tree_data)
+    return tree_data
+
+
+def fetch_tree(session, owner, repo, tree_ish, headers, recursive=True, cache=None):
+    """
+    The git tree listing at ``tree_ish``. With a ``cache``, ``tree_ish``
+    should be a SHA; the listing is then served from and kept in the cache.
+    """
+    if cache is not None:
+        tree_data = cache.get("tree", owner, repo, tree_ish, recursive)
+        if tree_data is not None:
+            return tree_data
+    url, params = _tree_request(owner, repo, tree_ish, recursive)
+    response = session.get(url, headers=headers, params=params)
+    return _keep_tree(response, cache, owner, repo, tree_ish, recursive)
+
+
+async def afetch_tree(client, owner, repo, tree_ish, headers, recursive=True, cache=None):
+    """Async counterpart of ``fetch_tree``."""
+    if cache is not None:
+        tree_data = cache.get("tree", owner, repo, tree_ish, recursive)
+        if tree_data is not None:
+            return tree_data
+    url, params = _tree_request(owner, repo, tree_ish, recursive)
+    response = await client.get(url, headers=headers, params=params)
+    return _keep_tree(response, cache, owner, repo, tree_ish, recursive)
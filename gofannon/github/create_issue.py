@@ -1,4 +1,3 @@
-from requests import post
 from json import dumps
 from..base import BaseTool
 from ..config import FunctionRegistry
@@ -69,7 +68,7 @@ class CreateIssue(BaseTool):
         if labels:
             payload["labels"] = labels.split(',')
 
-        response = post(api_url, headers=headers, json=payload)
+        response = self.http_session.post(api_url, headers=headers, json=payload)
         response.raise_for_status()
 
         return dumps(response.json())
\ No newline at end of file
@@ -0,0 +1,141 @@
+import logging
+import tarfile
+
+from ..base import BaseTool
+from ..config import FunctionRegistry
+from .get_repo_contents import DEFAULT_EOI
+
+logger = logging.getLogger(__name__)
+
+
+@FunctionRegistry.register
+class GetRepoArchive(BaseTool):
+    """
+    Reads a whole repository from its tarball: one request for the archive
+    of a ref, decompressed as it streams in, with files filtered by directory
+    and extension on the fly. Nothing is written to disk and only one file
+    is held in memory at a time.
+
+    The tarball is used rather than the zipball because a zip archive's
+    index is at its end, so it can't be read before the download finishes.
+    """
+    def __init__(self,
+                 api_key=None,
+                 name="get_repo_archive",
+                 max_files=None,
+                 max_bytes=None,
+                 max_file_bytes=1024 * 1024):
+        super().__init__()
+        self.api_key = api_key
+        self.name = name
+        self.API_SERVICE = 'github'
+        # Default budgets for a call; None means unlimited.
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        # Larger files are skipped; this bounds memory use per file.
+        self.max_file_bytes = max_file_bytes
+        self.eoi = dict(DEFAULT_EOI)
+
+    @property
+    def definition(self):
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": "Download a repository archive from GitHub in one request and return the contents of its source files.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "repo_url": {
+                            "type": "string",
+                            "description": "The URL of the repository, e.g. https://github.com/The-AI-Alliance/gofannon"
+                        },
+                        "directory_path": {
+                            "type": "string",
+                            "description": "Path from repository root of the directory of interest. Default '/'"
+                        },
+                        "branch": {
+                            "type": "string",
+                            "description": "Optional. The branch, tag, or commit SHA to download. Defaults to the repository's default branch."
+                        },
+                        "max_files": {
+                            "type": "integer",
+                            "description": "Optional. The maximum number of files to return."
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Optional. The maximum total size, in bytes, of the files to return."
+                        }
+                    },
+                    "required": ["repo_url"]
+                }
+            }
+        }
+
+    def fn(self, repo_url, directory_path="/", eoi=None, branch=None, max_files=None, max_bytes=None) -> str:
+        logger.debug(f"Downloading archive of repo {repo_url}")
+        budget = {'exceeded': False}
+        result = [f"{path}\n```{language}\n{content}\n```"
+                  for path, language, content in self._iter_archive(
+                      repo_url, directory_path, eoi, branch, max_files, max_bytes, budget)]
+        if budget['exceeded']:
+            result.append("[More files omitted: max_files/max_bytes budget reached]")
+        return "\n\n".join(result)
+
+    def iter_files(self, repo_url, directory_path="/", eoi=None, branch=None, max_files=None, max_bytes=None):
+        """
+        Streaming mode: yield ``(path, language, content)`` for each matching
+        file in archive order, as the download progresses.
+        """
+        yield from self._iter_archive(repo_url, directory_path, eoi, branch, max_files, max_bytes, {})
+
+    def _iter_archive(self, repo_url, directory_path, eoi, branch, max_files, max_bytes, budget):
+        repo_parts = repo_url.rstrip('/').split('/')
+        owner, repo = repo_parts[-2], repo_parts[-1]
+        api_url = f"https://api.github.com/repos/{owner}/{repo}/tarball"
+        if branch:
+            api_url += f"/{branch}"
+        headers = {
+            'Authorization': f'token {self.api_key}',
+            'Accept': 'application/vnd.github.v3+json'
+        }
+
+        if eoi is None:
+            eoi = self.eoi
+        max_files = max_files if max_files is not None else self.max_files
+        max_bytes = max_bytes if max_bytes is not None else self.max_bytes
+        prefix = directory_path.strip('/')
+        prefix = prefix + '/' if prefix else ''
+
+        files, total_bytes = 0, 0
+        # GitHub redirects to codeload.github.com; requests follows it.
+        with self.http_session.get(api_url, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # "r|gz" reads the archive sequentially, without seeking.
+            with tarfile.open(fileobj=response.raw, mode="r|gz") as archive:
+                for member in archive:
+                    if not member.isfile():
+                        continue
+                    # Strip the "<owner>-<repo>-<sha>/" top-level directory.
+                    path = member.name.split('/', 1)[-1]
+                    if not path.startswith(prefix):
+                        continue
+                    extension = path.rsplit('/', 1)[-1].split('.')[-1]
+                    if extension not in eoi:
+                        continue
+                    if self.max_file_bytes is not None and member.size > self.max_file_bytes:
+                        logger.debug(f"Skipping {path}: {member.size} bytes is over max_file_bytes")
+                        continue
+                    if max_bytes is not None and total_bytes + member.size > max_bytes:
+                        budget['exceeded'] = True
+                        continue
+                    if max_files is not None and files >= max_files:
+                        # Nothing more can be returned, so stop downloading.
+                        budget['exceeded'] = True
+                        break
+
+                    content = archive.extractfile(member).read()
+                    files += 1
+                    total_bytes += member.size
+                    yield path, eoi[extension], content.decode('utf-8', errors='replace')
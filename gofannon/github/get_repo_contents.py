@@ -1,31 +1,53 @@
-import requests
 from ..base import BaseTool
 from ..config import FunctionRegistry
+from .content_cache import afetch_tree, content_cache_or_default, fetch_tree
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Extensions of interest: files with other extensions are skipped.
+DEFAULT_EOI = {'js' : 'javascript',
+               'jsx' : 'javascript',
+               'ts' : 'typescript',
+               'tsx' : 'typescript',
+               'py' : 'python',
+               'html' : 'html',
+               'css' : 'css',
+               'scss' : 'scss',
+               'sass' : 'sass',
+               'md' : 'markdown',
+               'json' : 'json'}
+
 @FunctionRegistry.register
 class GetRepoContents(BaseTool):
+    """
+    Reads the source files of a repository: one recursive tree listing, then
+    the matching blobs downloaded concurrently.
 
+    With a ``content_cache`` (see ``gofannon.github.content_cache``) the
+    branch is resolved to a commit SHA, and the tree and every blob are
+    cached by SHA, so files unchanged between commits are never downloaded
+    twice.
+    """
     def __init__(self,
                  api_key=None,
-                 name="get_repo_contents",):
+                 name="get_repo_contents",
+                 max_files=None,
+                 max_bytes=None,
+                 max_workers=8,
+                 content_cache=None):
         super().__init__()
         self.api_key = api_key
         self.name = name
         self.API_SERVICE = 'github'
-        self.eoi = {'js' : 'javascript',
-                    'jsx' : 'javascript',
-                    'ts' : 'typescript',
-                    'tsx' : 'typescript',
-                    'py' : 'python',
-                    'html' : 'html',
-                    'css' : 'css',
-                    'scss' : 'scss',
-                    'sass' : 'sass',
-                    'md' : 'markdown',
-                    'json' : 'json'}
+        # Default budgets for a call; None means unlimited.
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.eoi = dict(DEFAULT_EOI)
+        self.content_cache = content_cache
 
     @property
     def definition(self):
@@ -46,6 +68,18 @@ class GetRepoContents(BaseTool):
                             "type": "string",
                             "description": "Path from repository root of the directory of interest. Default '/'"
                         },
+                        "branch": {
+                            "type": "string",
+                            "description": "Optional. The branch, tag, or commit SHA to read. Defaults to the repository's default branch."
+                        },
+                        "max_files": {
+                            "type": "integer",
+                            "description": "Optional. The maximum number of files to return."
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Optional. The maximum total size, in bytes, of the files to return."
+                        },
                         # "eoi": {
                         #     "type": "dictionary",
                         #     "description": "Extensions of interest. If not set, defaults to self.eoi (which contains common Python, Javascript, HTML, and Markdown extension). Example: `{'.js': 'javascript'}`",
@@ -58,41 +92,177 @@ class GetRepoContents(BaseTool):
 
     def fn(self, repo_url,
            directory_path = "/",
-           eoi = None)-> str:
+           eoi = None,
+           branch = None,
+           max_files = None,
+           max_bytes = None)-> str:
         logger.debug(f"Getting contents of repo {repo_url}")
-        if eoi is None:
-            eoi = self.eoi
+        owner, repo = self._parse_repo_url(repo_url)
+        tree_data = self._get_tree(owner, repo, branch)
+        selected, omitted = self._select_files(tree_data, directory_path, eoi, max_files, max_bytes)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            contents = list(pool.map(lambda entry: self._fetch_blob(owner, repo, entry[0]), selected))
+        return self._format(selected, contents, omitted)
+
+    async def afn(self, repo_url,
+                  directory_path = "/",
+                  eoi = None,
+                  branch = None,
+                  max_files = None,
+                  max_bytes = None)-> str:
+        logger.debug(f"Getting contents of repo {repo_url}")
+        owner, repo = self._parse_repo_url(repo_url)
+        tree_data = await self._aget_tree(owner, repo, branch)
+        selected, omitted = self._select_files(tree_data, directory_path, eoi, max_files, max_bytes)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(entry):
+            async with semaphore:
+                return await self._afetch_blob(owner, repo, entry[0])
+
+        contents = await asyncio.gather(*(fetch(entry) for entry in selected))
+        return self._format(selected, contents, omitted)
+
+    def iter_files(self, repo_url, directory_path="/", eoi=None, branch=None, max_files=None, max_bytes=None):
+        """
+        Streaming mode: yield ``(path, language, content)`` for each matching
+        file as soon as it has been downloaded, rather than one joined string.
+        """
+        owner, repo = self._parse_repo_url(repo_url)
+        tree_data = self._get_tree(owner, repo, branch)
+        selected, _ = self._select_files(tree_data, directory_path, eoi, max_files, max_bytes)
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {pool.submit(self._fetch_blob, owner, repo, item): (item, language)
+                       for item, language in selected}
+            for future in as_completed(futures):
+                item, language = futures[future]
+                yield item['path'], language, future.result()
+        finally:
+            # Stop pending downloads if the consumer stops early.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def aiter_files(self, repo_url, directory_path="/", eoi=None, branch=None, max_files=None, max_bytes=None):
+        """Async counterpart of ``iter_files``."""
+        owner, repo = self._parse_repo_url(repo_url)
+        tree_data = await self._aget_tree(owner, repo, branch)
+        selected, _ = self._select_files(tree_data, directory_path, eoi, max_files, max_bytes)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(item, language):
+            async with semaphore:
+                return item['path'], language, await self._afetch_blob(owner, repo, item)
+
+        tasks = [asyncio.ensure_future(fetch(item, language)) for item, language in selected]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _parse_repo_url(repo_url):
         # Extracting the owner and repo name from the URL
         repo_parts = repo_url.rstrip('/').split('/')
-        owner = repo_parts[-2]
-        repo = repo_parts[-1]
+        return repo_parts[-2], repo_parts[-1]
 
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{directory_path}"
-        headers = {
-            'Authorization': f'token {self.api_key}'
+    def _headers(self, accept='application/vnd.github.v3+json'):
+        return {
+            'Authorization': f'token {self.api_key}',
+            'Accept': accept
         }
 
-        response = requests.get(api_url, headers=headers)
+    def _content_cache(self):
+        return content_cache_or_default(self.content_cache)
+
+    def _get_tree(self, owner, repo, branch):
+        cache = self._content_cache()
+        if cache is not None:
+            branch = cache.resolve_ref(self.http_session, owner, repo, branch, self._headers())
+        return fetch_tree(self.http_session, owner, repo, branch, self._headers(), cache=cache)
+
+    async def _aget_tree(self, owner, repo, branch):
+        cache = self._content_cache()
+        if cache is not None:
+            branch = await cache.aresolve_ref(self.async_http_client, owner, repo, branch, self._headers())
+        return await afetch_tree(self.async_http_client, owner, repo, branch, self._headers(), cache=cache)
+
+    def _select_files(self, tree_data, directory_path, eoi, max_files, max_bytes):
+        """
+        Pick the blobs to download from the tree listing, by directory and
+        extension, within the file and byte budgets. Returns the selected
+        ``(tree item, language)`` pairs and the number left out by the budgets.
+        """
+        if tree_data.get('truncated'):
+            logger.warning("Tree listing was truncated by GitHub; some files will be missing.")
+
+        if eoi is None:
+            eoi = self.eoi
+        max_files = max_files if max_files is not None else self.max_files
+        max_bytes = max_bytes if max_bytes is not None else self.max_bytes
+        prefix = directory_path.strip('/')
+        prefix = prefix + '/' if prefix else ''
+
+        selected, omitted, total_bytes = [], 0, 0
+        for item in tree_data['tree']:
+            if item['type'] != 'blob' or not item['path'].startswith(prefix):
+                continue
+            extension = item['path'].rsplit('/', 1)[-1].split('.')[-1]
+            if extension not in eoi:
+                continue
+            size = item.get('size', 0)
+            if (max_files is not None and len(selected) >= max_files) or \
+                    (max_bytes is not None and total_bytes + size > max_bytes):
+                omitted += 1
+                continue
+            total_bytes += size
+            selected.append((item, eoi[extension]))
+
+        if omitted:
+            logger.info(f"Skipped {omitted} files over the max_files/max_bytes budget")
+        return selected, omitted
+
+    def _blob_request(self, owner, repo, item):
+        url = f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{item['sha']}"
+        return url, self._headers(accept='application/vnd.github.raw+json')
+
+    def _fetch_blob(self, owner, repo, item):
+        cache = self._content_cache()
+        if cache is not None:
+            content = cache.get("blob", item['sha'])
+            if content is not None:
+                return content
+        url, headers = self._blob_request(owner, repo, item)
+        response = self.http_session.get(url, headers=headers)
+        return self._read_blob(response, cache, item)
+
+    async def _afetch_blob(self, owner, repo, item):
+        cache = self._content_cache()
+        if cache is not None:
+            content = cache.get("blob", item['sha'])
+            if content is not None:
+                return content
+        url, headers = self._blob_request(owner, repo, item)
+        response = await self.async_http_client.get(url, headers=headers)
+        return self._read_blob(response, cache, item)
+
+    @staticmethod
+    def _read_blob(response, cache, item):
         response.raise_for_status()
+        content = response.content.decode('utf-8', errors='replace')
+        if cache is not None:
+            cache.set("blob", item['sha'], value=content)
+        return content
 
-        contents = response.json()
-
-        result = []
-
-        for item in contents:
-            if item['type'] == 'file':
-                file_response = requests.get(item['download_url'], headers=headers)
-                extension = item['name'].split('.')[-1]
-                if extension in eoi:
-                    language = eoi[extension]
-                else:
-                    continue
-                file_response.raise_for_status()
-                file_content = file_response.text
-                result.append(f"{item['path']}\n```{language}\n{file_content}\n```")
-            elif item['type'] == 'dir':
-                # Recursively go through subdirectories
-                subdirectory_contents = self.fn(repo_url, item['path'], eoi)
-                result.append(subdirectory_contents)
-
-        return "\n\n".join(result)
\ No newline at end of file
+    @staticmethod
+    def _format(selected, contents, omitted):
+        result = [f"{item['path']}\n```{language}\n{content}\n```"
+                  for (item, language), content in zip(selected, contents)]
+        if omitted:
+            result.append(f"[{omitted} more files omitted: max_files/max_bytes budget reached]")
+        return "\n\n".join(result)
@@ -0,0 +1,204 @@
+"""
+Batch reads through GitHub's GraphQL API.
+
+One GraphQL query can read many objects by aliasing a field once per object
+(``i0: issue(number: 1) ... i1: issue(number: 7) ...``), where the REST API
+needs one or more requests per object. ``GraphQLBatchReader`` builds those
+queries, splits large requests into chunks of ``chunk_size`` aliases and
+unpacks the results. ``ReadIssue.read_issues`` and ``ReadFile.read_files`` use it.
+"""
+import logging
+import re
+
+from ..base.http import get_session
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+ISSUE_FIELDS = """
+fragment IssueFields on Issue {
+  number title body state createdAt updatedAt url
+  author { login }
+  labels(first: 50) { nodes { name } }
+  comments(first: %d) {
+    totalCount
+    nodes { author { login } body createdAt url }
+  }
+}
+"""
+
+PR_FILES_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      headRefOid
+      files(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { path additions deletions changeType }
+      }
+    }
+  }
+}
+"""
+
+
+class GraphQLError(Exception):
+    """The query as a whole failed (no data was returned)."""
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class GraphQLBatchReader:
+    """
+    Reads many issues, file blobs or pull request files with a few GraphQL
+    queries. Objects that can't be read (missing issue, binary file, ...)
+    come back as None rather than failing the whole batch.
+    """
+    def __init__(self, api_key, chunk_size=50):
+        self.api_key = api_key
+        self.chunk_size = chunk_size
+
+    def _headers(self, accept='application/vnd.github.v3+json'):
+        return {
+            'Authorization': f'token {self.api_key}',
+            'Accept': accept
+        }
+
+    def execute(self, query, variables=None):
+        """Run one query and return ``(data, errors)``; partial errors are logged."""
+        response = get_session('github').post(
+            GRAPHQL_URL, headers=self._headers(), json={"query": query, "variables": variables or {}}
+        )
+        response.raise_for_status()
+        payload = response.json()
+        errors = payload.get('errors') or []
+        if payload.get('data') is None:
+            raise GraphQLError("; ".join(error.get('message', str(error)) for error in errors))
+        for error in errors:
+            logger.debug(f"GraphQL error at {error.get('path')}: {error.get('message')}")
+        return payload['data'], errors
+
+    def get_issues(self, owner, repo, numbers, comments=100):
+        """
+        Read issues with their first ``comments`` comments.
+
+        Returns ``{number: {"issue": {...}, "comments": [...]}}``; numbers
+        that aren't issues (e.g. pull requests) map to None.
+        """
+        results = {}
+        for chunk in _chunks([int(number) for number in numbers], self.chunk_size):
+            fields = "\n".join(f"i{index}: issue(number: {number}) {{ ...IssueFields }}"
+                               for index, number in enumerate(chunk))
+            query = ("query($owner: String!, $name: String!) {\n"
+                     f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n}}\n"
+                     + ISSUE_FIELDS % comments)
+            data, _ = self.execute(query, {"owner": owner, "name": repo})
+            repository = data.get('repository') or {}
+            for index, number in enumerate(chunk):
+                results[number] = self._format_issue(repository.get(f"i{index}"))
+        return results
+
+    @staticmethod
+    def _format_issue(node):
+        if node is None:
+            return None
+        comments = node.pop('comments')
+        if comments['totalCount'] > len(comments['nodes']):
+            logger.info(f"Issue {node['number']}: returning {len(comments['nodes'])} of {comments['totalCount']} comments")
+        node['author'] = (node.get('author') or {}).get('login')
+        node['labels'] = [label['name'] for label in node['labels']['nodes']]
+        return {
+            "issue": node,
+            "comments": [dict(comment, author=(comment.get('author') or {}).get('login'))
+                         for comment in comments['nodes']],
+        }
+
+    def get_files(self, owner, repo, paths, ref="HEAD"):
+        """
+        Read the text of files at ``ref`` (a branch, tag or commit SHA).
+
+        Returns ``{path: text}``; missing, binary and truncated (very large)
+        blobs map to None.
+        """
+        results = {}
+        for chunk in _chunks(list(paths), self.chunk_size):
+            declarations = "".join(f", $e{index}: String!" for index in range(len(chunk)))
+            fields = "\n".join(f"f{index}: object(expression: $e{index}) {{ ... on Blob {{ text isBinary isTruncated }} }}"
+                               for index in range(len(chunk)))
+            query = (f"query($owner: String!, $name: String!{declarations}) {{\n"
+                     f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n}}")
+            variables = {"owner": owner, "name": repo}
+            variables.update({f"e{index}": f"{ref}:{path}" for index, path in enumerate(chunk)})
+            data, _ = self.execute(query, variables)
+            repository = data.get('repository') or {}
+            for index, path in enumerate(chunk):
+                blob = repository.get(f"f{index}")
+                if blob is None or blob.get('isBinary') or blob.get('isTruncated'):
+                    results[path] = None
+                else:
+                    results[path] = blob.get('text')
+        return results
+
+    def get_pull_request_files(self, owner, repo, number, with_content=True):
+        """
+        Read the files changed by a pull request, each with its unified diff
+        ``patch`` and (unless ``with_content`` is False) its text at the head
+        commit.
+
+        GraphQL has no diffs, so they come from one REST request for the
+        whole pull request diff. Total cost: one query per 100 files, one
+        diff request and one query per ``chunk_size`` files of content.
+        """
+        files, cursor, head_sha = [], None, None
+        while True:
+            data, _ = self.execute(PR_FILES_QUERY, {"owner": owner, "name": repo, "number": int(number), "cursor": cursor})
+            pull_request = (data.get('repository') or {}).get('pullRequest')
+            if pull_request is None:
+                raise GraphQLError(f"Pull request {owner}/{repo}#{number} not found")
+            head_sha = pull_request['headRefOid']
+            page = pull_request['files']
+            files.extend(page['nodes'])
+            if not page['pageInfo']['hasNextPage']:
+                break
+            cursor = page['pageInfo']['endCursor']
+
+        diff_response = get_session('github').get(
+            f"https://api.github.com/repos/{owner}/{repo}/pulls/{number}",
+            headers=self._headers(accept='application/vnd.github.v3.diff'),
+        )
+        diff_response.raise_for_status()
+        patches = split_diff(diff_response.text)
+
+        contents = {}
+        if with_content:
+            live_paths = [file['path'] for file in files if file['changeType'] != 'DELETED']
+            contents = self.get_files(owner, repo, live_paths, ref=head_sha)
+
+        return [
+            {
+                "path": file['path'],
+                "change_type": file['changeType'].lower(),
+                "additions": file['additions'],
+                "deletions": file['deletions'],
+                "patch": patches.get(file['path']),
+                "content": contents.get(file['path']),
+                "sha": head_sha,
+            }
+            for file in files
+        ]
+
+
+def split_diff(diff):
+    """Split a unified diff into ``{path: hunks}``, like the REST API's ``patch`` field."""
+    patches = {}
+    for block in re.split(r'^(?=diff --git )', diff, flags=re.MULTILINE):
+        header = re.match(r'diff --git a/(.*?) b/(.*)', block)
+        if not header:
+            continue
+        hunks = block.find('\n@@')
+        patches[header.group(2)] = block[hunks + 1:].rstrip('\n') if hunks != -1 else ''
+    return patches
@@ -1,19 +1,25 @@
 from..base import BaseTool
-from requests import get
+from ..base.cache import MemoryCache, ResultCache, make_cache_key
 import json
 from ..config import FunctionRegistry
 import logging
 
 logger = logging.getLogger(__name__)
 
+PER_PAGE = 100
+# ETag and formatted page per request URL. Shared by all instances; pass a
+# SQLiteCache as etag_cache to keep it across processes.
+_etag_cache = MemoryCache(max_entries=512)
+
 
 @FunctionRegistry.register
 class ListIssues(BaseTool):
-    def __init__(self, api_key=None, name="list_issues"):
+    def __init__(self, api_key=None, name="list_issues", etag_cache=None):
         super().__init__()
         self.api_key = api_key
         self.name = name
         self.API_SERVICE = 'github'
+        self.etag_cache = etag_cache if etag_cache is not None else _etag_cache
 
     @property
     def definition(self):
@@ -54,6 +60,10 @@ class ListIssues(BaseTool):
                         "since": {
                             "type": "string",
                             "description": "Only show issues updated after this date (ISO 8601 format)"
+                        },
+                        "max_pages": {
+                            "type": "integer",
+                            "description": "Optional. Stop after this many pages of 100 issues. Default: all pages"
                         }
                     },
                     "required": ["repo_url"]
@@ -61,8 +71,72 @@ class ListIssues(BaseTool):
             }
         }
 
-    def fn(self, repo_url, state="open", labels=None, sort="created", direction="desc", since=None):
+    def fn(self, repo_url, state="open", labels=None, sort="created", direction="desc", since=None, max_pages=None):
+        logger.debug(f"Listing issues for repo {repo_url} with state={state}")
+        return [issue
+                for page in self.iter_pages(repo_url, state, labels, sort, direction, since, max_pages)
+                for issue in page]
+
+    async def afn(self, repo_url, state="open", labels=None, sort="created", direction="desc", since=None, max_pages=None):
         logger.debug(f"Listing issues for repo {repo_url} with state={state}")
+        return [issue
+                async for page in self.aiter_pages(repo_url, state, labels, sort, direction, since, max_pages)
+                for issue in page]
+
+    def iter_pages(self, repo_url, state="open", labels=None, sort="created", direction="desc", since=None, max_pages=None):
+        """
+        Yield the formatted issues one page at a time, following the ``Link``
+        header's ``next`` URL. Pages unchanged since the last call are served
+        from the ETag cache by a conditional request.
+        """
+        api_url, headers, params = self._issues_request(repo_url, state, labels, sort, direction, since)
+        pages = 0
+        while api_url and (max_pages is None or pages < max_pages):
+            key, request_headers, cached = self._conditional_request(api_url, headers, params)
+            response = self.http_session.get(api_url, headers=request_headers, params=params)
+            issues, api_url = self._read_page(response, key, cached)
+            # The next URL already carries the query parameters.
+            params = None
+            pages += 1
+            yield issues
+
+    async def aiter_pages(self, repo_url, state="open", labels=None, sort="created", direction="desc", since=None, max_pages=None):
+        """Async counterpart of ``iter_pages``."""
+        api_url, headers, params = self._issues_request(repo_url, state, labels, sort, direction, since)
+        pages = 0
+        while api_url and (max_pages is None or pages < max_pages):
+            key, request_headers, cached = self._conditional_request(api_url, headers, params)
+            response = await self.async_http_client.get(api_url, headers=request_headers, params=params)
+            issues, api_url = self._read_page(response, key, cached)
+            params = None
+            pages += 1
+            yield issues
+
+    def _conditional_request(self, api_url, headers, params):
+        # The token is part of the key: different tokens may see different issues.
+        key = make_cache_key("github.list_issues", {"url": api_url, "params": params, "token": self.api_key})
+        cached = self.etag_cache.get(key) if self.etag_cache is not None else ResultCache.MISSING
+        if cached is ResultCache.MISSING:
+            return key, headers, None
+        return key, dict(headers, **{'If-None-Match': cached['etag']}), cached
+
+    def _read_page(self, response, key, cached):
+        """Return the page's formatted issues and the URL of the next page."""
+        if cached is not None and response.status_code == 304:
+            # Not modified: GitHub doesn't count this against the rate limit.
+            logger.debug("Issues page unchanged, using cached copy")
+            return cached['issues'], cached['next']
+
+        response.raise_for_status()
+        issues = self._format_issues(response.json())
+        next_url = response.links.get('next', {}).get('url')
+
+        etag = response.headers.get('ETag')
+        if etag and self.etag_cache is not None:
+            self.etag_cache.set(key, {"etag": etag, "issues": issues, "next": next_url}, None)
+        return issues, next_url
+
+    def _issues_request(self, repo_url, state, labels, sort, direction, since):
         # Extracting the owner and repo name from the URL
         repo_parts = repo_url.rstrip('/').split('/')
         owner = repo_parts[-2]
@@ -76,19 +150,18 @@ class ListIssues(BaseTool):
         params = {
             'state': state,
             'sort': sort,
-            'direction': direction
+            'direction': direction,
+            'per_page': PER_PAGE
         }
 
         if labels:
             params['labels'] = labels
         if since:
             params['since'] = since
+        return api_url, headers, params
 
-        response = get(api_url, headers=headers, params=params)
-        response.raise_for_status()
-
-        issues = response.json()
-
+    @staticmethod
+    def _format_issues(issues):
         # Format the response
         formatted_issues = []
         for issue in issues:
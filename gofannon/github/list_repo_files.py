@@ -1,7 +1,9 @@
-import requests
+import fnmatch
 import json
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from ..base import BaseTool
 from ..config import FunctionRegistry
+from .content_cache import content_cache_or_default, fetch_tree
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,12 +14,24 @@ class ListRepoFiles(BaseTool):
     Recursively list all files in a GitHub repository.
     This tool fetches the file tree for a given branch and returns a list
     of all file paths.
+
+    GitHub truncates recursive tree responses past 100,000 entries (or 7 MB).
+    When that happens the tree is walked instead: the root is listed, then
+    each subtree is fetched recursively, concurrently, and any subtree that
+    is itself truncated is split again. Prefix and glob filters are applied
+    while walking, and subtrees outside the prefix are never fetched.
+
+    With a ``content_cache`` (see ``gofannon.github.content_cache``) the
+    branch is resolved to a commit SHA with one request, or none while the
+    resolution is fresh, and tree listings are cached by SHA.
     """
-    def __init__(self, api_key=None, name="list_repo_files"):
+    def __init__(self, api_key=None, name="list_repo_files", max_workers=8, content_cache=None):
         super().__init__()
         self.api_key = api_key
         self.name = name
         self.API_SERVICE = 'github'
+        self.max_workers = max_workers
+        self.content_cache = content_cache
 
     @property
     def definition(self):
@@ -36,6 +50,26 @@ class ListRepoFiles(BaseTool):
                         "branch": {
                             "type": "string",
                             "description": "Optional. The branch to list files from. Defaults to the repository's default branch."
+                        },
+                        "prefix": {
+                            "type": "string",
+                            "description": "Optional. Only list files under this directory, e.g. 'src/'."
+                        },
+                        "pattern": {
+                            "type": "string",
+                            "description": "Optional. Only list files whose path matches this glob, e.g. '*.py' or 'docs/*.md'."
+                        },
+                        "compact": {
+                            "type": "boolean",
+                            "description": "Optional. Return JSON without indentation. Default false."
+                        },
+                        "page": {
+                            "type": "integer",
+                            "description": "Optional. Return only this page (starting at 1) of page_size paths, with the total count."
+                        },
+                        "page_size": {
+                            "type": "integer",
+                            "description": "Optional. Paths per page when page is set. Default 1000."
                         }
                     },
                     "required": ["repo_url"]
@@ -43,7 +77,7 @@ class ListRepoFiles(BaseTool):
             }
         }
 
-    def fn(self, repo_url, branch=None):
+    def fn(self, repo_url, branch=None, prefix=None, pattern=None, compact=False, page=None, page_size=1000):
         logger.debug(f"Listing files for repo {repo_url}")
         repo_parts = repo_url.rstrip('/').split('/')
         owner = repo_parts[-2]
@@ -54,30 +88,85 @@ class ListRepoFiles(BaseTool):
             'Accept': 'application/vnd.github.v3+json'
         }
 
+        cache = content_cache_or_default(self.content_cache)
+        if cache is not None:
+            # Steps 1 and 2 in one (cached) request; the trees API takes a commit SHA.
+            tree_sha = cache.resolve_ref(self.http_session, owner, repo_name, branch, headers)
         # 1. Get the default branch if one isn't specified
-        if not branch:
+        elif not branch:
             repo_api_url = f"https://api.github.com/repos/{owner}/{repo_name}"
-            repo_response = requests.get(repo_api_url, headers=headers)
+            repo_response = self.http_session.get(repo_api_url, headers=headers)
             repo_response.raise_for_status()
             branch = repo_response.json()['default_branch']
             logger.debug(f"No branch specified, using default branch: {branch}")
 
         # 2. Get the latest commit SHA for the branch
-        branch_api_url = f"https://api.github.com/repos/{owner}/{repo_name}/branches/{branch}"
-        branch_response = requests.get(branch_api_url, headers=headers)
-        branch_response.raise_for_status()
-        tree_sha = branch_response.json()['commit']['commit']['tree']['sha']
-
-        # 3. Get the file tree recursively
-        tree_api_url = f"https://api.github.com/repos/{owner}/{repo_name}/git/trees/{tree_sha}?recursive=1"
-        tree_response = requests.get(tree_api_url, headers=headers)
-        tree_response.raise_for_status()
-        tree_data = tree_response.json()
+        if cache is None:
+            branch_api_url = f"https://api.github.com/repos/{owner}/{repo_name}/branches/{branch}"
+            branch_response = self.http_session.get(branch_api_url, headers=headers)
+            branch_response.raise_for_status()
+            tree_sha = branch_response.json()['commit']['commit']['tree']['sha']
 
+        # 3. Get the file tree recursively, walking it if the response is truncated
+        repo = (owner, repo_name)
+        prefix = prefix.strip('/') + '/' if prefix and prefix.strip('/') else ''
+        tree_data = self._get_tree(repo, headers, cache, tree_sha, recursive=True)
         if tree_data.get('truncated'):
-            logger.warning(f"File list for {repo_url} on branch {branch} is truncated because it exceeds the maximum number of items.")
-        
-        # 4. Filter for files (blobs) and return their paths
-        file_paths = [item['path'] for item in tree_data['tree'] if item['type'] == 'blob']
-        
-        return json.dumps(file_paths, indent=2)
\ No newline at end of file
+            logger.info(f"File list for {repo_url} on branch {branch} is truncated; walking subtrees instead.")
+            file_paths = self._walk_tree(repo, headers, cache, tree_sha, prefix, pattern)
+        else:
+            # 4. Filter for files (blobs) and return their paths
+            file_paths = [item['path'] for item in tree_data['tree']
+                          if item['type'] == 'blob' and self._wanted(item['path'], prefix, pattern)]
+
+        layout = {"separators": (",", ":")} if compact else {"indent": 2}
+        if page is not None:
+            start = (int(page) - 1) * page_size
+            return json.dumps({
+                "paths": file_paths[start:start + page_size],
+                "page": int(page),
+                "total": len(file_paths),
+                "next_page": int(page) + 1 if start + page_size < len(file_paths) else None,
+            }, **layout)
+        return json.dumps(file_paths, **layout)
+
+    @staticmethod
+    def _wanted(path, prefix, pattern):
+        return path.startswith(prefix) and (not pattern or fnmatch.fnmatchcase(path, pattern))
+
+    @staticmethod
+    def _overlaps(directory, prefix):
+        """Whether files under ``directory`` (with a trailing slash) can match ``prefix``."""
+        return directory.startswith(prefix) or prefix.startswith(directory)
+
+    def _get_tree(self, repo, headers, cache, sha, recursive):
+        return fetch_tree(self.http_session, *repo, sha, headers, recursive=recursive, cache=cache)
+
+    def _walk_tree(self, repo, headers, cache, root_sha, prefix, pattern):
+        """
+        List a tree too large for one recursive response. Each directory is
+        first tried recursively; a truncated answer is replaced by its
+        non-recursive listing, whose subtrees are queued in turn.
+        """
+        file_paths = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # future -> (directory path with trailing slash, sha, recursive)
+            pending = {pool.submit(self._get_tree, repo, headers, cache, root_sha, False): ('', root_sha, False)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory, sha, recursive = pending.pop(future)
+                    tree_data = future.result()
+                    if recursive and tree_data.get('truncated'):
+                        pending[pool.submit(self._get_tree, repo, headers, cache, sha, False)] = (directory, sha, False)
+                        continue
+                    for item in tree_data['tree']:
+                        path = directory + item['path']
+                        if item['type'] == 'blob':
+                            if self._wanted(path, prefix, pattern):
+                                file_paths.append(path)
+                        elif item['type'] == 'tree' and not recursive and self._overlaps(path + '/', prefix):
+                            pending[pool.submit(self._get_tree, repo, headers, cache, item['sha'], True)] = \
+                                (path + '/', item['sha'], True)
+        # Subtrees finish in any order; sort for a stable result.
+        return sorted(file_paths)
@@ -1,11 +1,14 @@
 import os
 import json
+import time
 import logging
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from github import Github
 from openai import OpenAI
 from gofannon.config import FunctionRegistry
-from gofannon.base import BaseTool
+from gofannon.base import BaseTool, WorkflowContext
+from gofannon.base.cache import ResultCache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -24,16 +27,87 @@ def load_review_checks():
     checks = [cls for name, cls in module.__dict__.items() if name.endswith("Check") and isinstance(cls, type)]
     return checks
 
+class ReviewLedger:
+    """
+    Remembers what each check said about each file, keyed by
+    ``(repo, pr, path, blob SHA, check name)``, so a follow-up review only
+    sends new or modified blobs to the checks. Whole-PR checks are keyed by
+    the head commit SHA instead of a blob SHA.
+
+    Entries live either in a ``ResultCache`` (e.g. a ``SQLiteCache`` on
+    local disk) or in a ``WorkflowContext``'s ``data``, where they are
+    persisted by ``save_checkpoint``.
+    """
+    CONTEXT_KEY = "pr_review_ledger"
+
+    def __init__(self, store):
+        if isinstance(store, WorkflowContext):
+            self._entries = store.data.setdefault(self.CONTEXT_KEY, {})
+            self._cache = None
+        elif isinstance(store, ResultCache):
+            self._entries = None
+            self._cache = store
+        else:
+            raise TypeError("A review ledger needs a ResultCache or a WorkflowContext")
+
+    @staticmethod
+    def key(repo_name, pr_number, path, sha, check_name):
+        return make_cache_key("pr_review", [repo_name, int(pr_number), path, sha, check_name])
+
+    def get(self, key):
+        """Return ``(comments, analyzed)`` recorded under ``key``, or None."""
+        if self._cache is not None:
+            entry = self._cache.get(key)
+            entry = None if entry is ResultCache.MISSING else entry
+        else:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return [dict(comment) for comment in entry["comments"]], entry["analyzed"]
+
+    def set(self, key, comments, analyzed):
+        entry = {"comments": [dict(comment) for comment in comments], "analyzed": analyzed}
+        if self._cache is not None:
+            self._cache.set(key, entry, None)
+        else:
+            self._entries[key] = entry
+
+
 @FunctionRegistry.register
 class PRReviewTool(BaseTool):
-    def __init__(self, name="pr_review_tool"):
+    """
+    Runs the configured checks over a pull request. The changed files are
+    listed once, then each check runs its per-file and whole-PR calls on its
+    own thread pool of ``max_workers``, so the checks run side by side and a
+    slow check never holds up another one. Comments are reported in check
+    order and, within a check, in the order GitHub lists the files, exactly
+    as a serial run would.
+
+    ``check_timeout`` is the number of seconds each check gets to finish all
+    its work, measured from dispatch; either one number or a dict keyed by
+    check class name. Since a check only queues behind its own calls, the
+    time is all its own. A check that runs out of time is reported as such
+    in the summary, and its worker threads are left to finish in the
+    background.
+
+    With a ``ledger`` (a ``ResultCache`` or a ``WorkflowContext``, see
+    ``ReviewLedger``), comments for files whose blob hasn't changed since
+    an earlier review are reused instead of running the checks again.
+    """
+    def __init__(self, name="pr_review_tool", max_workers=8, check_timeout=None, ledger=None):
         super().__init__()
         self.name = name
+        self.ledger = ReviewLedger(ledger) if ledger is not None else None
+        self.max_workers = max_workers
+        self.check_timeout = check_timeout
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.base_url = os.getenv("OPENAI_BASE_URL")
         self.model_name = os.getenv("OPENAI_MODEL_NAME")
         self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
 
+    def close(self):
+        self.client.close()
+
     @property
     def definition(self):
         return {
@@ -59,39 +133,101 @@ class PRReviewTool(BaseTool):
             }
         }
 
+    def _timeout_for(self, check_name):
+        if isinstance(self.check_timeout, dict):
+            return self.check_timeout.get(check_name)
+        return self.check_timeout
+
+    @staticmethod
+    def _timed(call, *args):
+        start_time = time.time()
+        comments, analyzed = call(*args)
+        return comments, analyzed, time.time() - start_time
+
     def fn(self, pr_number, repo_name):
         # Connect to GitHub and get pull request details.
         g = Github(os.getenv("GITHUB_TOKEN"))
         repo = g.get_repo(repo_name)
         pr = repo.get_pull(pr_number)
+        # List the changed files once, for every check.
+        files = list(pr.get_files())
         all_comments = []
         check_results = {}
+        check_stats = {}
 
         # Load review check classes dynamically.
         check_classes = load_review_checks()
         checks = [check_class(self.client, self.model_name) for check_class in check_classes]
 
-        for check in checks:
-            check_name = check.__class__.__name__
-            check_results[check_name] = []
-            if hasattr(check, 'process_pr_file'):
-                for file in pr.get_files():
-                    file_comments, analyzed = check.process_pr_file(file, repo, pr)
-                    if analyzed:
-                        for comment in file_comments:
-                            comment['check_name'] = check_name
-                            all_comments.append(comment)
-                            check_results[check_name].append(comment)
-            if hasattr(check, 'process_pr'):
-                pr_comments, _ = check.process_pr(pr)
-                for comment in pr_comments:
-                    comment['check_name'] = check_name
-                    all_comments.append(comment)
-                    check_results[check_name].append(comment)
+        executors = []
+        try:
+            dispatched = []
+            for check in checks:
+                check_name = check.__class__.__name__
+                executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                executors.append(executor)
+                calls = []
+                if hasattr(check, 'process_pr_file'):
+                    # Removed files have no blob SHA, so they are never reused.
+                    calls.extend((check.process_pr_file, (file, repo, pr), file.filename, file.sha, True)
+                                 for file in files)
+                if hasattr(check, 'process_pr'):
+                    calls.append((check.process_pr, (pr,), "GENERAL", pr.head.sha, False))
+                tasks = []
+                for call, args, path, sha, per_file in calls:
+                    key = None
+                    if self.ledger is not None and sha:
+                        key = ReviewLedger.key(repo_name, pr_number, path, sha, check_name)
+                        recorded = self.ledger.get(key)
+                        if recorded is not None:
+                            tasks.append((key, per_file, recorded))
+                            continue
+                    tasks.append((key, per_file, executor.submit(self._timed, call, *args)))
+                dispatched.append((check_name, time.time(), tasks))
+
+            for check_name, submitted_at, tasks in dispatched:
+                timeout = self._timeout_for(check_name)
+                check_results[check_name] = []
+                stats = check_stats[check_name] = {"calls": 0, "seconds": 0.0, "timed_out": 0, "reused": 0}
+                for key, per_file, task in tasks:
+                    if isinstance(task, tuple):
+                        comments, analyzed = task
+                        stats["reused"] += 1
+                    else:
+                        remaining = None if timeout is None else max(0, submitted_at + timeout - time.time())
+                        try:
+                            comments, analyzed, duration = task.result(timeout=remaining)
+                        except FuturesTimeoutError:
+                            task.cancel()
+                            stats["timed_out"] += 1
+                            continue
+                        stats["calls"] += 1
+                        stats["seconds"] += duration
+                        if key is not None:
+                            self.ledger.set(key, comments, analyzed)
+                    # Only per-file calls can decline a file; whole-PR comments are always kept.
+                    if per_file and not analyzed:
+                        continue
+                    for comment in comments:
+                        comment['check_name'] = check_name
+                        all_comments.append(comment)
+                        check_results[check_name].append(comment)
+                if stats["timed_out"]:
+                    logger.warning(f"{check_name}: {stats['timed_out']} call(s) timed out after {timeout}s")
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         summary = "## 🤖 Automated PR Review Summary 🤖\n\n"
         for check_name, comments in check_results.items():
             summary += f"### 🤖 {check_name} 🤖\n\n"
+            stats = check_stats[check_name]
+            timing = f"_{stats['calls']} call(s), {stats['seconds']:.1f}s"
+            if stats["reused"]:
+                timing += f", {stats['reused']} result(s) reused from the last review"
+            if stats["timed_out"]:
+                timing += f", {stats['timed_out']} timed out after {self._timeout_for(check_name)}s"
+            summary += timing + "_\n\n"
             for comment in comments:
                 body = comment.get("body", "")
                 file_path = comment.get("path", "")
@@ -101,4 +237,4 @@ class PRReviewTool(BaseTool):
         if not all_comments:
             summary += "\nNo issues found. Code looks good!"
 
-        return summary
\ No newline at end of file
+        return summary
@@ -1,7 +1,10 @@
-import requests
 import base64
+import functools
+import anyio
 from ..base import BaseTool
 from ..config import FunctionRegistry
+from .content_cache import content_cache_or_default
+from .graphql import GraphQLBatchReader
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,12 +15,18 @@ class ReadFile(BaseTool):
     Reads the content of a specific file from a GitHub repository.
     This tool takes a repository URL, a file path, and an optional branch name,
     and returns the content of the file as a string.
+
+    With a ``content_cache`` (see ``gofannon.github.content_cache``) the
+    branch is resolved to a commit SHA and files are cached by that SHA.
     """
-    def __init__(self, api_key=None, name="read_file"):
+    cache_ttl = 5 * 60
+
+    def __init__(self, api_key=None, name="read_file", content_cache=None):
         super().__init__()
         self.api_key = api_key
         self.name = name
         self.API_SERVICE = 'github'
+        self.content_cache = content_cache
 
     @property
     def definition(self):
@@ -49,20 +58,89 @@ class ReadFile(BaseTool):
 
     def fn(self, repo_url, file_path, branch=None):
         logger.debug(f"Reading file {file_path} from repo {repo_url}")
+        cache = self._content_cache()
+        if cache is not None:
+            owner, repo_name = self._parse_repo_url(repo_url)
+            branch = cache.resolve_ref(self.http_session, owner, repo_name, branch, self._headers())
+            content = cache.get("file", owner, repo_name, branch, file_path)
+            if content is not None:
+                return content
+        api_url, headers, params = self._contents_request(repo_url, file_path, branch)
+        response = self.http_session.get(api_url, headers=headers, params=params)
+        content = self._decode_file(response)
+        if cache is not None:
+            cache.set("file", owner, repo_name, branch, file_path, value=content)
+        return content
+
+    async def afn(self, repo_url, file_path, branch=None):
+        logger.debug(f"Reading file {file_path} from repo {repo_url}")
+        cache = self._content_cache()
+        if cache is not None:
+            owner, repo_name = self._parse_repo_url(repo_url)
+            branch = await cache.aresolve_ref(self.async_http_client, owner, repo_name, branch, self._headers())
+            content = cache.get("file", owner, repo_name, branch, file_path)
+            if content is not None:
+                return content
+        api_url, headers, params = self._contents_request(repo_url, file_path, branch)
+        response = await self.async_http_client.get(api_url, headers=headers, params=params)
+        content = self._decode_file(response)
+        if cache is not None:
+            cache.set("file", owner, repo_name, branch, file_path, value=content)
+        return content
+
+    def _content_cache(self):
+        return content_cache_or_default(self.content_cache)
+
+    def read_files(self, repo_url, file_paths, branch=None):
+        """
+        Read many files at one ref with batched GraphQL queries. Returns
+        ``{path: content}``; paths that aren't readable text files map to None.
+        """
+        logger.debug(f"Reading {len(file_paths)} files from repo {repo_url}")
+        owner, repo_name = self._parse_repo_url(repo_url)
+        reader = GraphQLBatchReader(self.api_key)
+        cache = self._content_cache()
+        if cache is None:
+            return reader.get_files(owner, repo_name, file_paths, ref=branch or "HEAD")
+
+        sha = cache.resolve_ref(self.http_session, owner, repo_name, branch, self._headers())
+        results = {path: cache.get("file", owner, repo_name, sha, path) for path in file_paths}
+        missing = [path for path, content in results.items() if content is None]
+        if missing:
+            fetched = reader.get_files(owner, repo_name, missing, ref=sha)
+            for path, content in fetched.items():
+                if content is not None:
+                    cache.set("file", owner, repo_name, sha, path, value=content)
+            results.update(fetched)
+        return results
+
+    async def aread_files(self, repo_url, file_paths, branch=None):
+        """Async counterpart of ``read_files``; the queries run on a worker thread."""
+        return await anyio.to_thread.run_sync(functools.partial(self.read_files, repo_url, file_paths, branch))
+
+    @staticmethod
+    def _parse_repo_url(repo_url):
         repo_parts = repo_url.rstrip('/').split('/')
-        owner = repo_parts[-2]
-        repo_name = repo_parts[-1]
+        return repo_parts[-2], repo_parts[-1]
 
-        api_url = f"https://api.github.com/repos/{owner}/{repo_name}/contents/{file_path}"
-        headers = {
+    def _headers(self):
+        return {
             'Authorization': f'token {self.api_key}',
             'Accept': 'application/vnd.github.v3+json'
         }
+
+    def _contents_request(self, repo_url, file_path, branch):
+        owner, repo_name = self._parse_repo_url(repo_url)
+
+        api_url = f"https://api.github.com/repos/{owner}/{repo_name}/contents/{file_path}"
+        headers = self._headers()
         params = {}
         if branch:
             params['ref'] = branch
+        return api_url, headers, params
 
-        response = requests.get(api_url, headers=headers, params=params)
+    @staticmethod
+    def _decode_file(response):
         response.raise_for_status()
 
         file_data = response.json()
@@ -1,8 +1,11 @@
 
+import asyncio
+import functools
+import anyio
 from..base import BaseTool
-import requests
 import json
 from ..config import FunctionRegistry
+from .graphql import GraphQLBatchReader
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,6 +44,46 @@ class ReadIssue(BaseTool):
 
     def fn(self, repo_url, issue_number):
         logger.debug(f"Reading issue number {issue_number} from repo {repo_url}")
+        issue_url, comment_url, headers = self._issue_request(repo_url, issue_number)
+
+        issue_response = self.http_session.get(issue_url, headers=headers)
+        issue_response.raise_for_status()
+
+        comment_response = self.http_session.get(comment_url, headers=headers)
+        comment_response.raise_for_status()
+
+        return self._format_issue(issue_response, comment_response)
+
+    async def afn(self, repo_url, issue_number):
+        logger.debug(f"Reading issue number {issue_number} from repo {repo_url}")
+        issue_url, comment_url, headers = self._issue_request(repo_url, issue_number)
+        client = self.async_http_client
+
+        issue_response, comment_response = await asyncio.gather(
+            client.get(issue_url, headers=headers),
+            client.get(comment_url, headers=headers),
+        )
+        issue_response.raise_for_status()
+        comment_response.raise_for_status()
+
+        return self._format_issue(issue_response, comment_response)
+
+    def read_issues(self, repo_url, issue_numbers):
+        """
+        Read many issues with batched GraphQL queries rather than two REST
+        calls each. Returns ``{number: {"issue": {...}, "comments": [...]}}``
+        in GraphQL's field names (see ``GraphQLBatchReader.get_issues``);
+        numbers that aren't issues map to None.
+        """
+        logger.debug(f"Reading {len(issue_numbers)} issues from repo {repo_url}")
+        repo_parts = repo_url.rstrip('/').split('/')
+        return GraphQLBatchReader(self.api_key).get_issues(repo_parts[-2], repo_parts[-1], issue_numbers)
+
+    async def aread_issues(self, repo_url, issue_numbers):
+        """Async counterpart of ``read_issues``; the queries run on a worker thread."""
+        return await anyio.to_thread.run_sync(functools.partial(self.read_issues, repo_url, issue_numbers))
+
+    def _issue_request(self, repo_url, issue_number):
         # Extracting the owner and repo name from the URL
         repo_parts = repo_url.rstrip('/').split('/')
         owner = repo_parts[-2]
@@ -52,13 +95,10 @@ class ReadIssue(BaseTool):
         headers = {
             'Authorization': f'token {self.api_key}'
         }
+        return issue_url, comment_url, headers
 
-        issue_response = requests.get(issue_url, headers=headers)
-        issue_response.raise_for_status()
-
-        comment_response = requests.get(comment_url, headers=headers)
-        comment_response.raise_for_status()
-
+    @staticmethod
+    def _format_issue(issue_response, comment_response):
         issue_data = issue_response.json()
         comment_data = comment_response.json()
 
@@ -67,4 +107,4 @@ class ReadIssue(BaseTool):
             "comments": comment_data
         }
 
-        return json.dumps(result, indent=4)  
\ No newline at end of file
+        return json.dumps(result, indent=4)
\ No newline at end of file
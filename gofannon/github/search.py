@@ -1,10 +1,11 @@
 from..base import BaseTool
-import requests
 from ..config import FunctionRegistry
 import logging
 
 logger = logging.getLogger(__name__)
 
+SEARCH_URL = "https://api.github.com/search/repositories"
+
 @FunctionRegistry.register
 class SearchRepos(BaseTool):
     def __init__(self,
@@ -45,7 +46,17 @@ class SearchRepos(BaseTool):
 
     def fn(self, query, page=1, per_page=10) -> str:
         logger.debug(f"Searching github.com for '{query}'")
-        api_url = f"https://api.github.com/search/repositories"
+        headers, params = self._search_request(query, page, per_page)
+        response = self.http_session.get(SEARCH_URL, headers=headers, params=params)
+        return self._format_results(response)
+
+    async def afn(self, query, page=1, per_page=10) -> str:
+        logger.debug(f"Searching github.com for '{query}'")
+        headers, params = self._search_request(query, page, per_page)
+        response = await self.async_http_client.get(SEARCH_URL, headers=headers, params=params)
+        return self._format_results(response)
+
+    def _search_request(self, query, page, per_page):
         headers = {
             'Authorization': f'token {self.api_key}'
         }
@@ -54,8 +65,10 @@ class SearchRepos(BaseTool):
             "page": page,
             "per_page": per_page
         }
+        return headers, params
 
-        response = requests.get(api_url, headers=headers, params=params)
+    @staticmethod
+    def _format_results(response):
         response.raise_for_status()
 
         results = response.json()
@@ -64,4 +77,4 @@ class SearchRepos(BaseTool):
         for result in results['items']:
             formatted_results.append(f"**{result['name']}** by **{result['owner']['login']}** - {result['description']}")
 
-        return "\n\n".join(formatted_results)  
\ No newline at end of file
+        return "\n\n".join(formatted_results)
\ No newline at end of file
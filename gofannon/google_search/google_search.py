@@ -1,5 +1,7 @@
 from ..base import BaseTool
+from ..base.rate_limit import get_rate_limiter
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from ..config import ToolConfig, FunctionRegistry
 import logging
 
@@ -43,7 +45,14 @@ class GoogleSearch(BaseTool):
         try:
             service = build("customsearch", "v1", developerKey=self.api_key)
             cse = service.cse()
-            result = cse.list(q=query, cx=self.engine_id, num=num_results).execute()
+            # The API client does its own HTTP, so apply the shared limiter here.
+            limiter = get_rate_limiter(self.API_SERVICE, "www.googleapis.com")
+            limiter.acquire()
+            try:
+                result = cse.list(q=query, cx=self.engine_id, num=num_results).execute()
+            except HttpError as e:
+                limiter.observe(e.resp.status, e.resp)
+                raise
 
             search_results = []
             for item in result['items']:
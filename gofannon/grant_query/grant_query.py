@@ -68,7 +68,7 @@ class GrantsQueryTool(BaseTool):
             
             logger.debug(f"Searching for EU grants with query: {query}")
 
-            response = requests.post(
+            response = self.http_session.post(
                 "https://api.tech.ec.europe.eu/search-api/prod/rest/search",
                 params={
                     "apiKey": "SEDIA", 
@@ -5,6 +5,8 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+APOD_URL = "https://api.nasa.gov/planetary/apod"
+
 """Fetch the Astronomy Picture of the Day (APOD) from NASA's API.
 
 This tool retrieves the daily astronomy image, including metadata such as the 
@@ -44,25 +46,38 @@ class AstronomyPhotoOfTheDayTool(BaseTool):
         if not self.api_key:
             logger.error("API key is missing. Cannot fetch APOD data.")
             return {"error": "API key is missing. Please set it in the environment or pass it as an argument."}
-        url = "https://api.nasa.gov/planetary/apod"
-        params = {
-            "api_key": self.api_key
-        }
-
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            return{
-                "title": data.get("title", "No title available"),
-                "date": data.get("date", "No date available"),
-                "explanation": data.get("explanation", "No explanation available"),
-                "url": data.get("url", None),
-                "media_type": data.get("media_type", "unknown"),
+            response = self.http_session.get(APOD_URL, params={"api_key": self.api_key})
+            return self._format_apod(response)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching data from NASA APOD: {e}")
+            return {
+                "error": str(e)
             }
+
+    async def afn(self):
+        logger.debug("Fetching NASA APOD data")
+        if not self.api_key:
+            logger.error("API key is missing. Cannot fetch APOD data.")
+            return {"error": "API key is missing. Please set it in the environment or pass it as an argument."}
+        try:
+            response = await self.async_http_client.get(APOD_URL, params={"api_key": self.api_key})
+            return self._format_apod(response)
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching data from NASA APOD: {e}")
             return {
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+
+    @staticmethod
+    def _format_apod(response):
+        response.raise_for_status()
+        data = response.json()
+
+        return{
+            "title": data.get("title", "No title available"),
+            "date": data.get("date", "No date available"),
+            "explanation": data.get("explanation", "No explanation available"),
+            "url": data.get("url", None),
+            "media_type": data.get("media_type", "unknown"),
+        }
\ No newline at end of file
@@ -1,4 +1,3 @@
-from requests import get
 from json import dumps
 
 from ..base import BaseTool
@@ -55,5 +54,5 @@ class ComplaintsByVehicle(BaseTool):
             "model": model,
             "modelYear": modelYear
         }
-        r = get(base_url, params=payload)
+        r = self.http_session.get(base_url, params=payload)
         return dumps(r.json())
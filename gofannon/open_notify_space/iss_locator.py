@@ -11,6 +11,8 @@ from jsonschema import validate
 
 logger = logging.getLogger(__name__)
 
+ISS_URL = "http://api.open-notify.org/iss-now.json"
+
 valid_iss_schema = {
     "type": "object",
     "properties": {
@@ -74,53 +76,53 @@ class IssLocator(BaseTool):
     #   }"
 
     def fn(self):
-        base_url = "http://api.open-notify.org/iss-now.json"
-        logger.debug(f"Fetching ISS pos from OpenNotify.org at {base_url}")
-        if self.format_json:
-            response = json.dumps(error_response_json)
-        else:
-            response = error_response_string
+        logger.debug(f"Fetching ISS pos from OpenNotify.org at {ISS_URL}")
+        try:
+            return self._format_position(self.http_session.get(ISS_URL))
+        except Exception as err:
+            return self._error_response(err)
 
+    async def afn(self):
+        logger.debug(f"Fetching ISS pos from OpenNotify.org at {ISS_URL}")
         try:
-            http_response = requests.get(base_url)
-            response_json = http_response.json()
-            # Validate the returned schema is valid.
-            validate(response_json, valid_iss_schema)
-            # Does not seem to be a way to evaluate strings as floats in a range in jsonschema,
-            # other than using a REALLY ugly regex.
-            lat = float(response_json["iss_position"]["latitude"])
-            long = float(response_json["iss_position"]["longitude"])
-            if (lat > -90 and lat < 90) and (long > -180 and long < 180):
-                if self.format_json:
-                    response = json.dumps(response_json)
-                else:
-                    response = f"According to OpenNotify.org, the International Space Station can be found at (lat, long) ({lat}, {long})"
-            else:
-                raise ValueError(f"(latitude, longitude) out of range: ({lat},{long})")
-        except requests.exceptions.HTTPError as errh:
-            logger.debug(f"HTTP exception: GET at {base_url} returns {errh}")
-            pass
-        except requests.exceptions.ConnectionError as errc:
-            logger.debug(f"HTTP connection exception: GET at {base_url} returns {errc}")
-            pass
-        except requests.exceptions.Timeout as errt:
-            logger.debug(f"HTTP timeout exception: GET at {base_url} returns {errt}")
-            pass
-        except requests.exceptions.RequestException as err:
-            logger.debug(f"Requests exception: GET at {base_url} returns {err}")
-            pass
-        except jsonschema.exceptions.ValidationError as errj:
+            return self._format_position(await self.async_http_client.get(ISS_URL))
+        except Exception as err:
+            return self._error_response(err)
+
+    def _format_position(self, http_response):
+        response_json = http_response.json()
+        # Validate the returned schema is valid.
+        validate(response_json, valid_iss_schema)
+        # Does not seem to be a way to evaluate strings as floats in a range in jsonschema,
+        # other than using a REALLY ugly regex.
+        lat = float(response_json["iss_position"]["latitude"])
+        long = float(response_json["iss_position"]["longitude"])
+        if (lat > -90 and lat < 90) and (long > -180 and long < 180):
+            if self.format_json:
+                return json.dumps(response_json)
+            return f"According to OpenNotify.org, the International Space Station can be found at (lat, long) ({lat}, {long})"
+        raise ValueError(f"(latitude, longitude) out of range: ({lat},{long})")
+
+    def _error_response(self, err):
+        if isinstance(err, requests.exceptions.HTTPError):
+            logger.debug(f"HTTP exception: GET at {ISS_URL} returns {err}")
+        elif isinstance(err, requests.exceptions.ConnectionError):
+            logger.debug(f"HTTP connection exception: GET at {ISS_URL} returns {err}")
+        elif isinstance(err, requests.exceptions.Timeout):
+            logger.debug(f"HTTP timeout exception: GET at {ISS_URL} returns {err}")
+        elif isinstance(err, requests.exceptions.RequestException):
+            logger.debug(f"Requests exception: GET at {ISS_URL} returns {err}")
+        elif isinstance(err, jsonschema.exceptions.ValidationError):
             logger.debug(
-                f"JSON validation failure GET at {base_url} malformed response: {errj}"
+                f"JSON validation failure GET at {ISS_URL} malformed response: {err}"
             )
-            pass
-        except ValueError as errv:
+        elif isinstance(err, ValueError):
             logger.debug(
-                f"Value Exception GET at {base_url} malformed response: {errv}"
+                f"Value Exception GET at {ISS_URL} malformed response: {err}"
             )
-            pass
-        except Exception as erre:
-            logger.debug(f"General exception GET at {base_url} Error: {erre}")
-            pass
+        else:
+            logger.debug(f"General exception GET at {ISS_URL} Error: {err}")
 
-        return response
+        if self.format_json:
+            return json.dumps(error_response_json)
+        return error_response_string
@@ -1,12 +1,71 @@
+import asyncio
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from typing import List, Dict, Any
+
+import anyio
+
 from ..base import WorkflowContext, ToolResult
 from ..config import FunctionRegistry
+from .streaming import StreamedMessage
+from .tool_pool import ToolPool
 import logging
 
 logger = logging.getLogger(__name__)
 
+SYNTHESIS_PROMPT = '''Based on the tool outputs above,   
+            provide a complete natural language answer with final numerical result   
+            in bold. Follow this format:  
+              
+            **Final Answer**: [result in bold]   
+              
+            With supporting calculations shown.'''
+
+def _tool_call_start_event(tool_call):
+    return {
+        "type": "tool_call_start",
+        "tool_call_id": tool_call.id,
+        "name": tool_call.function.name,
+        "arguments": tool_call.function.arguments,
+    }
+
+
+def _tool_call_done_events(tool_call, outcome):
+    result, duration, timed_out = outcome
+    yield {
+        "type": "tool_call_end",
+        "tool_call_id": tool_call.id,
+        "name": tool_call.function.name,
+        "duration": duration,
+        "timed_out": timed_out,
+    }
+    yield {
+        "type": "tool_result",
+        "tool_call_id": tool_call.id,
+        "name": tool_call.function.name,
+        "content": str(result),
+    }
+
+
+def _latency_entry(tool_call, outcome):
+    _, duration, timed_out = outcome
+    return {
+        "tool_call_id": tool_call.id,
+        "name": tool_call.function.name,
+        "duration": duration,
+        "timed_out": timed_out,
+    }
+
+
+def _tool_message(tool_call, outcome):
+    return {
+        "role": "tool",
+        "tool_call_id": tool_call.id,
+        "content": str(outcome[0]),
+    }
+
+
 class FunctionOrchestrator:
     def __init__(self, llm_client, tool_configs=None):
         self.logger = logging.getLogger(f"{__name__}.FunctionOrchestrator")
@@ -14,6 +73,7 @@ class FunctionOrchestrator:
         self.available_functions = FunctionRegistry.get_tools()
         self.tool_configs = tool_configs or {}
         self.function_map = self.function_map = self._build_function_map()
+        self.tool_pool = ToolPool(self._instantiate_tool)
         self.logger.debug("Available functions in orchestrator: " + ', '.join(
             [f['function']['name'] for f in self.available_functions]))
 
@@ -29,9 +89,92 @@ class FunctionOrchestrator:
         tool_class, config = self.function_map[function_name]
         return tool_class(**config)
 
-    def execute_workflow(self, user_query: str, model_name: str, max_steps=5):
+    def _acquire_tool(self, function_name):
+        """Borrow a pooled, opened instance of the tool for ``function_name``."""
+        tool_class, config = self.function_map[function_name]
+        return self.tool_pool.acquire(function_name, tool_class, config)
+
+    def close(self):
+        """Close every pooled tool instance."""
+        self.tool_pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _run_tool_call(self, tool_call):
+        """Run the pooled tool for a single tool call."""
+        function_name = tool_call.function.name
+        function_args = json.loads(tool_call.function.arguments)
+
+        start_time = time.time()
+        with self._acquire_tool(function_name) as tool:
+            result = tool.invoke(**function_args)
+        return result, time.time() - start_time
+
+    @staticmethod
+    def _timeout_for(function_name, tool_timeout):
+        if isinstance(tool_timeout, dict):
+            return tool_timeout.get(function_name)
+        return tool_timeout
+
+    def _run_tool_calls_concurrently(self, tool_calls, max_workers, tool_timeout):
+        """
+        Run the tool calls of one LLM message on a bounded thread pool.
+
+        Outcomes are returned in the order of ``tool_calls``. A call that does
+        not finish within its timeout (measured from dispatch) is reported as
+        an error message; its worker thread is left to finish in the
+        background.
+        """
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(tool_calls)))
+        try:
+            dispatched = [
+                (tool_call, time.time(), executor.submit(self._run_tool_call, tool_call))
+                for tool_call in tool_calls
+            ]
+            outcomes = []
+            for tool_call, submitted_at, future in dispatched:
+                function_name = tool_call.function.name
+                timeout = self._timeout_for(function_name, tool_timeout)
+                remaining = None if timeout is None else max(0, submitted_at + timeout - time.time())
+                try:
+                    result, duration = future.result(timeout=remaining)
+                    outcomes.append((result, duration, False))
+                except FuturesTimeoutError:
+                    self.logger.warning("Tool call %s (%s) timed out after %ss",
+                                        tool_call.id, function_name, timeout)
+                    outcomes.append((f"Error: tool '{function_name}' timed out after {timeout} seconds",
+                                     time.time() - submitted_at, True))
+            return outcomes
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def execute_workflow(self, user_query: str, model_name: str, max_steps=5,
+                         parallel_tool_calls=False, max_workers=8, tool_timeout=None):
+        """
+        Run the tool-calling loop until the LLM answers or ``max_steps`` is hit.
+
+        Args:
+            user_query: The user's request.
+            model_name: Model to use for every completion.
+            max_steps: Maximum number of LLM round trips before synthesis.
+            parallel_tool_calls: Run the tool calls of a single LLM message
+                concurrently on a thread pool instead of one after another.
+            max_workers: Upper bound on the pool size when running concurrently.
+            tool_timeout: Seconds to wait for each tool call, either a single
+                number or a dict keyed by function name. Only enforced when
+                ``parallel_tool_calls`` is set.
+
+        Returns:
+            A dict with the ``conversation``, the ``final_answer`` and
+            ``tool_latencies``, one entry per tool call in call order.
+        """
         self.logger.debug("Starting workflow execution with query: %s", user_query)
         messages = [{"role": "user", "content": user_query}]
+        tool_latencies = []
         final_answer = None
 
         for _ in range(max_steps):
@@ -51,42 +194,22 @@ class FunctionOrchestrator:
 
                 # Process tool calls if any
             if msg.tool_calls:
-                for tool_call in msg.tool_calls:
-                    function_name = tool_call.function.name
-
-                    function_args = json.loads(tool_call.function.arguments)
-
-                    # Execute function
-                    # Get tool class and configuration
-                    tool_class, config = self.function_map[function_name]
+                if parallel_tool_calls:
+                    outcomes = self._run_tool_calls_concurrently(msg.tool_calls, max_workers, tool_timeout)
+                else:
+                    outcomes = [(*self._run_tool_call(tool_call), False) for tool_call in msg.tool_calls]
 
-                    # Instantiate tool with configuration
-                    tool = tool_class(**config)
-
-                    # Execute function
-                    result = tool.fn(**function_args)
+                for tool_call, outcome in zip(msg.tool_calls, outcomes):
+                    tool_latencies.append(_latency_entry(tool_call, outcome))
 
                     # Store result in context
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": str(result),#.output,
-                        # "name": function_name
-                    })
+                    messages.append(_tool_message(tool_call, outcome))
             else:
                 break  # Exit if no tools called and no content
 
         # Final synthesis step
         if not final_answer:
-            synthesis_prompt = '''Based on the tool outputs above,   
-            provide a complete natural language answer with final numerical result   
-            in bold. Follow this format:  
-              
-            **Final Answer**: [result in bold]   
-              
-            With supporting calculations shown.'''
-
-            messages.append({"role": "user", "content": synthesis_prompt})
+            messages.append({"role": "user", "content": SYNTHESIS_PROMPT})
 
             response = self.llm.chat.completions.create(
                 model=model_name,
@@ -96,7 +219,267 @@ class FunctionOrchestrator:
 
         return {
             "conversation": messages,
-            "final_answer": final_answer
+            "final_answer": final_answer,
+            "tool_latencies": tool_latencies
+        }
+
+    def stream_workflow(self, user_query: str, model_name: str, max_steps=5,
+                        parallel_tool_calls=False, max_workers=8, tool_timeout=None):
+        """
+        Generator variant of ``execute_workflow`` that yields events as they happen.
+
+        Completions are requested with ``stream=True``. Events are dicts with a
+        ``type`` key:
+
+        * ``token``: ``content`` delta from the LLM (including the synthesis step)
+        * ``tool_call_start``: ``tool_call_id``, ``name`` and ``arguments``
+        * ``tool_call_end``: ``tool_call_id``, ``name``, ``duration``, ``timed_out``
+        * ``tool_result``: ``tool_call_id``, ``name`` and the ``content`` sent to the LLM
+        * ``final_answer``: ``content`` plus the ``conversation`` and ``tool_latencies``
+          that ``execute_workflow`` would return
+
+        The arguments have the same meaning as in ``execute_workflow``.
+        """
+        self.logger.debug("Starting streamed workflow execution with query: %s", user_query)
+        messages = [{"role": "user", "content": user_query}]
+        tool_latencies = []
+        final_answer = None
+
+        for _ in range(max_steps):
+            streamed = StreamedMessage()
+            for chunk in self.llm.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                tools=self.available_functions,
+                stream=True
+            ):
+                delta = streamed.add(chunk)
+                if delta:
+                    yield {"type": "token", "content": delta}
+            messages.append(streamed.to_message())
+            tool_calls = streamed.tool_calls
+
+            if streamed.content and not tool_calls:
+                final_answer = streamed.content
+                break
+            if not tool_calls:
+                break
+
+            if parallel_tool_calls:
+                for tool_call in tool_calls:
+                    yield _tool_call_start_event(tool_call)
+                outcomes = self._run_tool_calls_concurrently(tool_calls, max_workers, tool_timeout)
+                for tool_call, outcome in zip(tool_calls, outcomes):
+                    yield from _tool_call_done_events(tool_call, outcome)
+            else:
+                outcomes = []
+                for tool_call in tool_calls:
+                    yield _tool_call_start_event(tool_call)
+                    outcomes.append((*self._run_tool_call(tool_call), False))
+                    yield from _tool_call_done_events(tool_call, outcomes[-1])
+
+            for tool_call, outcome in zip(tool_calls, outcomes):
+                tool_latencies.append(_latency_entry(tool_call, outcome))
+                messages.append(_tool_message(tool_call, outcome))
+
+        if not final_answer:
+            messages.append({"role": "user", "content": SYNTHESIS_PROMPT})
+            streamed = StreamedMessage()
+            for chunk in self.llm.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                stream=True
+            ):
+                delta = streamed.add(chunk)
+                if delta:
+                    yield {"type": "token", "content": delta}
+            final_answer = streamed.content
+
+        yield {
+            "type": "final_answer",
+            "content": final_answer,
+            "conversation": messages,
+            "tool_latencies": tool_latencies
+        }
+
+class AsyncFunctionOrchestrator(FunctionOrchestrator):
+    """
+    Asyncio counterpart of ``FunctionOrchestrator``.
+
+    Takes an ``AsyncOpenAI``-compatible client and awaits every completion and
+    tool call, so one event loop can drive many workflows at once. Tools with
+    a coroutine ``fn`` are awaited directly; synchronous tools run on a worker
+    thread pool shared by all workflows of this orchestrator and capped at
+    ``max_workers`` threads.
+
+    The entry points are ``aexecute_workflow`` and ``astream_workflow``; the
+    inherited sync methods expect a sync client.
+    """
+    def __init__(self, llm_client, tool_configs=None, max_workers=40):
+        super().__init__(llm_client, tool_configs)
+        self.logger = logging.getLogger(f"{__name__}.AsyncFunctionOrchestrator")
+        self.max_workers = max_workers
+        self._limiter = None
+
+    def _get_limiter(self):
+        # Created lazily so that it binds to the running event loop.
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.max_workers)
+        return self._limiter
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def _arun_tool_call(self, tool_call, tool_timeout):
+        function_name = tool_call.function.name
+        function_args = json.loads(tool_call.function.arguments)
+        timeout = self._timeout_for(function_name, tool_timeout)
+
+        start_time = time.time()
+        try:
+            with self._acquire_tool(function_name) as tool:
+                result = await asyncio.wait_for(
+                    tool.execute_async(function_args, limiter=self._get_limiter()),
+                    timeout=timeout
+                )
+            return result, time.time() - start_time, False
+        except asyncio.TimeoutError:
+            self.logger.warning("Tool call %s (%s) timed out after %ss",
+                                tool_call.id, function_name, timeout)
+            return (f"Error: tool '{function_name}' timed out after {timeout} seconds",
+                    time.time() - start_time, True)
+
+    async def aexecute_workflow(self, user_query: str, model_name: str, max_steps=5,
+                                parallel_tool_calls=False, tool_timeout=None):
+        """
+        Async version of ``FunctionOrchestrator.execute_workflow``.
+
+        ``tool_timeout`` is enforced for every call here, in both sequential
+        and concurrent mode. The pool size is set on the orchestrator, so
+        there is no ``max_workers`` argument.
+        """
+        self.logger.debug("Starting async workflow execution with query: %s", user_query)
+        messages = [{"role": "user", "content": user_query}]
+        tool_latencies = []
+        final_answer = None
+
+        for _ in range(max_steps):
+            response = await self.llm.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                tools=self.available_functions
+            )
+            msg = response.choices[0].message
+            messages.append(msg)
+
+            if msg.content and not msg.tool_calls:
+                final_answer = msg.content
+                break
+
+            if msg.tool_calls:
+                if parallel_tool_calls:
+                    outcomes = await asyncio.gather(*(
+                        self._arun_tool_call(tool_call, tool_timeout) for tool_call in msg.tool_calls
+                    ))
+                else:
+                    outcomes = [await self._arun_tool_call(tool_call, tool_timeout)
+                                for tool_call in msg.tool_calls]
+
+                for tool_call, outcome in zip(msg.tool_calls, outcomes):
+                    tool_latencies.append(_latency_entry(tool_call, outcome))
+                    messages.append(_tool_message(tool_call, outcome))
+            else:
+                break
+
+        if not final_answer:
+            messages.append({"role": "user", "content": SYNTHESIS_PROMPT})
+
+            response = await self.llm.chat.completions.create(
+                model=model_name,
+                messages=messages
+            )
+            final_answer = response.choices[0].message.content
+
+        return {
+            "conversation": messages,
+            "final_answer": final_answer,
+            "tool_latencies": tool_latencies
+        }
+
+    async def astream_workflow(self, user_query: str, model_name: str, max_steps=5,
+                               parallel_tool_calls=False, tool_timeout=None):
+        """
+        Async generator variant of ``aexecute_workflow``.
+
+        Yields the same events as ``FunctionOrchestrator.stream_workflow``.
+        """
+        self.logger.debug("Starting streamed async workflow execution with query: %s", user_query)
+        messages = [{"role": "user", "content": user_query}]
+        tool_latencies = []
+        final_answer = None
+
+        for _ in range(max_steps):
+            streamed = StreamedMessage()
+            async for chunk in await self.llm.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                tools=self.available_functions,
+                stream=True
+            ):
+                delta = streamed.add(chunk)
+                if delta:
+                    yield {"type": "token", "content": delta}
+            messages.append(streamed.to_message())
+            tool_calls = streamed.tool_calls
+
+            if streamed.content and not tool_calls:
+                final_answer = streamed.content
+                break
+            if not tool_calls:
+                break
+
+            if parallel_tool_calls:
+                for tool_call in tool_calls:
+                    yield _tool_call_start_event(tool_call)
+                outcomes = await asyncio.gather(*(
+                    self._arun_tool_call(tool_call, tool_timeout) for tool_call in tool_calls
+                ))
+                for tool_call, outcome in zip(tool_calls, outcomes):
+                    for event in _tool_call_done_events(tool_call, outcome):
+                        yield event
+            else:
+                outcomes = []
+                for tool_call in tool_calls:
+                    yield _tool_call_start_event(tool_call)
+                    outcomes.append(await self._arun_tool_call(tool_call, tool_timeout))
+                    for event in _tool_call_done_events(tool_call, outcomes[-1]):
+                        yield event
+
+            for tool_call, outcome in zip(tool_calls, outcomes):
+                tool_latencies.append(_latency_entry(tool_call, outcome))
+                messages.append(_tool_message(tool_call, outcome))
+
+        if not final_answer:
+            messages.append({"role": "user", "content": SYNTHESIS_PROMPT})
+            streamed = StreamedMessage()
+            async for chunk in await self.llm.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                stream=True
+            ):
+                delta = streamed.add(chunk)
+                if delta:
+                    yield {"type": "token", "content": delta}
+            final_answer = streamed.content
+
+        yield {
+            "type": "final_answer",
+            "content": final_answer,
+            "conversation": messages,
+            "tool_latencies": tool_latencies
         }
 
 class ToolChain:
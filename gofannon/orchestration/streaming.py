@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+
+class StreamedMessage:
+    """
+    Accumulates ``stream=True`` chat completion chunks into one assistant message.
+
+    Content deltas are concatenated; tool call fragments are merged by their
+    ``index`` (the id and name arrive in the first fragment, the arguments are
+    spread over the following ones).
+    """
+    def __init__(self):
+        self.content_parts = []
+        self._tool_calls = {}
+
+    def add(self, chunk):
+        """Merge ``chunk`` and return its content delta ('' if there is none)."""
+        if not chunk.choices:
+            return ""
+        delta = chunk.choices[0].delta
+
+        for fragment in getattr(delta, "tool_calls", None) or []:
+            call = self._tool_calls.setdefault(fragment.index, {"id": None, "name": "", "arguments": ""})
+            if fragment.id:
+                call["id"] = fragment.id
+            function = getattr(fragment, "function", None)
+            if function is not None:
+                if function.name:
+                    call["name"] += function.name
+                if function.arguments:
+                    call["arguments"] += function.arguments
+
+        content = getattr(delta, "content", None) or ""
+        if content:
+            self.content_parts.append(content)
+        return content
+
+    @property
+    def content(self):
+        return "".join(self.content_parts) or None
+
+    @property
+    def tool_calls(self):
+        """Tool calls shaped like the ones on a non-streamed message."""
+        return [
+            SimpleNamespace(
+                id=call["id"],
+                function=SimpleNamespace(name=call["name"], arguments=call["arguments"] or "{}"),
+            )
+            for _, call in sorted(self._tool_calls.items())
+        ]
+
+    def to_message(self):
+        """The assistant message to append to the conversation."""
+        message = {"role": "assistant", "content": self.content}
+        if self._tool_calls:
+            message["tool_calls"] = [
+                {
+                    "id": call.id,
+                    "type": "function",
+                    "function": {"name": call.function.name, "arguments": call.function.arguments},
+                }
+                for call in self.tool_calls
+            ]
+        return message
@@ -0,0 +1,85 @@
+import json
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class ToolPool:
+    """
+    Cache of opened tool instances, keyed by function name plus configuration.
+
+    Thread-safe tools (``BaseTool.thread_safe``) share one instance per key.
+    Other tools are handed out exclusively and returned to an idle list when
+    the caller is done, so concurrent callers never share an instance; an
+    instance whose call raised is closed and dropped instead. Every
+    instance is ``open``-ed once when created and ``close``-d by ``close()``.
+    """
+    def __init__(self, factory):
+        """
+        Args:
+            factory: Callable ``(function_name) -> tool`` that builds a new,
+                configured tool instance.
+        """
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._shared = {}
+        self._idle = {}
+        self._instances = []
+
+    @staticmethod
+    def key(function_name, config):
+        return function_name, json.dumps(config or {}, sort_keys=True, default=repr)
+
+    def _create(self, function_name):
+        tool = self._factory(function_name)
+        tool.open()
+        self._instances.append(tool)
+        logger.debug("Opened pooled instance of %s", function_name)
+        return tool
+
+    @contextmanager
+    def acquire(self, function_name, tool_class, config):
+        key = self.key(function_name, config)
+
+        if getattr(tool_class, "thread_safe", True):
+            with self._lock:
+                tool = self._shared.get(key)
+                if tool is None:
+                    tool = self._shared[key] = self._create(function_name)
+            yield tool
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            tool = idle.pop() if idle else self._create(function_name)
+        try:
+            yield tool
+        except BaseException:
+            # The call failed or was abandoned (e.g. timed out while a worker
+            # thread still uses the instance), so it is not safe to reuse.
+            self._discard(tool)
+            raise
+        with self._lock:
+            self._idle.setdefault(key, []).append(tool)
+
+    def _discard(self, tool):
+        with self._lock:
+            if tool in self._instances:
+                self._instances.remove(tool)
+        try:
+            tool.close()
+        except Exception as e:
+            logger.warning("Error closing %s: %s", tool.__class__.__name__, e)
+
+    def close(self):
+        with self._lock:
+            instances, self._instances = self._instances, []
+            self._shared.clear()
+            self._idle.clear()
+        for tool in instances:
+            try:
+                tool.close()
+            except Exception as e:
+                logger.warning("Error closing %s: %s", tool.__class__.__name__, e)
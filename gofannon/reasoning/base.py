@@ -1,7 +1,118 @@
 from abc import ABC, abstractmethod
+import asyncio
 import json
-from openai import OpenAI
+import logging
+import threading
+import weakref
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletion
 from gofannon.base import BaseTool
+from gofannon.base.cache import MemoryCache, ResultCache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+# (base_url, api_key) -> OpenAI, shared by every level and tool instance so
+# calls reuse kept-alive connections instead of a new pool (and TLS
+# handshake) per request.
+_clients = {}
+# event loop -> {(base_url, api_key): AsyncOpenAI}; async pools are bound to one loop
+_async_clients = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def get_llm_client(base_url, api_key):
+    """Return the process-wide OpenAI-compatible client for ``(base_url, api_key)``."""
+    key = (base_url, api_key)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                logger.debug("Creating pooled LLM client for %s", base_url)
+                client = _clients[key] = OpenAI(api_key=api_key, base_url=base_url)
+    return client
+
+
+def get_async_llm_client(base_url, api_key):
+    """Return the async client for ``(base_url, api_key)`` on the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = (base_url, api_key)
+    with _clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            logger.debug("Creating pooled async LLM client for %s", base_url)
+            client = clients[key] = AsyncOpenAI(api_key=api_key, base_url=base_url)
+    return client
+
+
+async def aclose_llm_clients():
+    """Close the async clients that belong to the running event loop."""
+    with _clients_lock:
+        clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+def close_llm_clients():
+    """Close every pooled sync client. Async clients are closed with ``aclose_llm_clients``."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+class CompletionCache:
+    """
+    Opt-in memo of chat completions, keyed by endpoint, model, temperature
+    and a canonical hash of the messages. Values live in any
+    ``gofannon.base.cache`` backend: ``MemoryCache`` (the default) or
+    ``SQLiteCache`` on disk, which bound it by entries or bytes. ``ttl`` is
+    in seconds; None keeps entries until they are evicted.
+
+    Completions at a non-zero temperature are sampled, so by default they
+    bypass the cache. Set ``bypass_nonzero_temperature=False`` to cache them
+    too, e.g. to make regression runs repeatable.
+    """
+    def __init__(self, backend=None, ttl=None, bypass_nonzero_temperature=True):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+        self.bypass_nonzero_temperature = bypass_nonzero_temperature
+
+    def applies(self, temperature):
+        return not (self.bypass_nonzero_temperature and temperature)
+
+    @staticmethod
+    def key(base_url, model, temperature, messages):
+        return make_cache_key("chat_completion", {
+            "base_url": base_url,
+            "model": model,
+            "temperature": temperature,
+            "messages": messages,
+        })
+
+    def get(self, key):
+        value = self.backend.get(key)
+        if value is ResultCache.MISSING:
+            return None
+        return ChatCompletion.model_validate(value)
+
+    def set(self, key, response):
+        self.backend.set(key, response.model_dump(mode="json"), self.ttl)
+
+
+_default_completion_cache = None
+
+
+def set_default_completion_cache(cache):
+    """Use ``cache`` (a ``CompletionCache``) for every reasoning tool without its own; None disables."""
+    global _default_completion_cache
+    _default_completion_cache = cache
+
+
+def get_default_completion_cache():
+    return _default_completion_cache
+
 
 sample_depth_chart = [
     {'model_name' : "Qwen/Qwen2.5-72B-Instruct",
@@ -13,6 +124,11 @@ sample_depth_chart = [
 ]
 
 class ReasoningTool(BaseTool, ABC):
+    # fn resets and appends to self.error_context
+    thread_safe = False
+    # Per-instance CompletionCache; falls back to get_default_completion_cache().
+    completion_cache = None
+
     def __init__(self,
                  depth_chart = sample_depth_chart
                  ):
@@ -27,17 +143,49 @@ class ReasoningTool(BaseTool, ABC):
         pass
 
     def create_openai_like_client(self, level: int):
-        return OpenAI(
-            api_key=self.depth_chart[level]['api_key'],
-            base_url=self.depth_chart[level]['base_url']
-        )
+        """The pooled client for a level; levels on the same endpoint and key share one."""
+        return get_llm_client(self.depth_chart[level]['base_url'], self.depth_chart[level]['api_key'])
+
+    def create_async_openai_like_client(self, level: int):
+        return get_async_llm_client(self.depth_chart[level]['base_url'], self.depth_chart[level]['api_key'])
+
+    def _cached_completion(self, level, messages):
+        """Return ``(cache, key, cached response)``; cache and key are None when not cacheable."""
+        cache = self.completion_cache if self.completion_cache is not None else get_default_completion_cache()
+        config = self.depth_chart[level]
+        if cache is None or not cache.applies(config['temperature']):
+            return None, None, None
+        key = cache.key(config['base_url'], config['model_name'], config['temperature'], messages)
+        return cache, key, cache.get(key)
 
     def get_response(self, level: int, messages):
-        return self.create_openai_like_client(level).chat.completions.create(
+        cache, key, cached = self._cached_completion(level, messages)
+        if cached is not None:
+            logger.debug("Completion cache hit at level %s", level)
+            return cached
+        response = self.create_openai_like_client(level).chat.completions.create(
+            model=self.depth_chart[level]['model_name'],
+            messages=messages,
+            temperature=self.depth_chart[level]['temperature']
+        )
+        if cache is not None:
+            cache.set(key, response)
+        return response
+
+    async def aget_response(self, level: int, messages):
+        """Async counterpart of ``get_response``."""
+        cache, key, cached = self._cached_completion(level, messages)
+        if cached is not None:
+            logger.debug("Completion cache hit at level %s", level)
+            return cached
+        response = await self.create_async_openai_like_client(level).chat.completions.create(
             model=self.depth_chart[level]['model_name'],
             messages=messages,
             temperature=self.depth_chart[level]['temperature']
         )
+        if cache is not None:
+            cache.set(key, response)
+        return response
 
     def get_debug_info(self):
         """Get current debugging information"""
@@ -0,0 +1,248 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .base import ReasoningTool
+from ..config import FunctionRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class SearchBudget:
+    """
+    Thread-safe call and token budget for one search. A call is reserved
+    before it is sent; tokens are only known afterwards, so calls already in
+    flight when ``max_tokens`` is reached may overshoot it.
+    """
+    def __init__(self, max_calls=None, max_tokens=None):
+        self.max_calls = max_calls
+        self.max_tokens = max_tokens
+        self.calls = 0
+        self.tokens = 0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            if self.exhausted():
+                return False
+            self.calls += 1
+            return True
+
+    def record(self, response):
+        usage = getattr(response, 'usage', None)
+        with self._lock:
+            self.tokens += getattr(usage, 'total_tokens', 0) or 0
+
+    def exhausted(self):
+        return (self.max_calls is not None and self.calls >= self.max_calls) or \
+            (self.max_tokens is not None and self.tokens >= self.max_tokens)
+
+    def as_dict(self):
+        return {"calls": self.calls, "tokens": self.tokens}
+
+
+@FunctionRegistry.register
+class BeamSearchToT(ReasoningTool):
+    """
+    Tree-of-Thought as a beam search. Starting from the problem, every node
+    in the beam is expanded into ``expansions`` candidate next thoughts by
+    the level 0 model, each candidate is scored by the level 1 model (level
+    0 if the depth chart has one entry), and the ``beam_width`` best
+    candidates form the next beam. The search stops after ``levels`` levels,
+    once a candidate scores at least ``score_threshold``, or when the call or
+    token budget runs out.
+
+    The expansions of one level, and then the evaluations, run concurrently
+    on up to ``max_workers`` threads, so a level costs about two model round
+    trips however wide the beam is. Candidates are ranked by score with ties
+    kept in generation order, so a search is deterministic for a
+    deterministic model.
+    """
+    name = "beam_search_tot"
+
+    def __init__(self, depth_chart=None, max_workers=8):
+        super().__init__(depth_chart=depth_chart)
+        self.depth_chart = depth_chart or []
+        self.max_workers = max_workers
+
+    @property
+    def definition(self):
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": "Tree-of-Thought reasoning as a beam search: expand the most promising reasoning paths "
+                               "level by level, pruning to the best few after each level.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "prompt": {
+                            "type": "string",
+                            "description": "The problem prompt to process"
+                        },
+                        "levels": {
+                            "type": "integer",
+                            "description": "Maximum number of reasoning steps to expand (default: 3)",
+                            "default": 3
+                        },
+                        "beam_width": {
+                            "type": "integer",
+                            "description": "Number of paths kept after each level (default: 3)",
+                            "default": 3
+                        },
+                        "expansions": {
+                            "type": "integer",
+                            "description": "Candidate next steps generated per path (default: 3)",
+                            "default": 3
+                        },
+                        "score_threshold": {
+                            "type": "number",
+                            "description": "Stop as soon as a path scores at least this (0-10). Optional."
+                        },
+                        "max_calls": {
+                            "type": "integer",
+                            "description": "Maximum number of model calls for the whole search. Optional."
+                        },
+                        "max_tokens": {
+                            "type": "integer",
+                            "description": "Maximum number of tokens for the whole search. Optional."
+                        }
+                    },
+                    "required": ["prompt"]
+                }
+            }
+        }
+
+    def fn(self, prompt, levels=3, beam_width=3, expansions=3, score_threshold=None,
+           max_calls=None, max_tokens=None):
+        logger.debug(f"Beam search. {levels} levels, beam width {beam_width}, {expansions} expansions.")
+        self.error_context = []  # Reset error tracking
+        if 0 >= len(self.depth_chart):
+            self.error_context.append({
+                "stage": "initialization",
+                "error": "No models configured in depth_chart"
+            })
+            return {"error": "No models configured in depth_chart"}
+
+        budget = SearchBudget(max_calls, max_tokens)
+        beam = [{"path": [], "score": None}]
+        level_stats = []
+        stopped = "max_levels"
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for level in range(1, levels + 1):
+                    start_time = time.time()
+                    errors = []
+
+                    expanded = list(pool.map(
+                        lambda item: self._expand(prompt, item[1], expansions, budget, errors, level, item[0]),
+                        enumerate(beam)
+                    ))
+                    candidates = [candidate for children in expanded for candidate in children]
+                    scored = list(pool.map(
+                        lambda item: self._evaluate(prompt, item[1], budget, errors, level, item[0]),
+                        enumerate(candidates)
+                    ))
+                    # Errors are appended in a fixed order, whatever order the calls finished in.
+                    for error in sorted(errors, key=lambda error: error["order"]):
+                        self.error_context.append({key: value for key, value in error.items() if key != "order"})
+                    scored = [candidate for candidate in scored if candidate["score"] is not None]
+
+                    level_stats.append({
+                        "level": level,
+                        "expanded": len(beam),
+                        "candidates": len(scored),
+                        "best_score": max((candidate["score"] for candidate in scored), default=None),
+                        "seconds": round(time.time() - start_time, 3),
+                    })
+                    if not scored:
+                        stopped = "budget" if budget.exhausted() else "no_candidates"
+                        break
+                    # sorted() is stable: ties keep generation order.
+                    beam = sorted(scored, key=lambda candidate: candidate["score"], reverse=True)[:beam_width]
+                    if score_threshold is not None and beam[0]["score"] >= score_threshold:
+                        stopped = "score_threshold"
+                        break
+                    if budget.exhausted():
+                        stopped = "budget"
+                        break
+
+            return {
+                "best": beam[0] if beam[0]["path"] else None,
+                "beam": [node for node in beam if node["path"]],
+                "levels": level_stats,
+                "stopped": stopped,
+                "usage": budget.as_dict(),
+                "debug_info": self.get_debug_info()
+            }
+
+        except Exception as e:
+            logger.error(f"Critical failure: {str(e)}", exc_info=True)
+            self.error_context.append({
+                "stage": "fn_execution",
+                "error_type": type(e).__name__,
+                "message": str(e)
+            })
+            return {
+                "error": "BeamSearchToT processing failed",
+                "context": self.error_context,
+                "exception": str(e),
+                "debug_info": self.get_debug_info()
+            }
+
+    @staticmethod
+    def _format_path(path):
+        return "\n".join(f"{i + 1}. {thought}" for i, thought in enumerate(path)) or "(none yet)"
+
+    def _call(self, level, prompt_text, budget, errors, stage, order):
+        """One JSON-returning model call within the budget; None on any failure."""
+        if not budget.reserve():
+            return None
+        try:
+            response = self.get_response(level=level, messages=[{"role": "user", "content": prompt_text}])
+            budget.record(response)
+            content = response.choices[0].message.content
+        except Exception as e:
+            errors.append({"order": order, "stage": stage, "error_type": type(e).__name__, "message": str(e)})
+            return None
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            errors.append({"order": order, "stage": f"{stage}_parsing", "response": content, "error": str(e)})
+            return None
+
+    def _expand(self, prompt, node, expansions, budget, errors, level, index):
+        expansion_prompt = f"""Problem: {prompt}
+
+        Reasoning so far:
+        {self._format_path(node["path"])}
+
+        Propose {expansions} distinct next steps that continue this reasoning toward a complete solution.
+        Your output MUST be a JSON object containing a 'thoughts' key with an array of {expansions} strings.
+        {self.jsonify_prompt_s}"""
+        data = self._call(0, expansion_prompt, budget, errors, f"expansion_{level}_{index}", (level, 0, index))
+        thoughts = data.get('thoughts') if isinstance(data, dict) else data
+        if not isinstance(thoughts, list):
+            return []
+        return [{"path": node["path"] + [thought if isinstance(thought, str) else json.dumps(thought)]}
+                for thought in thoughts[:expansions]]
+
+    def _evaluate(self, prompt, candidate, budget, errors, level, index):
+        evaluation_prompt = f"""Problem: {prompt}
+
+        Partial solution:
+        {self._format_path(candidate["path"])}
+
+        Rate how likely this line of reasoning is to lead to a correct and complete solution.
+        Return a JSON object with 'score' (integer 0-10) and 'reason' (string).
+        {self.jsonify_prompt_s}"""
+        evaluator = 1 if len(self.depth_chart) > 1 else 0
+        data = self._call(evaluator, evaluation_prompt, budget, errors, f"evaluation_{level}_{index}", (level, 1, index))
+        score = data.get('score') if isinstance(data, dict) else None
+        if not isinstance(score, (int, float)) or isinstance(score, bool):
+            if data is not None:
+                errors.append({"order": (level, 1, index), "stage": f"evaluation_{level}_{index}",
+                               "error": "Missing or non-numeric score"})
+            return {**candidate, "score": None}
+        return {**candidate, "score": score, "reason": data.get('reason')}
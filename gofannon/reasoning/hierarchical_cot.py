@@ -1,5 +1,7 @@
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI, APIError
 from.base import ReasoningTool
 from ..config import FunctionRegistry
@@ -8,11 +10,16 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class HierarchicalCoT(ReasoningTool):
-    def __init__(self, depth_chart= None):
+    name = "hierarchical_cot"
+
+    def __init__(self, depth_chart= None, max_fan_out=8):
         super().__init__(depth_chart=depth_chart)
-        self.name = "hierarchical_cot"
         self.depth_chart = depth_chart or []
         self.error_context = []  # Track error locations
+        # Most sections expanded at once within one level of the outline.
+        self.max_fan_out = max_fan_out
+        # Seconds spent expanding each level of the last outline.
+        self.level_latency = []
 
     @property
     def definition(self):
@@ -41,6 +48,7 @@ class HierarchicalCoT(ReasoningTool):
 
     def fn(self, prompt, depth=2):
         self.error_context = []  # Reset error tracking
+        self.level_latency = []
         if depth > len(self.depth_chart):
             return {"error": f"Requested depth {depth} exceeds configured model levels {len(self.depth_chart)}"}
 
@@ -123,133 +131,163 @@ class HierarchicalCoT(ReasoningTool):
             return {"error": "Unexpected error during outline generation"}
 
     def _expand_sections(self, node, current_depth, max_depth, path=None):
+        """
+        Expand the outline level by level. Sibling sections don't depend on
+        each other, so every section at one depth is expanded concurrently
+        (at most ``max_fan_out`` calls at a time) before moving to the next
+        depth. Results are written back by position, so the structure is the
+        same as expanding one section at a time, and errors are recorded in
+        the same (depth-first) order.
+        """
         if path is None:
             path = []
-
-        current_path = path + [node.get('title', 'Untitled Section')]
-
-        if current_depth >= max_depth:
-            return node
-
-        if current_depth >= len(self.depth_chart):
-            self.error_context.append({
-                "stage": "depth_validation",
-                "current_depth": current_depth,
-                "max_configured_depth": len(self.depth_chart)-1
+        self.level_latency = []
+        expanded = node.copy()
+        # (node to fill in, its path of titles, its position in the tree)
+        frontier = [(expanded, path + [node.get('title', 'Untitled Section')], ())]
+        errors = []
+
+        for depth in range(current_depth, max_depth):
+            if depth >= len(self.depth_chart):
+                self._record_errors(errors)
+                self.error_context.append({
+                    "stage": "depth_validation",
+                    "current_depth": depth,
+                    "max_configured_depth": len(self.depth_chart)-1
+                })
+                raise ValueError("Current depth exceeds configured model depth chart")
+
+            jobs = [(parent, i, section, parent_path, position + (i,))
+                    for parent, parent_path, position in frontier
+                    for i, section in enumerate(parent.get('sections', []))]
+            logger.debug(f"Expanding {len(jobs)} sections at depth {depth}")
+            start_time = time.time()
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_fan_out, len(jobs)))) as pool:
+                futures = [pool.submit(self._expand_section, section, i, parent_path, depth, max_depth, errors, position)
+                           for parent, i, section, parent_path, position in jobs]
+                results = []
+                for (parent, _, _, _, position), future in zip(jobs, futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        errors.append((position, {
+                            "stage": f"section_expansion_depth_{depth}",
+                            "error_type": type(e).__name__,
+                            "message": str(e),
+                            "node": parent.get('title')[:100] if 'title' in parent else str(parent)[:100]
+                        }))
+                        self._record_errors(errors)
+                        raise
+            self.level_latency.append({
+                "depth": depth,
+                "sections": len(jobs),
+                "seconds": round(time.time() - start_time, 3),
             })
-            raise ValueError("Current depth exceeds configured model depth chart")
 
-        try:
-            client = self.create_openai_like_client(current_depth)
-            expanded = node.copy()
-
-            if 'sections' in node:
-                for i, section in enumerate(node['sections']):
-                    logger.debug(f"Expanding section {i+1}/{len(node['sections'])} at depth {current_depth}")
-
-                    next_depth = current_depth + 1
-                    is_final_depth = next_depth == max_depth
-
-                    # Generate appropriate prompt based on depth
-                    if is_final_depth:
-                        expansion_prompt = f"""Expand this section within the context of: {" -> ".join(current_path)}    
-                          
-                        Section to expand: {section['title']}      
-                        Current depth: {current_depth}/{max_depth}      
-                          
-                        Provide detailed content for this section. The content should be a concise explanation.  
-                        Your output should be a properly formatted JSON only with a 'content' field.   
-                        No preamble, explanations, or markdown ticks (```). """
-                    else:
-                        expansion_prompt = f"""Expand this section within the context of: {" -> ".join(current_path)}    
-                          
-                        Section to expand: {section['title']}      
-                        Current depth: {current_depth}/{max_depth}      
-                          
-                        Provide detailed sub-sections in JSON format with 'title' and 'sections'.    
-                        Your output should be a properly formatted JSON only. No preamble, explanations, or markdown ticks (```). """
-
-                    try:
-                        response = client.chat.completions.create(
-                            model=self.depth_chart[current_depth]['model_name'],
-                            messages=[{"role": "user", "content": expansion_prompt}],
-                            temperature=self.depth_chart[current_depth]['temperature']
-                        )
-                    except APIError as e:
-                        self.error_context.append({
-                            "stage": f"section_expansion_depth_{current_depth}",
-                            "section_index": i,
-                            "section_title": section.get('title'),
-                            "error_type": "APIError",
-                            "status_code": e.status_code,
-                            "message": e.message
-                        })
-                        continue
-
-                    if not response.choices:
-                        self.error_context.append({
-                            "stage": f"section_expansion_depth_{current_depth}",
-                            "section_index": i,
-                            "error": "Empty API response"
-                        })
-                        continue
+            next_frontier = []
+            for (parent, i, _, parent_path, position), expanded_section in zip(jobs, results):
+                if expanded_section is None:
+                    continue
+                if depth + 1 == max_depth:
+                    # Update section with content and remove subsections
+                    parent['sections'][i]['content'] = expanded_section['content']
+                    if 'sections' in parent['sections'][i]:
+                        del parent['sections'][i]['sections']
+                else:
+                    child = expanded_section.copy()
+                    parent['sections'][i] = child
+                    next_frontier.append((child, parent_path + [child.get('title', 'Untitled Section')], position))
+            frontier = next_frontier
+
+        self._record_errors(errors)
+        return expanded
+
+    def _record_errors(self, errors):
+        # Depth-first order of the tree positions, as a serial expansion would record them.
+        for _, error in sorted(errors, key=lambda item: item[0]):
+            self.error_context.append(error)
+        errors.clear()
+
+    def _expand_section(self, section, i, current_path, current_depth, max_depth, errors, position):
+        """Expand one section; returns the parsed JSON, or None after recording an error."""
+        next_depth = current_depth + 1
+        is_final_depth = next_depth == max_depth
+
+        # Generate appropriate prompt based on depth
+        if is_final_depth:
+            expansion_prompt = f"""Expand this section within the context of: {" -> ".join(current_path)}    
+              
+            Section to expand: {section['title']}      
+            Current depth: {current_depth}/{max_depth}      
+              
+            Provide detailed content for this section. The content should be a concise explanation.  
+            Your output should be a properly formatted JSON only with a 'content' field.   
+            No preamble, explanations, or markdown ticks (```). """
+        else:
+            expansion_prompt = f"""Expand this section within the context of: {" -> ".join(current_path)}    
+              
+            Section to expand: {section['title']}      
+            Current depth: {current_depth}/{max_depth}      
+              
+            Provide detailed sub-sections in JSON format with 'title' and 'sections'.    
+            Your output should be a properly formatted JSON only. No preamble, explanations, or markdown ticks (```). """
 
-                    try:
-                        expanded_section = json.loads(response.choices[0].message.content)
-                    except json.JSONDecodeError as e:
-                        self.error_context.append({
-                            "stage": f"section_parsing_depth_{current_depth}",
-                            "section_index": i,
-                            "response": response.choices[0].message.content,
-                            "error": str(e)
-                        })
-                        continue
-
-                        # Handle content generation for final depth
-                    if is_final_depth:
-                        if 'content' not in expanded_section:
-                            self.error_context.append({
-                                "stage": f"content_validation_depth_{current_depth}",
-                                "section_index": i,
-                                "response": expanded_section
-                            })
-                            continue
-
-                            # Update section with content and remove subsections
-                        expanded['sections'][i]['content'] = expanded_section['content']
-                        if 'sections' in expanded['sections'][i]:
-                            del expanded['sections'][i]['sections']
-                    else:
-                        # Validate section structure and recursively expand
-                        if not isinstance(expanded_section, dict) or 'title' not in expanded_section:
-                            self.error_context.append({
-                                "stage": f"section_validation_depth_{current_depth}",
-                                "section_index": i,
-                                "response_structure": type(expanded_section).__name__
-                            })
-                            continue
-
-                        expanded['sections'][i] = self._expand_sections(
-                            expanded_section,
-                            next_depth,
-                            max_depth,
-                            current_path
-                        )
-
-            return expanded
+        try:
+            response = self.get_response(current_depth, [{"role": "user", "content": expansion_prompt}])
+        except APIError as e:
+            errors.append((position, {
+                "stage": f"section_expansion_depth_{current_depth}",
+                "section_index": i,
+                "section_title": section.get('title'),
+                "error_type": "APIError",
+                "status_code": getattr(e, "status_code", None),
+                "message": e.message
+            }))
+            return None
 
-        except Exception as e:
-            self.error_context.append({
+        if not response.choices:
+            errors.append((position, {
                 "stage": f"section_expansion_depth_{current_depth}",
-                "error_type": type(e).__name__,
-                "message": str(e),
-                "node": node.get('title')[:100] if 'title' in node else str(node)[:100]
-            })
-            raise
+                "section_index": i,
+                "error": "Empty API response"
+            }))
+            return None
+
+        try:
+            expanded_section = json.loads(response.choices[0].message.content)
+        except json.JSONDecodeError as e:
+            errors.append((position, {
+                "stage": f"section_parsing_depth_{current_depth}",
+                "section_index": i,
+                "response": response.choices[0].message.content,
+                "error": str(e)
+            }))
+            return None
+
+            # Handle content generation for final depth
+        if is_final_depth:
+            if 'content' not in expanded_section:
+                errors.append((position, {
+                    "stage": f"content_validation_depth_{current_depth}",
+                    "section_index": i,
+                    "response": expanded_section
+                }))
+                return None
+        # Validate section structure before it is expanded further
+        elif not isinstance(expanded_section, dict) or 'title' not in expanded_section:
+            errors.append((position, {
+                "stage": f"section_validation_depth_{current_depth}",
+                "section_index": i,
+                "response_structure": type(expanded_section).__name__
+            }))
+            return None
+
+        return expanded_section
 
     def get_debug_info(self):
         return {
             "error_context": self.error_context,
+            "level_latency": self.level_latency,
             "depth_chart_config": self.depth_chart
         }
 
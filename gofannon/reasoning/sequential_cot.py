@@ -8,9 +8,10 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class SequentialCoT(ReasoningTool):
+    name = "sequential_cot"
+
     def __init__(self, depth_chart= None, steps= 5):
         super().__init__(depth_chart= depth_chart)
-        self.name = "sequential_cot"
         self.depth_chart = depth_chart or []
         self.steps = steps
 
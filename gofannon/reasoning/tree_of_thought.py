@@ -1,5 +1,7 @@
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI, APIError
 from .base import ReasoningTool
 from ..config import FunctionRegistry
@@ -8,10 +10,25 @@ logger = logging.getLogger(__name__)
 
 @FunctionRegistry.register
 class TreeOfThought(ReasoningTool):
-    def __init__(self, depth_chart= None):
+    """
+    Generates ``branches`` approaches with the level 0 model, then evaluates
+    every branch (level 1) and, for ``evaluation_depth`` > 1, analyses it
+    further (level 2). Branches are evaluated concurrently on up to
+    ``max_workers`` threads; a depth chart entry may set ``max_concurrency``
+    to cap the calls in flight to that level's model.
+
+    Each branch records its errors separately and they are appended to
+    ``error_context`` in branch order, so results and debug info are the
+    same as for a serial run.
+    """
+    name = "tree_of_thought"
+
+    def __init__(self, depth_chart= None, max_workers=8):
         super().__init__(depth_chart=depth_chart)
-        self.name = "tree_of_thought"
         self.depth_chart = depth_chart or []
+        self.max_workers = max_workers
+        self._level_slots = {}
+        self._level_slots_lock = threading.Lock()
 
     @property
     def definition(self):
@@ -73,11 +90,19 @@ class TreeOfThought(ReasoningTool):
                 return parsed_branches
 
                 # Evaluate and select best branches
-            evaluated = []
-            for i, branch in enumerate(parsed_branches.get('branches', [])):
-                evaluated_branch = self._evaluate_branch(branch, evaluation_depth, branch_index=i)
-                evaluated.append(evaluated_branch)
+            candidates = parsed_branches.get('branches', [])
+            branch_errors = [[] for _ in candidates]
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(candidates)))) as pool:
+                evaluated = list(pool.map(
+                    lambda i: self._evaluate_branch(candidates[i], evaluation_depth, branch_index=i,
+                                                    errors=branch_errors[i]),
+                    range(len(candidates))
+                ))
+            for errors in branch_errors:
+                self.error_context.extend(errors)
 
+            # sorted() is stable and ``evaluated`` is in branch order, so ties
+            # keep the order the branches were generated in.
             sorted_branches = sorted(evaluated, key=lambda x: x.get('score', 0), reverse=True)
 
             return {
@@ -156,7 +181,8 @@ class TreeOfThought(ReasoningTool):
             })
             return {"error": "Invalid API response structure"}
 
-    def _evaluate_branch(self, branch, depth, branch_index):
+    def _evaluate_branch(self, branch, depth, branch_index, errors=None):
+        errors = self.error_context if errors is None else errors
         try:
             evaluation_prompt = f"""Evaluate this solution approach:    
             {branch}    
@@ -168,7 +194,7 @@ class TreeOfThought(ReasoningTool):
             - next_steps (array)\n\n{self.jsonify_prompt_s}"""
 
             response = self._safe_get_response(1, [{"role": "user", "content": evaluation_prompt}],
-                                               f"branch_evaluation_{branch_index}")
+                                               f"branch_evaluation_{branch_index}", errors)
             if "error" in response:
                 return {**branch, "score": 0, "error": response["error"]}
 
@@ -177,7 +203,7 @@ class TreeOfThought(ReasoningTool):
                 if not isinstance(evaluation.get('score', 0), int):
                     raise ValueError("Score must be integer")
             except (json.JSONDecodeError, ValueError) as e:
-                self.error_context.append({
+                errors.append({
                     "stage": f"evaluation_parsing_{branch_index}",
                     "response": response.choices[0].message.content,
                     "error": str(e)
@@ -185,19 +211,20 @@ class TreeOfThought(ReasoningTool):
                 evaluation = {"score": 0, "error": str(e)}
 
             if depth > 1:
-                evaluation['deeper_analysis'] = self._deep_analysis(evaluation, branch_index)
+                evaluation['deeper_analysis'] = self._deep_analysis(evaluation, branch_index, errors)
 
             return {**branch, **evaluation}
 
         except Exception as e:
-            self.error_context.append({
+            errors.append({
                 "stage": f"branch_evaluation_{branch_index}",
                 "error_type": type(e).__name__,
                 "message": str(e)
             })
             return {**branch, "score": 0, "error": "Evaluation failed"}
 
-    def _deep_analysis(self, evaluation, branch_index):
+    def _deep_analysis(self, evaluation, branch_index, errors=None):
+        errors = self.error_context if errors is None else errors
         try:
             analysis_prompt = f"""Perform deep analysis on:    
             Strengths: {evaluation.get('strengths', [])}    
@@ -206,14 +233,14 @@ class TreeOfThought(ReasoningTool):
             Provide concrete examples and mitigation strategies in JSON format.\n\n{self.jsonify_prompt_s}"""
 
             response = self._safe_get_response(2, [{"role": "user", "content": analysis_prompt}],
-                                               f"deep_analysis_{branch_index}")
+                                               f"deep_analysis_{branch_index}", errors)
             if "error" in response:
                 return {"error": response["error"]}
 
             try:
                 return json.loads(response.choices[0].message.content)
             except json.JSONDecodeError as e:
-                self.error_context.append({
+                errors.append({
                     "stage": f"deep_analysis_parsing_{branch_index}",
                     "response": response.choices[0].message.content,
                     "error": str(e)
@@ -221,36 +248,47 @@ class TreeOfThought(ReasoningTool):
                 return {"error": "Deep analysis parsing failed"}
 
         except Exception as e:
-            self.error_context.append({
+            errors.append({
                 "stage": f"deep_analysis_{branch_index}",
                 "error_type": type(e).__name__,
                 "message": str(e)
             })
             return {"error": "Deep analysis failed"}
 
-    def _safe_get_response(self, level, messages, context_stage):
+    def _slots(self, level):
+        """Semaphore capping concurrent calls to the model at ``level``."""
+        with self._level_slots_lock:
+            slots = self._level_slots.get(level)
+            if slots is None:
+                limit = self.depth_chart[level].get('max_concurrency') or self.max_workers
+                slots = self._level_slots[level] = threading.BoundedSemaphore(limit)
+            return slots
+
+    def _safe_get_response(self, level, messages, context_stage, errors=None):
+        errors = self.error_context if errors is None else errors
         try:
             if level >= len(self.depth_chart):
                 error_msg = f"Level {level} not configured in depth_chart"
-                self.error_context.append({
+                errors.append({
                     "stage": context_stage,
                     "error": error_msg
                 })
                 return {"error": error_msg}
 
-            return self.get_response(level=level, messages=messages)
+            with self._slots(level):
+                return self.get_response(level=level, messages=messages)
         except APIError as e:
-            self.error_context.append({
+            errors.append({
                 "stage": context_stage,
                 "error_type": "APIError",
-                "status_code": e.status_code,
+                "status_code": getattr(e, "status_code", None),
                 "message": e.message
             })
             return {"error": f"API Error: {e.message}"}
         except Exception as e:
-            self.error_context.append({
+            errors.append({
                 "stage": context_stage,
                 "error_type": type(e).__name__,
                 "message": str(e)
             })
-            return {"error": str(e)}
\ No newline at end of file
+            return {"error": str(e)}
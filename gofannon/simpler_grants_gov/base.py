@@ -15,6 +15,11 @@ class SimplerGrantsGovBase(BaseTool):
     Handles common setup like API key and base URL management, and provides
     a helper method for making authenticated requests.
     """
+    # Every endpoint used by these tools is a read, including the POST searches.
+    cache_ttl = 60 * 60
+    # Shares one pooled session and rate limiter (see base/rate_limit.py).
+    API_SERVICE = 'simpler_grants'
+
     def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, **kwargs):
         super().__init__(**kwargs)
         self.api_key = api_key or ToolConfig.get("simpler_grants_api_key")
@@ -80,7 +85,7 @@ class SimplerGrantsGovBase(BaseTool):
 
 
         try:
-            response = requests.request(
+            response = self.http_session.request(
                 method,
                 full_url,
                 headers=headers,
@@ -116,6 +121,14 @@ class SimplerGrantsGovBase(BaseTool):
             raise # Re-raise for BaseTool's error handling
 
 
+    def _should_cache(self, result):
+        # Tools report failures as a JSON string with an "error" key.
+        try:
+            parsed = json.loads(result)
+        except (TypeError, ValueError):
+            return bool(result)
+        return not (isinstance(parsed, dict) and "error" in parsed)
+
     # Subclasses must implement definition and fn
     @property
     def definition(self):
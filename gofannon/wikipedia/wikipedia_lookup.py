@@ -1,7 +1,6 @@
 from ..base import BaseTool
 from ..config import FunctionRegistry
 import logging  
-import requests
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +33,8 @@ Returns:
 
 @FunctionRegistry.register
 class WikipediaLookup(BaseTool):
+    cache_ttl = 24 * 60 * 60
+
     def __init__(self, name='wikipedia_lookup'):
         super().__init__()
         self.name = name
@@ -58,11 +59,23 @@ class WikipediaLookup(BaseTool):
             }
         }
     
+    @staticmethod
+    def _summary_url(query):
+        base_url = "https://en.wikipedia.org/api/rest_v1/page/summary/"
+        return base_url + query.replace(" ", "_")
+
     def fn(self, query):
         logger.debug(f"Fetching Wikipedia summary for: {query}")
-        base_url = "https://en.wikipedia.org/api/rest_v1/page/summary/"
-        response = requests.get(base_url + query.replace(" ", "_"))
+        response = self.http_session.get(self._summary_url(query))
+        return self._format_summary(query, response)
+
+    async def afn(self, query):
+        logger.debug(f"Fetching Wikipedia summary for: {query}")
+        response = await self.async_http_client.get(self._summary_url(query))
+        return self._format_summary(query, response)
 
+    @staticmethod
+    def _format_summary(query, response):
         if response.status_code == 200:
             data = response.json()
             return {
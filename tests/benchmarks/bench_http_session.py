@@ -0,0 +1,106 @@
+"""
+Connection-reuse benchmark for the pooled HTTP session layer.
+
+Starts a local keep-alive HTTP server (optionally with TLS, using a throwaway
+self-signed certificate generated with ``openssl``) and compares
+``requests.get`` - a new connection per call, which is what the tools used to
+do - with ``gofannon.base.http.get_session().get``. Both are run sequentially
+and from a small thread pool.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_http_session.py --requests 500 --tls
+"""
+import argparse
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+import urllib3
+
+from gofannon.base.http import configure_http, get_session
+
+BODY = b'{"title": "Stand-in", "extract": "' + b"x" * 1024 + b'"}'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(tls, workdir):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    scheme = "http"
+    if tls:
+        cert, key = Path(workdir) / "cert.pem", Path(workdir) / "key.pem"
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+             "-subj", "/CN=127.0.0.1", "-keyout", str(key), "-out", str(cert)],
+            check=True, capture_output=True,
+        )
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"{scheme}://127.0.0.1:{httpd.server_address[1]}/summary"
+
+
+def timed(label, fetch, url, count, workers):
+    start = time.perf_counter()
+    if workers == 1:
+        for _ in range(count):
+            fetch(url).raise_for_status()
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for response in pool.map(lambda _: fetch(url), range(count)):
+                response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms total  {elapsed / count * 1000:7.2f} ms/request")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--tls", action="store_true", help="serve over HTTPS to include handshake cost")
+    args = parser.parse_args()
+
+    urllib3.disable_warnings()
+    configure_http(pool_maxsize=args.workers)
+    session = get_session()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        httpd, url = start_server(args.tls, workdir)
+        try:
+            for workers in (1, args.workers):
+                print(f"-- {args.requests} requests, {workers} worker(s), {'https' if args.tls else 'http'}")
+                before = timed("requests.get (no reuse)", lambda u: requests.get(u, verify=False), url,
+                               args.requests, workers)
+                after = timed("pooled session", lambda u: session.get(u, verify=False), url,
+                              args.requests, workers)
+                print(f"{'speed-up':<28} {before / after:9.1f}x")
+        finally:
+            httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Startup benchmark for FunctionRegistry.
+
+Measures the wall time of ``import gofannon``, importing every tool module
+(which registers each tool) and calling ``FunctionRegistry.get_tools()``,
+in a fresh interpreter per run. The "before" numbers patch in the previous
+registry, which instantiated every tool on registration and again on every
+``get_tools()`` call.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_registry_startup.py --runs 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = r'''
+import importlib, json, logging, pkgutil, sys, time
+
+legacy = sys.argv[1] == "before"
+get_tools_calls = int(sys.argv[2])
+
+start = time.perf_counter()
+import gofannon
+from gofannon.config import FunctionRegistry
+
+if legacy:
+    def register(cls, tool_class):
+        cls._tools[tool_class().definition['function']['name']] = tool_class
+        return tool_class
+
+    def get_tools(cls):
+        return [cls._tools[name]().definition for name in cls._tools]
+
+    FunctionRegistry.register = classmethod(register)
+    FunctionRegistry.get_tools = classmethod(get_tools)
+
+logging.disable(logging.CRITICAL)
+skipped = []
+for module in pkgutil.walk_packages(gofannon.__path__, "gofannon."):
+    try:
+        importlib.import_module(module.name)
+    except Exception as e:
+        skipped.append(module.name)
+imported = time.perf_counter()
+
+for _ in range(get_tools_calls):
+    tools = FunctionRegistry.get_tools()
+done = time.perf_counter()
+
+print(json.dumps({
+    "import_s": imported - start,
+    "get_tools_s": done - imported,
+    "tools": len(tools),
+    "skipped": skipped,
+}))
+'''
+
+
+def run(mode, get_tools_calls):
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, mode, str(get_tools_calls)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--get-tools-calls", type=int, default=10,
+                        help="get_tools() calls per run (e.g. one per orchestrator)")
+    args = parser.parse_args()
+
+    for mode in ("before", "after"):
+        results = [run(mode, args.get_tools_calls) for _ in range(args.runs)]
+        import_s = statistics.median(r["import_s"] for r in results)
+        get_tools_s = statistics.median(r["get_tools_s"] for r in results)
+        print(f"{mode:>6}: import+register {import_s * 1000:8.1f} ms | "
+              f"{args.get_tools_calls} x get_tools() {get_tools_s * 1000:8.2f} ms | "
+              f"{results[0]['tools']} tools")
+        if results[0]["skipped"]:
+            print(f"        skipped (missing deps): {', '.join(results[0]['skipped'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Branch-evaluation benchmark for TreeOfThought.
+
+Runs ``TreeOfThought.fn`` against a local fake OpenAI server that takes
+``--latency`` seconds per completion, for an increasing number of branches,
+once with ``max_workers=1`` (the old one-branch-at-a-time loop) and once with
+the default pool. Serial wall time grows with ``branches``; concurrent wall
+time stays roughly constant (three model round trips).
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_tree_of_thought.py --latency 0.2
+"""
+import argparse
+import json
+import time
+
+from fake_openai import depth_chart, start_fake_openai
+from gofannon.reasoning.tree_of_thought import TreeOfThought
+
+
+def reply(messages):
+    prompt = messages[-1]["content"]
+    if "distinct approaches" in prompt:
+        count = int(prompt.split("Generate ")[1].split(" ")[0])
+        return json.dumps({"branches": [f"Approach {i}" for i in range(count)]})
+    if "Evaluate this solution" in prompt:
+        return json.dumps({"score": len(prompt) % 10, "strengths": ["s"], "weaknesses": ["w"], "next_steps": []})
+    return json.dumps({"examples": [], "mitigations": []})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per fake completion")
+    parser.add_argument("--branches", type=int, nargs="+", default=[2, 4, 8, 16])
+    args = parser.parse_args()
+
+    server, base_url = start_fake_openai(reply, latency=args.latency)
+    try:
+        print(f"{'branches':>8} {'serial':>10} {'concurrent':>11} {'speed-up':>9}")
+        for branches in args.branches:
+            timings = []
+            for max_workers in (1, max(args.branches)):
+                tool = TreeOfThought(depth_chart=depth_chart(base_url), max_workers=max_workers)
+                start = time.perf_counter()
+                result = tool.fn("How should we cache completions?", branches=branches, evaluation_depth=2)
+                timings.append(time.perf_counter() - start)
+                assert len(result["all_branches"]) == branches, result
+            print(f"{branches:>8} {timings[0]:>9.2f}s {timings[1]:>10.2f}s {timings[0] / timings[1]:>8.1f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+A local stand-in for an OpenAI-compatible chat completions endpoint, used by
+the reasoning benchmarks. Every request sleeps ``latency`` seconds (to stand
+in for model time) and is answered by ``reply(messages)``, a function
+returning the assistant message text.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def start_fake_openai(reply, latency=0.2):
+    """Start the server in a thread; returns ``(server, base_url)``."""
+    stats = {"requests": 0, "connections": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            with lock:
+                stats["connections"] += 1
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(latency)
+            with lock:
+                stats["requests"] += 1
+            payload = json.dumps({
+                "id": "chatcmpl-fake", "object": "chat.completion", "created": int(time.time()),
+                "model": body.get("model", "fake"),
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": reply(body["messages"])}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.stats = stats
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def depth_chart(base_url, levels=3, **extra):
+    return [dict({'model_name': "fake-model", 'base_url': base_url, 'api_key': "fake",
+                  'temperature': 0.0}, **extra) for _ in range(levels)]
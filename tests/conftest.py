@@ -0,0 +1,13 @@
+import pytest
+
+from gofannon.base import http, rate_limit
+
+
+@pytest.fixture(autouse=True)
+def no_http_backoff():
+    """Retry mocked 5xx responses without sleeping between attempts."""
+    defaults = dict(http._http_config)
+    http.configure_http(backoff_factor=0)
+    yield
+    http.configure_http(**defaults)
+    rate_limit.reset_rate_limiters()
@@ -26,3 +26,54 @@ def test_clone_repo_invalid_url():
 
     assert isinstance(result, str)
     assert "Error cloning repository" in result or "Unexpected error" in result
+
+
+@pytest.fixture
+def source_repo(tmp_path):
+    import git
+    path = tmp_path / "source"
+    repo = git.Repo.init(path)
+    repo.git.config("user.email", "test@example.com")
+    repo.git.config("user.name", "Test")
+    repo.git.config("uploadpack.allowfilter", "true")
+    for index in range(3):
+        for directory in ("src", "docs"):
+            (path / directory).mkdir(exist_ok=True)
+            (path / directory / f"file{index}.txt").write_text(f"{directory} {index}\n")
+        repo.git.add(A=True)
+        repo.git.commit(m=f"commit {index}")
+    return path
+
+
+def test_clone_repo_shallow_sparse(source_repo, tmp_path):
+    import git
+    target = tmp_path / "clone"
+    result = CloneRepo().fn(repo_url=source_repo.as_uri(), local_dir=str(target),
+                            depth=1, single_branch=True, blobless=True, sparse_paths=["src"])
+
+    assert "Repository cloned successfully" in result
+    repo = git.Repo(target)
+    assert int(repo.git.rev_list("--count", "HEAD")) == 1
+    assert (target / "src" / "file2.txt").exists()
+    assert not (target / "docs").exists()
+    assert repo.git.config("remote.origin.partialclonefilter") == "blob:none"
+
+
+def test_clone_repo_mirror_cache(source_repo, tmp_path):
+    import git
+    tool = CloneRepo(mirror_dir=tmp_path / "mirrors")
+    first = tmp_path / "first"
+    assert "successfully" in tool.fn(repo_url=source_repo.as_uri(), local_dir=str(first))
+    mirrors = list((tmp_path / "mirrors").iterdir())
+    assert len(mirrors) == 1
+    assert (first / ".git" / "objects" / "info" / "alternates").read_text().strip().startswith(str(mirrors[0]))
+
+    # A new commit upstream is fetched into the mirror before the next clone.
+    source = git.Repo(source_repo)
+    (source_repo / "new.txt").write_text("new\n")
+    source.git.add(A=True)
+    source.git.commit(m="new")
+    second = tmp_path / "second"
+    assert "successfully" in tool.fn(repo_url=source_repo.as_uri(), local_dir=str(second))
+    assert (second / "new.txt").exists()
+    assert git.Repo(mirrors[0]).commit("HEAD").hexsha == source.head.commit.hexsha
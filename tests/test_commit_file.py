@@ -0,0 +1,119 @@
+import base64
+
+import pytest
+import requests_mock
+
+from gofannon.github.commit_file import CommitFile
+
+API = "https://api.github.com/repos/octo/demo"
+
+
+def mock_git_data(mock, branch_status=200):
+    if branch_status == 200:
+        mock.get(f"{API}/git/ref/heads/feature", json={"object": {"sha": "parent"}})
+    else:
+        mock.get(f"{API}/git/ref/heads/feature", status_code=404)
+        mock.get(f"{API}/git/ref/heads/main", json={"object": {"sha": "parent"}})
+    mock.get(f"{API}/git/commits/parent", json={"sha": "parent", "tree": {"sha": "base-tree"}})
+    mock.get(f"{API}/git/trees/base-tree?recursive=1", json={"truncated": False, "tree": [
+        {"path": "bin", "mode": "040000", "type": "tree", "sha": "bin-tree"},
+        {"path": "bin/run.sh", "mode": "100755", "type": "blob", "sha": "old-run"},
+        {"path": "latest", "mode": "120000", "type": "blob", "sha": "old-link"},
+    ]})
+    mock.post(f"{API}/git/blobs", status_code=201,
+              json=lambda request, context: {"sha": "blob-" + base64.b64decode(request.json()["content"]).decode()})
+    mock.post(f"{API}/git/trees", status_code=201, json={"sha": "new-tree"})
+    mock.post(f"{API}/git/commits", status_code=201, json={"sha": "new-commit"})
+    mock.patch(f"{API}/git/refs/heads/feature", json={"object": {"sha": "new-commit"}})
+    mock.post(f"{API}/git/refs", status_code=201, json={"object": {"sha": "new-commit"}})
+
+
+def test_batch_commit_builds_one_tree_and_commit():
+    with requests_mock.Mocker() as mock:
+        mock_git_data(mock)
+        result = CommitFile(api_key="t").fn(
+            "octo", "demo", commit_message="Add files", branch="feature",
+            files=[{"path": f"f{index}.txt", "content": f"c{index}"} for index in range(5)]
+                  + [{"path": "old.txt", "content": None}],
+        )
+
+    assert result["sha"] == "new-commit"
+    methods = [(request.method, request.path) for request in mock.request_history]
+    assert methods.count(("POST", "/repos/octo/demo/git/blobs")) == 5
+    assert methods[-3:] == [("POST", "/repos/octo/demo/git/trees"),
+                            ("POST", "/repos/octo/demo/git/commits"),
+                            ("PATCH", "/repos/octo/demo/git/refs/heads/feature")]
+
+    tree_request, commit_request, ref_request = mock.request_history[-3:]
+    assert tree_request.json() == {
+        "base_tree": "base-tree",
+        "tree": [{"path": f"f{index}.txt", "mode": "100644", "type": "blob", "sha": f"blob-c{index}"}
+                 for index in range(5)]
+                + [{"path": "old.txt", "mode": "100644", "type": "blob", "sha": None}],
+    }
+    assert commit_request.json() == {"message": "Add files", "tree": "new-tree", "parents": ["parent"]}
+    assert ref_request.json() == {"sha": "new-commit", "force": False}
+
+
+def test_batch_commit_creates_missing_branch_at_the_new_commit():
+    with requests_mock.Mocker() as mock:
+        mock_git_data(mock, branch_status=404)
+        CommitFile(api_key="t").commit_files("octo", "demo", {"a.txt": "a"}, "Add a", "feature")
+
+    ref_request = mock.request_history[-1]
+    assert (ref_request.method, ref_request.path) == ("POST", "/repos/octo/demo/git/refs")
+    assert ref_request.json() == {"ref": "refs/heads/feature", "sha": "new-commit"}
+
+
+def test_batch_commit_rejected_when_branch_moved():
+    with requests_mock.Mocker() as mock:
+        mock_git_data(mock)
+        mock.patch(f"{API}/git/refs/heads/feature", status_code=422, text="Update is not a fast forward")
+        with pytest.raises(Exception, match="not a fast forward"):
+            CommitFile(api_key="t").commit_files("octo", "demo", {"a.txt": "a"}, "Add a", "feature")
+
+
+def test_batch_commit_keeps_modes_of_existing_files():
+    with requests_mock.Mocker() as mock:
+        mock_git_data(mock)
+        CommitFile(api_key="t").commit_files("octo", "demo", [
+            {"path": "bin/run.sh", "content": "#!/bin/sh\necho hi\n"},
+            {"path": "latest", "content": "v2"},
+            {"path": "new.txt", "content": "new"},
+            {"path": "tool.py", "content": "print()", "mode": "100755"},
+        ], "Update", "feature")
+
+    tree_request = next(request for request in mock.request_history
+                        if (request.method, request.path) == ("POST", "/repos/octo/demo/git/trees"))
+    assert {entry["path"]: entry["mode"] for entry in tree_request.json()["tree"]} == {
+        "bin/run.sh": "100755", "latest": "120000", "new.txt": "100644", "tool.py": "100755"}
+
+
+def test_batch_commit_finds_modes_when_the_tree_is_truncated():
+    with requests_mock.Mocker() as mock:
+        mock_git_data(mock)
+        mock.get(f"{API}/git/trees/base-tree?recursive=1", json={"truncated": True, "tree": []})
+        mock.get(f"{API}/git/trees/base-tree", complete_qs=True,
+                 json={"tree": [{"path": "bin", "mode": "040000", "type": "tree", "sha": "bin-tree"}]})
+        mock.get(f"{API}/git/trees/bin-tree", json={"tree": [
+            {"path": "run.sh", "mode": "100755", "type": "blob", "sha": "old-run"}]})
+        CommitFile(api_key="t").commit_files("octo", "demo", {"bin/run.sh": "x", "bin/new.sh": "y"},
+                                             "Update", "feature")
+
+    tree_request = next(request for request in mock.request_history
+                        if (request.method, request.path) == ("POST", "/repos/octo/demo/git/trees"))
+    assert {entry["path"]: entry["mode"] for entry in tree_request.json()["tree"]} == {
+        "bin/run.sh": "100755", "bin/new.sh": "100644"}
+
+
+def test_single_file_commit():
+    with requests_mock.Mocker() as mock:
+        mock.get(f"{API}/git/ref/heads/feature", json={"object": {"sha": "parent"}})
+        mock.get(f"{API}/contents/a.txt", status_code=404)
+        mock.put(f"{API}/contents/a.txt", status_code=201, json={"commit": {"sha": "c1"}})
+        result = CommitFile(api_key="t").fn("octo", "demo", "a.txt", "hello", "Add a", "feature")
+
+    assert result == {"commit": {"sha": "c1"}}
+    assert mock.request_history[-1].json() == {
+        "message": "Add a", "branch": "feature", "content": base64.b64encode(b"hello").decode()
+    }
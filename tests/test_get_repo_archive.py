@@ -0,0 +1,53 @@
+import io
+import tarfile
+
+import requests_mock
+
+from gofannon.github.get_repo_archive import GetRepoArchive
+
+ARCHIVE_URL = "https://api.github.com/repos/octo/demo/tarball"
+
+
+def make_tarball(files):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for path, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(f"octo-demo-abc123/{path}")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+TARBALL = make_tarball({
+    "README.md": "# Demo",
+    "logo.png": "not really a png",
+    "src/app.py": "print('app')",
+    "src/big.py": "x" * 200,
+    "src/util.py": "def util(): pass",
+})
+
+
+def test_reads_matching_files_from_one_archive_request():
+    with requests_mock.Mocker() as mock:
+        mock.get(ARCHIVE_URL, content=TARBALL)
+        result = GetRepoArchive(api_key="t", max_file_bytes=100).fn("https://github.com/octo/demo")
+
+    assert mock.call_count == 1
+    assert result == (
+        "README.md\n```markdown\n# Demo\n```\n\n"
+        "src/app.py\n```python\nprint('app')\n```\n\n"
+        "src/util.py\n```python\ndef util(): pass\n```"
+    )
+
+
+def test_filters_and_budget_while_streaming():
+    with requests_mock.Mocker() as mock:
+        mock.get(ARCHIVE_URL + "/v1.0", content=TARBALL)
+        tool = GetRepoArchive(api_key="t")
+        files = list(tool.iter_files("https://github.com/octo/demo", directory_path="src", branch="v1.0", max_files=2))
+        result = tool.fn("https://github.com/octo/demo", directory_path="src", branch="v1.0", max_bytes=220)
+
+    assert files == [("src/app.py", "python", "print('app')"), ("src/big.py", "python", "x" * 200)]
+    assert "src/util.py" not in result
+    assert result.endswith("[More files omitted: max_files/max_bytes budget reached]")
@@ -0,0 +1,61 @@
+import requests_mock
+
+from gofannon.github.get_repo_contents import GetRepoContents
+
+TREE_URL = "https://api.github.com/repos/octo/demo/git/trees/HEAD?recursive=1"
+BLOB_URL = "https://api.github.com/repos/octo/demo/git/blobs/"
+
+TREE = {
+    "truncated": False,
+    "tree": [
+        {"path": "README.md", "type": "blob", "sha": "r1", "size": 10},
+        {"path": "logo.png", "type": "blob", "sha": "p1", "size": 5000},
+        {"path": "src", "type": "tree", "sha": "t1"},
+        {"path": "src/app.py", "type": "blob", "sha": "a1", "size": 20},
+        {"path": "src/util.py", "type": "blob", "sha": "u1", "size": 30},
+    ],
+}
+BLOBS = {"r1": "# Demo", "a1": "print('app')", "u1": "def util(): pass"}
+
+
+def mock_repo(mock):
+    mock.get(TREE_URL, json=TREE)
+    for sha, content in BLOBS.items():
+        mock.get(BLOB_URL + sha, text=content)
+
+
+def test_reads_matching_files_from_one_tree_call():
+    with requests_mock.Mocker() as mock:
+        mock_repo(mock)
+        result = GetRepoContents(api_key="t").fn("https://github.com/octo/demo")
+
+    assert result == (
+        "README.md\n```markdown\n# Demo\n```\n\n"
+        "src/app.py\n```python\nprint('app')\n```\n\n"
+        "src/util.py\n```python\ndef util(): pass\n```"
+    )
+    # one tree call plus one call per matching blob; the png is never downloaded
+    assert mock.call_count == 4
+    assert not any(request.url.endswith("/p1") for request in mock.request_history)
+
+
+def test_directory_and_budget_filters():
+    with requests_mock.Mocker() as mock:
+        mock_repo(mock)
+        tool = GetRepoContents(api_key="t")
+        result = tool.fn("https://github.com/octo/demo", directory_path="/src/", max_bytes=25)
+
+    assert result.startswith("src/app.py\n")
+    assert "util.py" not in result
+    assert result.endswith("[1 more files omitted: max_files/max_bytes budget reached]")
+
+
+def test_iter_files_streams_each_file():
+    with requests_mock.Mocker() as mock:
+        mock_repo(mock)
+        files = list(GetRepoContents(api_key="t").iter_files("https://github.com/octo/demo", max_files=2))
+
+    assert sorted(files) == [
+        ("README.md", "markdown", "# Demo"),
+        ("src/app.py", "python", "print('app')"),
+    ]
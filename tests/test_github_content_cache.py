@@ -0,0 +1,78 @@
+import base64
+
+import pytest
+import requests_mock
+
+from gofannon.github.content_cache import ContentCache
+from gofannon.github.get_repo_contents import GetRepoContents
+from gofannon.github.list_repo_files import ListRepoFiles
+from gofannon.github.read_file import ReadFile
+
+API = "https://api.github.com/repos/octo/demo"
+SHA1 = "1" * 40
+SHA2 = "2" * 40
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ContentCache(tmp_path / "content.sqlite")
+
+
+def mock_ref(mock, ref, sha):
+    mock.get(f"{API}/commits/{ref}", text=sha, request_headers={"Accept": "application/vnd.github.sha"})
+
+
+def test_read_file_caches_by_commit(cache, tmp_path):
+    with requests_mock.Mocker() as mock:
+        mock_ref(mock, "main", SHA1)
+        mock.get(f"{API}/contents/README.md?ref={SHA1}",
+                 json={"content": base64.b64encode(b"hello").decode(), "encoding": "base64"})
+        tool = ReadFile(api_key="t", content_cache=cache)
+
+        assert tool.fn("https://github.com/octo/demo", "README.md", branch="main") == "hello"
+        assert mock.call_count == 2
+        # The ref resolution is still fresh and the file is cached: no requests.
+        assert tool.fn("https://github.com/octo/demo", "README.md", branch="main") == "hello"
+        assert tool.fn("https://github.com/octo/demo", "README.md", branch=SHA1) == "hello"
+        assert mock.call_count == 2
+
+        # A new process re-resolves the ref, but reads the file from disk.
+        tool = ReadFile(api_key="t", content_cache=ContentCache(tmp_path / "content.sqlite"))
+        assert tool.fn("https://github.com/octo/demo", "README.md", branch="main") == "hello"
+        assert mock.call_count == 3
+
+
+def test_get_repo_contents_only_downloads_changed_blobs(cache):
+    def tree(readme_sha):
+        return {"truncated": False, "tree": [
+            {"path": "README.md", "type": "blob", "sha": readme_sha, "size": 5},
+            {"path": "app.py", "type": "blob", "sha": "a1", "size": 5},
+        ]}
+
+    with requests_mock.Mocker() as mock:
+        mock_ref(mock, "HEAD", SHA1)
+        mock.get(f"{API}/git/trees/{SHA1}?recursive=1", json=tree("r1"))
+        mock.get(f"{API}/git/blobs/r1", text="# v1")
+        mock.get(f"{API}/git/blobs/a1", text="app")
+        tool = GetRepoContents(api_key="t", content_cache=cache)
+        first = tool.fn("https://github.com/octo/demo")
+        assert tool.fn("https://github.com/octo/demo") == first
+        assert mock.call_count == 4
+
+        mock_ref(mock, "main", SHA2)
+        mock.get(f"{API}/git/trees/{SHA2}?recursive=1", json=tree("r2"))
+        mock.get(f"{API}/git/blobs/r2", text="# v2")
+        mock.reset_mock()
+        assert "# v2" in tool.fn("https://github.com/octo/demo", branch="main")
+        assert [request.path.rsplit("/", 1)[-1] for request in mock.request_history] == ["main", SHA2, "r2"]
+
+
+def test_list_repo_files_resolves_the_ref_once(cache):
+    with requests_mock.Mocker() as mock:
+        mock_ref(mock, "HEAD", SHA1)
+        mock.get(f"{API}/git/trees/{SHA1}?recursive=1", json={"truncated": False, "tree": [
+            {"path": "README.md", "type": "blob", "sha": "r1"}]})
+        tool = ListRepoFiles(api_key="t", content_cache=cache)
+        assert tool.fn("https://github.com/octo/demo", compact=True) == '["README.md"]'
+        assert tool.fn("https://github.com/octo/demo", compact=True) == '["README.md"]'
+        assert mock.call_count == 2
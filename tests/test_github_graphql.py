@@ -0,0 +1,84 @@
+import json
+import re
+
+import requests_mock
+
+from gofannon.github.graphql import GRAPHQL_URL, GraphQLBatchReader, split_diff
+from gofannon.github.read_file import ReadFile
+from gofannon.github.read_issue import ReadIssue
+
+
+def issue_node(number):
+    return {
+        "number": number, "title": f"Issue {number}", "body": "", "state": "OPEN",
+        "createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z",
+        "url": f"https://github.com/o/r/issues/{number}", "author": {"login": "octo"},
+        "labels": {"nodes": [{"name": "bug"}]},
+        "comments": {"totalCount": 1, "nodes": [{"author": None, "body": "hi", "createdAt": "x", "url": "y"}]},
+    }
+
+
+def graphql_callback(request, context):
+    body = request.json()
+    aliases = re.findall(r"(i\d+): issue\(number: (\d+)\)", body["query"])
+    data = {alias: (issue_node(int(number)) if int(number) != 99 else None) for alias, number in aliases}
+    for name, expression in body["variables"].items():
+        if name.startswith("e"):
+            path = expression.split(":", 1)[1]
+            data["f" + name[1:]] = None if path == "missing.txt" else {
+                "text": f"text of {path} at {expression.split(':')[0]}", "isBinary": False, "isTruncated": False}
+    return json.dumps({"data": {"repository": data}})
+
+
+def test_get_issues_chunks_aliased_queries():
+    with requests_mock.Mocker() as mock:
+        mock.post(GRAPHQL_URL, text=graphql_callback)
+        issues = GraphQLBatchReader("t", chunk_size=2).get_issues("o", "r", [1, 2, 99])
+
+    assert mock.call_count == 2
+    assert issues[1]["issue"]["labels"] == ["bug"]
+    assert issues[2]["issue"]["author"] == "octo"
+    assert issues[2]["comments"][0]["body"] == "hi"
+    assert issues[99] is None
+
+
+def test_read_tools_batch_methods_go_through_graphql():
+    with requests_mock.Mocker() as mock:
+        mock.post(GRAPHQL_URL, text=graphql_callback)
+        files = ReadFile(api_key="t").read_files("https://github.com/o/r", ["a.py", "missing.txt"], branch="dev")
+        issues = ReadIssue(api_key="t").read_issues("https://github.com/o/r", [3, 4])
+
+    assert mock.call_count == 2
+    assert files == {"a.py": "text of a.py at dev", "missing.txt": None}
+    # variables carry the expressions; paths never end up in the query text
+    assert "a.py" not in mock.request_history[0].json()["query"]
+    assert [issues[number]["issue"]["number"] for number in (3, 4)] == [3, 4]
+
+
+def test_get_pull_request_files_with_diffs():
+    pr_page = {"data": {"repository": {"pullRequest": {
+        "headRefOid": "abc",
+        "files": {"pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": [
+            {"path": "src/a.py", "additions": 1, "deletions": 0, "changeType": "MODIFIED"},
+            {"path": "old.txt", "additions": 0, "deletions": 1, "changeType": "DELETED"},
+        ]}}}}}
+    diff = ("diff --git a/src/a.py b/src/a.py\nindex 1..2 100644\n--- a/src/a.py\n+++ b/src/a.py\n"
+            "@@ -1 +1,2 @@\n x\n+y\n"
+            "diff --git a/old.txt b/old.txt\ndeleted file mode 100644\n--- a/old.txt\n+++ /dev/null\n"
+            "@@ -1 +0,0 @@\n-gone\n")
+
+    def callback(request, context):
+        if "pullRequest" in request.json()["query"]:
+            return json.dumps(pr_page)
+        return graphql_callback(request, context)
+
+    with requests_mock.Mocker() as mock:
+        mock.post(GRAPHQL_URL, text=callback)
+        mock.get("https://api.github.com/repos/o/r/pulls/7", text=diff)
+        files = GraphQLBatchReader("t").get_pull_request_files("o", "r", 7)
+
+    assert mock.call_count == 3
+    assert files[0]["patch"] == "@@ -1 +1,2 @@\n x\n+y"
+    assert files[0]["content"] == "text of src/a.py at abc"
+    assert files[1]["change_type"] == "deleted" and files[1]["content"] is None
+    assert split_diff(diff)["old.txt"] == "@@ -1 +0,0 @@\n-gone"
@@ -1,12 +1,15 @@
+import json
 import pytest
+import requests_mock
 from unittest.mock import patch, MagicMock
+from gofannon.base.cache import MemoryCache
 from gofannon.github.list_issues import ListIssues
 from requests.exceptions import HTTPError
 
-# Check where the requests.get is imported in the module
+# Requests go through the pooled session from gofannon.base.http
 def test_list_issues_success():
-    # Patch at the exact point where requests.get is used in your code
-    with patch('gofannon.github.list_issues.get') as mock_get:
+    # Patch the session method the tool calls
+    with patch('gofannon.base.http.HttpSession.get') as mock_get:
         # Create a mock response
         mock_response = MagicMock()
         mock_response.json.return_value = [
@@ -44,6 +47,9 @@ def test_list_issues_success():
         ]
         # Ensure raise_for_status doesn't do anything
         mock_response.raise_for_status.return_value = None
+        # Single page, no ETag
+        mock_response.links = {}
+        mock_response.headers = {}
         mock_get.return_value = mock_response
         
         # Initialize with dummy API key
@@ -65,7 +71,8 @@ def test_list_issues_success():
             params={
                 'state': 'open',
                 'sort': 'created',
-                'direction': 'desc'
+                'direction': 'desc',
+                'per_page': 100
             }
         )
         
@@ -79,11 +86,13 @@ def test_list_issues_success():
         assert "pull_request" not in result[1]
 
 def test_list_issues_with_parameters():
-    with patch('gofannon.github.list_issues.get') as mock_get:
+    with patch('gofannon.base.http.HttpSession.get') as mock_get:
         # Create a mock response
         mock_response = MagicMock()
         mock_response.json.return_value = []  # Empty list for simplicity
         mock_response.raise_for_status.return_value = None
+        mock_response.links = {}
+        mock_response.headers = {}
         mock_get.return_value = mock_response
         
         # Initialize with dummy API key
@@ -110,6 +119,7 @@ def test_list_issues_with_parameters():
                 'state': 'closed',
                 'sort': 'updated',
                 'direction': 'asc',
+                'per_page': 100,
                 'labels': 'bug,enhancement',
                 'since': '2023-01-01T00:00:00Z'
             }
@@ -119,7 +129,7 @@ def test_list_issues_with_parameters():
         assert result == []
 
 def test_list_issues_api_error():
-    with patch('gofannon.github.list_issues.get') as mock_get:
+    with patch('gofannon.base.http.HttpSession.get') as mock_get:
         # Create the mock and make raise_for_status throw an exception
         mock_response = MagicMock()
         http_error = HTTPError("API error")
@@ -135,4 +145,44 @@ def test_list_issues_api_error():
         
         # Verify the exception 
         assert excinfo.value is http_error
-        assert "API error" in str(excinfo.value)
\ No newline at end of file
+        assert "API error" in str(excinfo.value)
+
+def _issue(number):
+    return {
+        "number": number, "title": f"Issue {number}", "state": "open",
+        "created_at": "2023-01-01T00:00:00Z", "updated_at": "2023-01-02T00:00:00Z",
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+        "labels": [], "user": {"login": "testuser"}
+    }
+
+
+def test_list_issues_follows_pages_and_revalidates_with_etags():
+    first = "https://api.github.com/repos/owner/repo/issues"
+    second = "https://api.github.com/repos/owner/repo/issues?page=2"
+
+    def page(etag, body, next_url=None):
+        def callback(request, context):
+            if request.headers.get("If-None-Match") == etag:
+                context.status_code = 304
+                return ""
+            context.headers["ETag"] = etag
+            if next_url:
+                context.headers["Link"] = f'<{next_url}>; rel="next", <{next_url}>; rel="last"'
+            return json.dumps(body)
+        return callback
+
+    with requests_mock.Mocker() as mock:
+        mock.get(first, text=page('"p1"', [_issue(n) for n in range(1, 101)], second))
+        mock.get(second, complete_qs=True, text=page('"p2"', [_issue(101)]))
+
+        tool = ListIssues(api_key="dummy_key", etag_cache=MemoryCache())
+        pages = list(tool.iter_pages("https://github.com/owner/repo"))
+        assert [len(p) for p in pages] == [100, 1]
+        assert mock.request_history[0].qs["per_page"] == ["100"]
+
+        # Second poll: both pages come back 304 and are served from the cache
+        result = tool.fn("https://github.com/owner/repo")
+        assert [r.headers["If-None-Match"] for r in mock.request_history[2:]] == ['"p1"', '"p2"']
+        assert len(result) == 101 and result[-1]["number"] == 101
+
+        assert len(tool.fn("https://github.com/owner/repo", max_pages=1)) == 100
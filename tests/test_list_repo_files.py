@@ -0,0 +1,62 @@
+import json
+
+import requests_mock
+
+from gofannon.github.list_repo_files import ListRepoFiles
+
+API = "https://api.github.com/repos/octo/demo"
+TREES = f"{API}/git/trees/"
+
+
+def blob(path):
+    return {"path": path, "type": "blob", "sha": "b-" + path}
+
+
+def tree(path, sha):
+    return {"path": path, "type": "tree", "sha": sha}
+
+
+def mock_branch(mock):
+    mock.get(f"{API}/branches/main", json={"commit": {"commit": {"tree": {"sha": "root"}}}})
+
+
+def mock_tree(mock, sha, entries, recursive, truncated=False):
+    mock.get(TREES + sha + ("?recursive=1" if recursive else ""), complete_qs=True,
+             json={"sha": sha, "truncated": truncated, "tree": entries})
+
+
+def test_filters_and_output_modes():
+    with requests_mock.Mocker() as mock:
+        mock_branch(mock)
+        mock_tree(mock, "root", [blob("README.md"), tree("src", "s"), blob("src/a.py"),
+                                 blob("src/b.txt"), blob("src/c.py")], recursive=True)
+        tool = ListRepoFiles(api_key="t")
+
+        assert json.loads(tool.fn("https://github.com/octo/demo", branch="main")) == [
+            "README.md", "src/a.py", "src/b.txt", "src/c.py"]
+        compact = tool.fn("https://github.com/octo/demo", branch="main", prefix="src", pattern="*.py", compact=True)
+        assert compact == '["src/a.py","src/c.py"]'
+        page = json.loads(tool.fn("https://github.com/octo/demo", branch="main", page=2, page_size=3))
+        assert page == {"paths": ["src/c.py"], "page": 2, "total": 4, "next_page": None}
+
+
+def test_walks_subtrees_when_truncated():
+    with requests_mock.Mocker() as mock:
+        mock_branch(mock)
+        mock_tree(mock, "root", [blob("README.md")], recursive=True, truncated=True)
+        mock_tree(mock, "root", [blob("README.md"), tree("docs", "d"), tree("src", "s")], recursive=False)
+        mock_tree(mock, "d", [blob("index.md")], recursive=True)
+        # src is itself too large, so it is split once more.
+        mock_tree(mock, "s", [], recursive=True, truncated=True)
+        mock_tree(mock, "s", [blob("main.py"), tree("lib", "l")], recursive=False)
+        mock_tree(mock, "l", [blob("util.py"), tree("deep", "x"), blob("deep/more.py")], recursive=True)
+
+        tool = ListRepoFiles(api_key="t")
+        everything = json.loads(tool.fn("https://github.com/octo/demo", branch="main"))
+        assert everything == ["README.md", "docs/index.md", "src/lib/deep/more.py", "src/lib/util.py", "src/main.py"]
+
+        mock.reset_mock()
+        in_lib = json.loads(tool.fn("https://github.com/octo/demo", branch="main", prefix="src/lib/"))
+        assert in_lib == ["src/lib/deep/more.py", "src/lib/util.py"]
+        # docs is outside the prefix and never fetched.
+        assert not any(request.path.endswith("/trees/d") for request in mock.request_history)
@@ -0,0 +1,181 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gofannon.github.pr_review_tool import PRReviewTool
+
+CHECKS = '''
+import threading
+import time
+
+class SlowFileCheck:
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, client, model_name):
+        pass
+
+    def process_pr_file(self, file, repo, pr):
+        with SlowFileCheck.lock:
+            SlowFileCheck.running += 1
+            SlowFileCheck.peak = max(SlowFileCheck.peak, SlowFileCheck.running)
+        # Later files finish first, to show the output order doesn't follow completion.
+        time.sleep(0.05 * (5 - int(file.filename[1])))
+        with SlowFileCheck.lock:
+            SlowFileCheck.running -= 1
+        return [{"path": file.filename, "body": f"slow {file.filename}", "line": 1}], True
+
+    def process_pr(self, pr):
+        return [{"path": "GENERAL", "body": "overall", "line": 0}], True
+
+class HangingCheck:
+    def __init__(self, client, model_name):
+        pass
+
+    def process_pr_file(self, file, repo, pr):
+        time.sleep(2)
+        return [{"path": file.filename, "body": "late", "line": 1}], True
+'''
+
+
+@pytest.fixture
+def review_env(tmp_path, monkeypatch):
+    checks_path = tmp_path / "checks.py"
+    checks_path.write_text(CHECKS)
+    monkeypatch.setenv("PR_REVIEW_CHECKS_PATH", str(checks_path))
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+    pr = MagicMock()
+    files = []
+    for index in range(5):
+        file = MagicMock()
+        file.filename = f"f{index}.py"
+        file.sha = f"blob{index}"
+        files.append(file)
+    pr.get_files.return_value = files
+    pr.head.sha = "head1"
+    with patch("gofannon.github.pr_review_tool.Github") as github:
+        github.return_value.get_repo.return_value.get_pull.return_value = pr
+        yield pr
+
+
+def test_pr_review_runs_checks_concurrently_in_order(review_env):
+    tool = PRReviewTool(max_workers=5, check_timeout={"HangingCheck": 0.2})
+    start = time.time()
+    summary = tool.fn(pr_number=1, repo_name="owner/repo")
+
+    # The file list is fetched once for both checks.
+    assert review_env.get_files.call_count == 1
+    # Serially the slow check alone would take 0.75s, and the hanging one 10s.
+    assert time.time() - start < 0.7
+
+    slow_bodies = [f"slow f{index}.py" for index in range(5)] + ["overall"]
+    positions = [summary.index(body) for body in slow_bodies]
+    assert positions == sorted(positions)
+    assert "6 call(s)" in summary
+    assert "5 timed out after 0.2s" in summary
+    assert "late" not in summary
+
+
+def test_pr_review_respects_max_workers(review_env):
+    from gofannon.github import pr_review_tool
+    load_review_checks, loaded = pr_review_tool.load_review_checks, []
+
+    def load_checks():
+        loaded.extend(load_review_checks())
+        return loaded
+
+    with patch.object(pr_review_tool, "load_review_checks", load_checks):
+        PRReviewTool(max_workers=2, check_timeout={"HangingCheck": 0}).fn(pr_number=1, repo_name="owner/repo")
+    assert loaded[0].__name__ == "SlowFileCheck"
+    assert loaded[0].peak == 2
+
+
+COUNTING_CHECKS = '''
+class CountingCheck:
+    calls = []
+
+    def __init__(self, client, model_name):
+        pass
+
+    def process_pr_file(self, file, repo, pr):
+        CountingCheck.calls.append(file.filename)
+        return [{"path": file.filename, "body": f"{file.filename} at {file.sha}", "line": 1}], True
+'''
+
+
+@pytest.mark.parametrize("store", ["context", "cache"])
+def test_pr_review_ledger_reuses_unchanged_files(review_env, tmp_path, monkeypatch, store):
+    from gofannon.base import WorkflowContext
+    from gofannon.base.cache import SQLiteCache
+    from gofannon.github import pr_review_tool
+
+    checks_path = tmp_path / "counting_checks.py"
+    checks_path.write_text(COUNTING_CHECKS)
+    monkeypatch.setenv("PR_REVIEW_CHECKS_PATH", str(checks_path))
+    load_review_checks, loaded = pr_review_tool.load_review_checks, []
+
+    def load_checks():
+        loaded[:] = load_review_checks()
+        return loaded
+
+    if store == "context":
+        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+        ledger = WorkflowContext()
+    else:
+        ledger = SQLiteCache(tmp_path / "ledger.sqlite")
+
+    with patch.object(pr_review_tool, "load_review_checks", load_checks):
+        PRReviewTool(ledger=ledger).fn(pr_number=1, repo_name="owner/repo")
+        assert sorted(loaded[0].calls) == [f"f{index}.py" for index in range(5)]
+
+        # A new push changes one file.
+        review_env.get_files.return_value[2].sha = "blob2-new"
+        second = PRReviewTool(ledger=ledger).fn(pr_number=1, repo_name="owner/repo")
+        assert loaded[0].calls == ["f2.py"]
+
+    assert "f2.py at blob2-new" in second
+    assert "4 result(s) reused" in second
+    for index in (0, 1, 3, 4):
+        assert f"f{index}.py at blob{index}" in second
+    if store == "context":
+        assert len(ledger.data["pr_review_ledger"]) == 6
+
+
+SIDE_BY_SIDE_CHECKS = '''
+import time
+
+class BusyCheck:
+    def __init__(self, client, model_name):
+        pass
+
+    def process_pr_file(self, file, repo, pr):
+        time.sleep(0.1)
+        return [{"path": file.filename, "body": f"busy {file.filename}", "line": 1}], True
+
+class QuickCheck:
+    def __init__(self, client, model_name):
+        pass
+
+    def process_pr_file(self, file, repo, pr):
+        return [{"path": file.filename, "body": f"quick {file.filename}", "line": 1}], False
+
+    def process_pr(self, pr):
+        return [{"path": "GENERAL", "body": "quick overall", "line": 0}], False
+'''
+
+
+def test_pr_review_checks_do_not_queue_behind_each_other(review_env, tmp_path, monkeypatch):
+    checks_path = tmp_path / "side_by_side_checks.py"
+    checks_path.write_text(SIDE_BY_SIDE_CHECKS)
+    monkeypatch.setenv("PR_REVIEW_CHECKS_PATH", str(checks_path))
+
+    # On one shared worker, QuickCheck would wait 0.5s behind BusyCheck and time out.
+    summary = PRReviewTool(max_workers=1, check_timeout={"QuickCheck": 0.2}).fn(pr_number=1, repo_name="owner/repo")
+
+    assert "timed out" not in summary
+    # Per-file results the check declined are dropped; whole-PR comments are kept.
+    assert "quick f0.py" not in summary
+    assert "quick overall" in summary
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+import pytest
+
+from gofannon.base import BaseTool, WorkflowContext
+from gofannon.base.cache import MemoryCache
+
+
+class Echo(BaseTool):
+    def __init__(self, name="echo"):
+        super().__init__()
+        self.name = name
+        self.threads = []
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": self.name, "parameters": {}}}
+
+    def fn(self, text):
+        self.threads.append(threading.current_thread())
+        return f"sync:{text}"
+
+
+class AsyncEcho(Echo):
+    cache_ttl = 60
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    async def afn(self, text):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return f"async:{text}"
+
+
+class CoroutineFn(Echo):
+    async def fn(self, text):
+        return f"coroutine:{text}"
+
+
+@pytest.fixture
+def context(tmp_path, monkeypatch):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    return WorkflowContext()
+
+
+@pytest.mark.asyncio
+async def test_aexecute_awaits_afn(context):
+    result = await AsyncEcho().aexecute(context, text="hi")
+    assert result.success
+    assert result.output == "async:hi"
+    assert context.execution_log[0]["tool"] == "AsyncEcho"
+
+
+@pytest.mark.asyncio
+async def test_aexecute_falls_back_to_a_worker_thread(context):
+    tool = Echo()
+    result = await tool.aexecute(context, text="hi")
+    assert result.output == "sync:hi"
+    assert tool.threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_aexecute_reports_failures(context):
+    class Failing(AsyncEcho):
+        async def afn(self, text):
+            raise RuntimeError("boom")
+
+    result = await Failing().aexecute(context, text="hi")
+    assert not result.success
+    assert result.error == "boom"
+
+
+def test_sync_execute_runs_a_coroutine_fn(context):
+    result = CoroutineFn().execute(context, text="hi")
+    assert result.success
+    assert result.output == "coroutine:hi"
+
+
+@pytest.mark.asyncio
+async def test_execute_async_awaits_afn_with_result_cache():
+    tool = AsyncEcho()
+    tool.result_cache = MemoryCache()
+    assert await tool.execute_async({"text": "hi"}) == "async:hi"
+    assert await tool.ainvoke(text="hi") == "async:hi"
+    assert tool.calls == 1
@@ -0,0 +1,88 @@
+import json
+import threading
+import time
+
+from openai.types.chat import ChatCompletion
+
+from gofannon.reasoning.beam_search import BeamSearchToT
+
+LEVEL = {'model_name': "fake", 'base_url': "http://localhost", 'api_key': "k", 'temperature': 0.0}
+
+
+def completion(content, tokens=10):
+    return ChatCompletion.model_validate({
+        "id": "c", "object": "chat.completion", "created": 0, "model": "fake",
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": tokens, "completion_tokens": 0, "total_tokens": tokens},
+    })
+
+
+class FakeModel:
+    """
+    Thoughts are digits; a path's score is its last digit, so the best path
+    always extends the best-scoring node.
+    """
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, level, messages):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        prompt = messages[0]["content"]
+        path = [line.split(". ", 1)[1] for line in prompt.splitlines()
+                if line.strip()[:1].isdigit() and ". " in line]
+        if "Propose" in prompt:
+            base = int(path[-1]) if path else 0
+            return completion(json.dumps({"thoughts": [str(min(base + step, 9)) for step in (1, 3, 2)]}))
+        return completion(json.dumps({"score": int(path[-1]), "reason": "last digit"}))
+
+
+def test_beam_search_expands_prunes_and_reports():
+    tool = BeamSearchToT(depth_chart=[LEVEL, LEVEL])
+    model = FakeModel()
+    tool.get_response = model
+
+    result = tool.fn("count up", levels=3, beam_width=2, expansions=3)
+
+    assert result["stopped"] == "max_levels"
+    assert result["best"]["path"] == ["3", "6", "9"]
+    assert [node["path"] for node in result["beam"]] == [["3", "6", "9"], ["3", "6", "8"]]
+    # Level 1: one expansion + 3 evaluations; levels 2-3: 2 expansions + 6 evaluations.
+    assert [level["candidates"] for level in result["levels"]] == [3, 6, 6]
+    assert result["usage"] == {"calls": 4 + 8 + 8, "tokens": 200}
+    assert model.calls == 20
+
+
+def test_beam_search_stops_at_threshold_and_budget():
+    tool = BeamSearchToT(depth_chart=[LEVEL])
+    tool.get_response = FakeModel()
+    result = tool.fn("count up", levels=5, beam_width=2, score_threshold=6)
+    assert result["stopped"] == "score_threshold"
+    assert result["best"]["score"] == 6
+    assert len(result["levels"]) == 2
+
+    tool.get_response = FakeModel()
+    result = tool.fn("count up", levels=5, beam_width=2, max_calls=6)
+    assert result["stopped"] == "budget"
+    assert result["usage"]["calls"] == 6
+
+
+def test_beam_search_expands_a_level_concurrently():
+    tool = BeamSearchToT(depth_chart=[LEVEL, LEVEL])
+    model = FakeModel(delay=0.1)
+    tool.get_response = model
+    start = time.time()
+    tool.fn("count up", levels=2, beam_width=3, expansions=3)
+    # 2 levels x (expansion round + evaluation round) of 0.1s, not 1.6s serially.
+    assert time.time() - start < 0.8
+    assert model.peak >= 3
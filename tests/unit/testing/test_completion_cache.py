@@ -0,0 +1,123 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+from openai.types.chat import ChatCompletion
+
+from gofannon.base.cache import MemoryCache, SQLiteCache
+from gofannon.reasoning import base
+from gofannon.reasoning.base import CompletionCache
+from gofannon.reasoning.sequential_cot import SequentialCoT
+
+LEVEL = {'model_name': "fake", 'base_url': "http://localhost", 'api_key': "k", 'temperature': 0}
+
+
+def completion(content):
+    return ChatCompletion.model_validate({
+        "id": "c", "object": "chat.completion", "created": 0, "model": "fake",
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": content}}],
+    })
+
+
+class FakeClient:
+    """Stands in for the pooled OpenAI client and counts completions."""
+    def __init__(self):
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, temperature):
+        self.calls.append(messages)
+        return completion(f"answer {len(self.calls)}")
+
+
+def make_tool(level, cache, client):
+    tool = SequentialCoT(depth_chart=[level])
+    tool.completion_cache = cache
+    tool.create_openai_like_client = lambda level: client
+    return tool
+
+
+def test_repeated_prompts_are_served_from_the_cache():
+    client = FakeClient()
+    tool = make_tool(LEVEL, CompletionCache(), client)
+    messages = [{"role": "user", "content": "hi"}]
+
+    first = tool.get_response(0, messages)
+    again = tool.get_response(0, [{"content": "hi", "role": "user"}])
+    other = tool.get_response(0, [{"role": "user", "content": "bye"}])
+
+    assert len(client.calls) == 2
+    assert isinstance(again, ChatCompletion)
+    assert again.choices[0].message.content == first.choices[0].message.content == "answer 1"
+    assert other.choices[0].message.content == "answer 2"
+
+
+def test_nonzero_temperature_bypasses_the_cache_unless_asked():
+    warm = dict(LEVEL, temperature=0.7)
+    messages = [{"role": "user", "content": "hi"}]
+
+    client = FakeClient()
+    tool = make_tool(warm, CompletionCache(), client)
+    tool.get_response(0, messages)
+    tool.get_response(0, messages)
+    assert len(client.calls) == 2
+
+    client = FakeClient()
+    tool = make_tool(warm, CompletionCache(bypass_nonzero_temperature=False), client)
+    tool.get_response(0, messages)
+    tool.get_response(0, messages)
+    assert len(client.calls) == 1
+
+
+def test_ttl_and_model_are_part_of_the_entry():
+    client = FakeClient()
+    cache = CompletionCache(MemoryCache(), ttl=0.05)
+    messages = [{"role": "user", "content": "hi"}]
+    make_tool(LEVEL, cache, client).get_response(0, messages)
+    make_tool(dict(LEVEL, model_name="other"), cache, client).get_response(0, messages)
+    assert len(client.calls) == 2
+
+    time.sleep(0.1)
+    make_tool(LEVEL, cache, client).get_response(0, messages)
+    assert len(client.calls) == 3
+
+
+def test_disk_cache_survives_a_restart(tmp_path):
+    path = tmp_path / "completions.sqlite"
+    messages = [{"role": "user", "content": "hi"}]
+    client = FakeClient()
+    make_tool(LEVEL, CompletionCache(SQLiteCache(path, max_entries=10)), client).get_response(0, messages)
+
+    client = FakeClient()
+    response = make_tool(LEVEL, CompletionCache(SQLiteCache(path, max_entries=10)), client).get_response(0, messages)
+    assert client.calls == []
+    assert response.choices[0].message.content == "answer 1"
+
+
+def test_default_cache_applies_to_whole_runs_and_async_calls():
+    client = FakeClient()
+    step = completion(json.dumps({"steps": ["only step"]}))
+    client.chat.completions.create = lambda model, messages, temperature: (client.calls.append(messages), step)[1]
+    tool = SequentialCoT(depth_chart=[LEVEL, LEVEL, dict(LEVEL, prompt_appendix="Answer.")])
+    tool.create_openai_like_client = lambda level: client
+
+    async def create(model, messages, temperature):
+        raise AssertionError("should have been cached")
+
+    tool.create_async_openai_like_client = lambda level: SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    base.set_default_completion_cache(CompletionCache())
+    try:
+        first = tool.fn("prompt", steps=1)
+        calls = len(client.calls)
+        assert calls == 3
+        assert tool.fn("prompt", steps=1) == first
+        assert len(client.calls) == calls
+
+        cached = asyncio.run(tool.aget_response(0, client.calls[0]))
+        assert cached == step
+    finally:
+        base.set_default_completion_cache(None)
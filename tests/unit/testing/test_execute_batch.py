@@ -0,0 +1,131 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from gofannon.arxiv.get_article import GetArticle
+from gofannon.base import BaseTool, WorkflowContext
+
+
+class Square(BaseTool):
+    def __init__(self, name="square"):
+        super().__init__()
+        self.name = name
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    @property
+    def definition(self):
+        return {"type": "function", "function": {"name": self.name, "parameters": {}}}
+
+    def fn(self, n, delay=0.05):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(delay)
+        with self._lock:
+            self.active -= 1
+        if n < 0:
+            raise ValueError(f"negative: {n}")
+        return n * n
+
+
+class UnsafeSquare(Square):
+    thread_safe = False
+
+
+@pytest.fixture
+def context(tmp_path, monkeypatch):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    return WorkflowContext()
+
+
+def test_execute_batch_keeps_order_and_isolates_failures(context):
+    tool = Square()
+    # later items finish first
+    batch = [{"n": n, "delay": 0.01 * (5 - n)} for n in range(5)] + [{"n": -1}]
+    results = tool.execute_batch(context, batch, max_concurrency=4)
+
+    assert [r.output for r in results[:5]] == [0, 1, 4, 9, 16]
+    assert not results[5].success
+    assert results[5].error == "negative: -1"
+    assert tool.peak == 4
+    assert len(context.execution_log) == 5
+
+
+def test_execute_batch_runs_unsafe_tools_one_at_a_time(context):
+    tool = UnsafeSquare()
+    results = tool.execute_batch(context, [{"n": n, "delay": 0.01} for n in range(4)], max_concurrency=4)
+    assert [r.output for r in results] == [0, 1, 4, 9]
+    assert tool.peak == 1
+
+
+def test_execute_batch_handles_empty_input(context):
+    assert Square().execute_batch(context, []) == []
+
+
+@pytest.mark.asyncio
+async def test_aexecute_batch(context):
+    tool = Square()
+    results = await tool.aexecute_batch(context, [{"n": 3}, {"n": -2}, {"n": 2}], max_concurrency=2)
+    assert [r.success for r in results] == [True, False, True]
+    assert results[0].output == 9 and results[2].output == 4
+    assert tool.peak == 2
+
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>ArXiv Query</title>
+  <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">2</opensearch:totalResults>
+  <entry><id>http://arxiv.org/abs/2101.00001v2</id><title>First</title></entry>
+  <entry><id>http://arxiv.org/abs/2101.00002v1</id><title>Second</title></entry>
+</feed>"""
+
+
+def _response(text):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = text.encode()
+    return response
+
+
+def test_get_article_batch_uses_one_bulk_request(context):
+    calls = []
+
+    def fake_get(self, url, params=None, **kwargs):
+        calls.append(params)
+        if "," in params["id_list"]:
+            return _response(FEED)
+        return _response("<feed>single</feed>")
+
+    with patch("gofannon.base.http.HttpSession.get", fake_get):
+        results = GetArticle().execute_batch(context, [{"id": "2101.00002"}, {"id": "2101.00001v2"}, {"id": "bogus"}])
+
+    assert calls[0]["id_list"] == "2101.00002,2101.00001v2,bogus"
+    assert "<title>Second</title>" in results[0].output and "First" not in results[0].output
+    assert "<title>First</title>" in results[1].output
+    # ids the bulk response doesn't cover fall back to single calls
+    assert results[2].output == "<feed>single</feed>"
+    assert len(calls) == 2
+
+
+def test_get_article_batch_keeps_feed_namespaces_and_own_cache_key(context):
+    import xml.etree.ElementTree as ET
+    from gofannon.base.cache import MemoryCache
+
+    tool = GetArticle()
+    tool.result_cache = MemoryCache()
+    with patch("gofannon.base.http.HttpSession.get", lambda self, url, params=None, **kwargs: _response(FEED)):
+        first = tool.execute_batch(context, [{"id": "2101.00001"}, {"id": "2101.00002"}])[0].output
+
+    assert first == FEED.replace(
+        ">2</opensearch:totalResults>", ">1</opensearch:totalResults>"
+    ).replace("  <entry><id>http://arxiv.org/abs/2101.00002v1</id><title>Second</title></entry>\n", "")
+    assert "http://www.w3.org/2005/Atom" not in ET._namespace_map
+    # fn would have returned the raw single-id response, so the batch feed isn't cached as its result.
+    assert tool.result_cache.get(tool._cache_key({"id": "2101.00001"})) is tool.result_cache.MISSING
+    with patch("gofannon.base.http.HttpSession.get", side_effect=AssertionError("should be cached")):
+        assert tool.execute_batch(context, [{"id": "2101.00001"}])[0].output == first
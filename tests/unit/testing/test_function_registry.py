@@ -0,0 +1,96 @@
+import pytest
+from gofannon.base import BaseTool
+from gofannon.config import FunctionRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(FunctionRegistry, "_tools", {})
+    monkeypatch.setattr(FunctionRegistry, "_definitions", {})
+    monkeypatch.setattr(FunctionRegistry, "_definitions_list", None)
+    return FunctionRegistry
+
+
+class ExpensiveTool(BaseTool):
+    instances = 0
+
+    def __init__(self, name="expensive_tool"):
+        ExpensiveTool.instances += 1
+        super().__init__()
+        self.name = name
+
+    @property
+    def definition(self):
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": "A tool that is costly to construct",
+                "parameters": {"type": "object", "properties": {}},
+            },
+        }
+
+    def fn(self):
+        return "ok"
+
+
+class ClassNamedTool(ExpensiveTool):
+    name = "class_named_tool"
+
+    def __init__(self):
+        super().__init__(name=self.name)
+
+
+def test_register_does_not_instantiate(registry):
+    ExpensiveTool.instances = 0
+    registry.register(ExpensiveTool)
+    registry.register(ClassNamedTool)
+    definitions = registry.get_tools()
+
+    assert ExpensiveTool.instances == 0
+    assert [d["function"]["name"] for d in definitions] == ["expensive_tool", "class_named_tool"]
+    assert registry._tools["class_named_tool"] is ClassNamedTool
+
+
+def test_get_tools_is_cached_until_next_registration(registry):
+    registry.register(ExpensiveTool)
+    first = registry.get_tools()
+    assert registry._definitions_list is not None
+    assert registry.get_tools() == first
+
+    registry.register(ClassNamedTool)
+    assert registry._definitions_list is None
+    assert len(registry.get_tools()) == 2
+
+
+def test_get_tools_returns_a_copy(registry):
+    registry.register(ExpensiveTool)
+    registry.get_tools().clear()
+    assert len(registry.get_tools()) == 1
+
+    definition = registry.get_tools()[0]
+    definition["function"]["description"] = "changed"
+    definition["function"]["parameters"]["required"] = ["x"]
+    assert registry.get_tools()[0]["function"]["description"] != "changed"
+    assert "required" not in registry.get_tools()[0]["function"]["parameters"]
+    name = definition["function"]["name"]
+    registry.get_definition(name)["function"]["description"] = "changed"
+    assert registry.get_definition(name)["function"]["description"] != "changed"
+
+
+def test_falls_back_to_instance_when_definition_needs_init_state(registry):
+    class StatefulTool(ExpensiveTool):
+        def __init__(self):
+            super().__init__()
+            self.suffix = "_v2"
+
+        @property
+        def definition(self):
+            definition = super().definition
+            definition["function"]["name"] += self.suffix
+            return definition
+
+    ExpensiveTool.instances = 0
+    registry.register(StatefulTool)
+    assert ExpensiveTool.instances == 1
+    assert registry.get_definition("expensive_tool_v2")["function"]["name"] == "expensive_tool_v2"
@@ -3,7 +3,7 @@ from gofannon.grant_query.grant_query import GrantsQueryTool
 import requests
 from unittest.mock import patch, MagicMock
 
-@patch("requests.post")
+@patch("gofannon.base.http.HttpSession.post")
 def test_grant_query_success(mock_post):
     """Test GrantsQueryTool with a successful API response."""
     mock_response = MagicMock()
@@ -47,7 +47,7 @@ def test_grant_query_empty_query():
     with pytest.raises(ValueError):
         tool.fn(query="")
 
-@patch("requests.post")
+@patch("gofannon.base.http.HttpSession.post")
 def test_grant_query_api_error(mock_post):
     """Test GrantsQueryTool with an API error response."""
     mock_post.side_effect = requests.exceptions.RequestException("API error")
@@ -55,7 +55,7 @@ def test_grant_query_api_error(mock_post):
     with pytest.raises(requests.exceptions.RequestException):
         tool.fn(query="ai")
 
-@patch("requests.post")
+@patch("gofannon.base.http.HttpSession.post")
 def test_grant_query_no_results(mock_post):
     """Test GrantsQueryTool with no results."""
     mock_response = MagicMock()
@@ -0,0 +1,77 @@
+import json
+import threading
+import time
+
+from openai.types.chat import ChatCompletion
+
+from gofannon.reasoning.hierarchical_cot import HierarchicalCoT
+
+LEVEL = {'model_name': "fake", 'base_url': "http://localhost", 'api_key': "k", 'temperature': 0.3}
+
+
+def completion(content):
+    return ChatCompletion.model_validate({
+        "id": "c", "object": "chat.completion", "created": 0, "model": "fake",
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": content}}],
+    })
+
+
+class FakeModel:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, level, messages):
+        prompt = messages[0]["content"]
+        if "Organize this problem" in prompt:
+            return completion(json.dumps({"title": "Root", "sections": [
+                {"title": "A", "sections": []}, {"title": "broken"}, {"title": "B", "sections": []}]}))
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        # Later sections answer first, so completion order differs from outline order.
+        title = prompt.split("Section to expand: ")[1].split("\n")[0].strip()
+        time.sleep(self.delay * (2 if title in ("A", "A.0") else 1))
+        with self.lock:
+            self.in_flight -= 1
+        context = prompt.split("context of: ")[1].split("\n")[0].strip()
+        if title == "broken" or title == "B.1":
+            return completion("not json")
+        if "'content' field" in prompt:
+            return completion(json.dumps({"content": f"{context} / {title}"}))
+        return completion(json.dumps({"title": f"{title}*", "sections": [{"title": f"{title}.{j}"} for j in range(2)]}))
+
+
+def test_sections_expand_level_by_level_in_order():
+    tool = HierarchicalCoT(depth_chart=[LEVEL, LEVEL, LEVEL])
+    model = FakeModel()
+    tool.get_response = model
+
+    result = tool.fn("prompt", depth=3)
+
+    assert result == {"title": "Root", "sections": [
+        {"title": "A*", "sections": [{"title": "A.0", "content": "Root -> A* / A.0"},
+                                     {"title": "A.1", "content": "Root -> A* / A.1"}]},
+        {"title": "broken"},
+        {"title": "B*", "sections": [{"title": "B.0", "content": "Root -> B* / B.0"},
+                                     {"title": "B.1"}]},
+    ]}
+    # Errors are in the order a depth-first, one-at-a-time expansion records them.
+    assert [(error["stage"], error["section_index"]) for error in tool.error_context] == [
+        ("section_parsing_depth_1", 1), ("section_parsing_depth_2", 1)]
+    assert [(level["depth"], level["sections"]) for level in tool.level_latency] == [(1, 3), (2, 4)]
+    assert model.peak == 4
+    # Two levels of (at most) two slow rounds, rather than seven calls in a row.
+    assert sum(level["seconds"] for level in tool.level_latency) < 0.35
+
+
+def test_fan_out_limit():
+    tool = HierarchicalCoT(depth_chart=[LEVEL, LEVEL, LEVEL], max_fan_out=2)
+    model = FakeModel(delay=0.01)
+    tool.get_response = model
+    tool.fn("prompt", depth=3)
+    assert model.peak == 2
+    assert tool.get_debug_info()["level_latency"] == tool.level_latency
@@ -0,0 +1,132 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from gofannon.base import http
+from gofannon.get_url_content.get_url_content import GetUrlContent
+from gofannon.wikipedia.wikipedia_lookup import WikipediaLookup
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_left = 0
+    ports = set()
+
+    def do_GET(self):
+        Handler.ports.add(self.client_address[1])
+        if Handler.failures_left:
+            Handler.failures_left -= 1
+            self._reply(503, b"busy")
+        else:
+            self._reply(200, b"ok")
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.failures_left = 0
+    Handler.ports = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    defaults = dict(http._http_config)
+    http.configure_http(backoff_factor=0)
+    yield
+    http.configure_http(**defaults)
+
+
+def test_sessions_are_shared_per_service():
+    assert http.get_session("github") is http.get_session("github")
+    assert http.get_session("github") is not http.get_session()
+    tool = WikipediaLookup()
+    assert tool.http_session is http.get_session()
+
+
+def test_connections_are_reused(server):
+    session = http.get_session()
+    for _ in range(5):
+        assert session.get(server).text == "ok"
+    assert len(Handler.ports) == 1
+
+
+def test_retries_on_5xx(server):
+    Handler.failures_left = 2
+    response = http.get_session().get(server)
+    assert response.status_code == 200
+
+
+def test_returns_last_response_when_retries_are_exhausted(server):
+    http.configure_http(retries=1, backoff_factor=0)
+    Handler.failures_left = 5
+    response = http.get_session().get(server)
+    assert response.status_code == 503
+
+
+def test_default_timeout_is_applied(server):
+    http.configure_http(timeout=7)
+    assert http.get_session().timeout == 7
+
+
+def test_configure_http_rejects_unknown_options():
+    with pytest.raises(ValueError):
+        http.configure_http(proxies={})
+
+
+@pytest.mark.asyncio
+async def test_async_client_reuses_connections_and_returns_requests_responses(server):
+    client = http.get_async_client()
+    assert client is http.get_async_client()
+    for _ in range(5):
+        response = await client.get(server)
+        assert isinstance(response, requests.Response)
+        assert response.text == "ok"
+    assert len(Handler.ports) == 1
+    await http.aclose_clients()
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries_on_5xx(server):
+    Handler.failures_left = 2
+    response = await http.get_async_client().get(server)
+    assert response.status_code == 200
+
+    http.configure_http(retries=1, backoff_factor=0)
+    Handler.failures_left = 5
+    response = await http.get_async_client().get(server)
+    assert response.status_code == 503
+    with pytest.raises(requests.exceptions.HTTPError):
+        response.raise_for_status()
+
+
+@pytest.mark.asyncio
+async def test_async_client_raises_requests_exceptions():
+    http.configure_http(retries=0)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        # port 9 (discard) is closed on the loopback interface
+        await http.get_async_client().get("http://127.0.0.1:9")
+
+
+@pytest.mark.asyncio
+async def test_ported_tool_afn_matches_fn(server):
+    tool = GetUrlContent()
+    assert await tool.afn(server) == tool.fn(server) == "ok"
+    Handler.failures_left = 10
+    http.configure_http(retries=0)
+    assert (await tool.afn(server)).startswith("Error: HTTP error - 503")
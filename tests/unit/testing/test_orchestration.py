@@ -0,0 +1,308 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from gofannon.base import BaseTool
+from gofannon.config import FunctionRegistry
+from gofannon.orchestration import AsyncFunctionOrchestrator, FunctionOrchestrator
+
+
+class SleepTool(BaseTool):
+    def __init__(self, name="sleep_tool"):
+        super().__init__()
+        self.name = name
+
+    @property
+    def definition(self):
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": "Sleep, then echo the label",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "label": {"type": "string"},
+                        "seconds": {"type": "number"},
+                    },
+                    "required": ["label", "seconds"],
+                },
+            },
+        }
+
+    def fn(self, label, seconds):
+        time.sleep(seconds)
+        return f"slept {label}"
+
+
+class AsyncSleepTool(SleepTool):
+    def __init__(self, name="async_sleep_tool"):
+        super().__init__(name=name)
+
+    async def fn(self, label, seconds):
+        await asyncio.sleep(seconds)
+        return f"awaited {label}"
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(FunctionRegistry, "_tools", {})
+    monkeypatch.setattr(FunctionRegistry, "_definitions", {})
+    monkeypatch.setattr(FunctionRegistry, "_definitions_list", None)
+    FunctionRegistry.register(SleepTool)
+    FunctionRegistry.register(AsyncSleepTool)
+    return FunctionRegistry
+
+
+def tool_call(call_id, name, **arguments):
+    return SimpleNamespace(
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments)),
+    )
+
+
+def completion(content=None, tool_calls=None):
+    message = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeLLM:
+    """Replays canned chat completions in order."""
+
+    def __init__(self, responses):
+        self._responses = iter(responses)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        return next(self._responses)
+
+
+class AsyncFakeLLM(FakeLLM):
+    async def _create(self, **kwargs):
+        return next(self._responses)
+
+
+def three_sleeps(seconds):
+    return [
+        tool_call("call_a", "sleep_tool", label="a", seconds=seconds),
+        tool_call("call_b", "sleep_tool", label="b", seconds=seconds / 2),
+        tool_call("call_c", "sleep_tool", label="c", seconds=0),
+    ]
+
+
+def test_sequential_workflow_reports_latencies(registry):
+    llm = FakeLLM([completion(tool_calls=three_sleeps(0.01)), completion(content="done")])
+    result = FunctionOrchestrator(llm).execute_workflow("q", "model")
+
+    assert result["final_answer"] == "done"
+    assert [l["tool_call_id"] for l in result["tool_latencies"]] == ["call_a", "call_b", "call_c"]
+    assert all(not l["timed_out"] for l in result["tool_latencies"])
+
+
+def test_parallel_tool_calls_run_concurrently_and_keep_order(registry):
+    llm = FakeLLM([completion(tool_calls=three_sleeps(0.3)), completion(content="done")])
+    start = time.time()
+    result = FunctionOrchestrator(llm).execute_workflow("q", "model", parallel_tool_calls=True)
+    elapsed = time.time() - start
+
+    assert elapsed < 0.45
+    tool_messages = [m for m in result["conversation"] if isinstance(m, dict) and m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_messages] == ["call_a", "call_b", "call_c"]
+    assert [m["content"] for m in tool_messages] == ["slept a", "slept b", "slept c"]
+    assert result["tool_latencies"][0]["duration"] >= 0.3
+
+
+def test_parallel_tool_calls_apply_per_tool_timeout(registry):
+    calls = [
+        tool_call("call_slow", "sleep_tool", label="slow", seconds=1),
+        tool_call("call_fast", "sleep_tool", label="fast", seconds=0),
+    ]
+    llm = FakeLLM([completion(tool_calls=calls), completion(content="done")])
+    result = FunctionOrchestrator(llm).execute_workflow(
+        "q", "model", parallel_tool_calls=True, tool_timeout={"sleep_tool": 0.1}
+    )
+
+    slow, fast = result["tool_latencies"]
+    assert slow["timed_out"] and not fast["timed_out"]
+    tool_messages = [m for m in result["conversation"] if isinstance(m, dict) and m["role"] == "tool"]
+    assert "timed out" in tool_messages[0]["content"]
+    assert tool_messages[1]["content"] == "slept fast"
+
+
+@pytest.mark.asyncio
+async def test_async_orchestrator_runs_sync_and_native_async_tools(registry):
+    calls = [
+        tool_call("call_sync", "sleep_tool", label="sync", seconds=0.3),
+        tool_call("call_async", "async_sleep_tool", label="async", seconds=0.3),
+    ]
+    llm = AsyncFakeLLM([completion(tool_calls=calls), completion(content="done")])
+    start = time.time()
+    result = await AsyncFunctionOrchestrator(llm).aexecute_workflow("q", "model", parallel_tool_calls=True)
+    elapsed = time.time() - start
+
+    assert elapsed < 0.45
+    assert result["final_answer"] == "done"
+    tool_messages = [m for m in result["conversation"] if isinstance(m, dict) and m["role"] == "tool"]
+    assert [m["content"] for m in tool_messages] == ["slept sync", "awaited async"]
+
+
+@pytest.mark.asyncio
+async def test_async_orchestrator_drives_many_workflows(registry):
+    def workflow_llm():
+        return AsyncFakeLLM([
+            completion(tool_calls=[tool_call("call", "async_sleep_tool", label="x", seconds=0.2)]),
+            completion(content="done"),
+        ])
+
+    start = time.time()
+    results = await asyncio.gather(*(
+        AsyncFunctionOrchestrator(workflow_llm()).aexecute_workflow("q", "model") for _ in range(100)
+    ))
+    assert time.time() - start < 1
+    assert all(r["final_answer"] == "done" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_async_orchestrator_timeout_and_synthesis(registry):
+    calls = [tool_call("call_slow", "async_sleep_tool", label="slow", seconds=1)]
+    llm = AsyncFakeLLM([completion(tool_calls=calls), completion(content="synthesized")])
+    result = await AsyncFunctionOrchestrator(llm).aexecute_workflow(
+        "q", "model", max_steps=1, tool_timeout=0.1
+    )
+
+    assert result["tool_latencies"][0]["timed_out"]
+    assert result["final_answer"] == "synthesized"
+
+
+class CountingTool(SleepTool):
+    created = 0
+    opened = 0
+    closed = 0
+
+    def __init__(self, name="counting_tool"):
+        CountingTool.created += 1
+        super().__init__(name=name)
+
+    def open(self):
+        CountingTool.opened += 1
+
+    def close(self):
+        CountingTool.closed += 1
+
+
+class UnsafeCountingTool(CountingTool):
+    thread_safe = False
+
+    def __init__(self, name="unsafe_counting_tool"):
+        super().__init__(name=name)
+
+
+@pytest.fixture
+def counting_registry(registry):
+    CountingTool.created = CountingTool.opened = CountingTool.closed = 0
+    registry.register(CountingTool)
+    registry.register(UnsafeCountingTool)
+    return registry
+
+
+def test_thread_safe_tools_are_reused_across_calls(counting_registry):
+    calls = [tool_call(f"call_{i}", "counting_tool", label=str(i), seconds=0) for i in range(5)]
+    llm = FakeLLM([completion(tool_calls=calls), completion(tool_calls=calls), completion(content="done")])
+    with FunctionOrchestrator(llm) as orchestrator:
+        orchestrator.execute_workflow("q", "model", parallel_tool_calls=True)
+        assert CountingTool.created == 1
+        assert CountingTool.opened == 1
+        assert CountingTool.closed == 0
+    assert CountingTool.closed == 1
+
+
+def test_non_thread_safe_tools_get_exclusive_instances(counting_registry):
+    calls = [tool_call(f"call_{i}", "unsafe_counting_tool", label=str(i), seconds=0.2) for i in range(3)]
+    llm = FakeLLM([completion(tool_calls=calls), completion(tool_calls=calls[:1]), completion(content="done")])
+    orchestrator = FunctionOrchestrator(llm)
+    orchestrator.execute_workflow("q", "model", parallel_tool_calls=True)
+
+    # three concurrent callers need three instances; the follow-up call reuses an idle one
+    assert CountingTool.created == 3
+    orchestrator.close()
+    assert CountingTool.closed == 3
+
+
+def test_tool_configs_are_part_of_the_pool_key(counting_registry):
+    orchestrator = FunctionOrchestrator(FakeLLM([]), tool_configs={"counting_tool": {"name": "counting_tool"}})
+    with orchestrator._acquire_tool("counting_tool") as first, orchestrator._acquire_tool("counting_tool") as second:
+        assert first is second
+    orchestrator.function_map["counting_tool"] = (CountingTool, {})
+    with orchestrator._acquire_tool("counting_tool") as third:
+        assert third is not first
+
+
+def chunk(content=None, tool_calls=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def tool_call_fragment(index, call_id=None, name=None, arguments=None):
+    return SimpleNamespace(index=index, id=call_id,
+                           function=SimpleNamespace(name=name, arguments=arguments))
+
+
+def streamed_tool_calls():
+    return [
+        chunk(tool_calls=[tool_call_fragment(0, "call_a", "sleep_tool", '{"label": "a",')]),
+        chunk(tool_calls=[tool_call_fragment(1, "call_b", "sleep_tool", '{"label": "b", "seconds": 0}')]),
+        chunk(tool_calls=[tool_call_fragment(0, arguments=' "seconds": 0}')]),
+    ]
+
+
+def test_stream_workflow_yields_tokens_tools_and_final_answer(registry):
+    llm = FakeLLM([streamed_tool_calls(), [chunk("Hel"), chunk("lo")]])
+    events = list(FunctionOrchestrator(llm).stream_workflow("q", "model"))
+
+    assert [e["type"] for e in events] == [
+        "tool_call_start", "tool_call_end", "tool_result",
+        "tool_call_start", "tool_call_end", "tool_result",
+        "token", "token", "final_answer",
+    ]
+    assert [e["content"] for e in events if e["type"] == "tool_result"] == ["slept a", "slept b"]
+    final = events[-1]
+    assert final["content"] == "Hello"
+    assistant = final["conversation"][1]
+    assert [c["id"] for c in assistant["tool_calls"]] == ["call_a", "call_b"]
+    assert json.loads(assistant["tool_calls"][0]["function"]["arguments"]) == {"label": "a", "seconds": 0}
+
+
+def test_stream_workflow_yields_first_token_before_completion_ends(registry):
+    def slow_stream():
+        yield chunk("first")
+        time.sleep(0.5)
+        yield chunk(" second")
+
+    llm = FakeLLM([slow_stream()])
+    start = time.time()
+    stream = FunctionOrchestrator(llm).stream_workflow("q", "model")
+    assert next(stream) == {"type": "token", "content": "first"}
+    assert time.time() - start < 0.25
+    assert list(stream)[-1]["content"] == "first second"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_workflow(registry):
+    async def astream(chunks):
+        for c in chunks:
+            yield c
+
+    llm = AsyncFakeLLM([astream(streamed_tool_calls()), astream([chunk("done")])])
+    events = [e async for e in AsyncFunctionOrchestrator(llm).astream_workflow(
+        "q", "model", parallel_tool_calls=True)]
+
+    assert [e["type"] for e in events] == [
+        "tool_call_start", "tool_call_start",
+        "tool_call_end", "tool_result", "tool_call_end", "tool_result",
+        "token", "final_answer",
+    ]
+    assert events[-1]["content"] == "done"
+    assert len(events[-1]["tool_latencies"]) == 2
@@ -0,0 +1,129 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gofannon.base import http, rate_limit
+from gofannon.base.rate_limit import RateLimiter, RateLimitError, get_rate_limiter
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    throttled = 0
+    times = []
+
+    def do_GET(self):
+        Handler.times.append(time.monotonic())
+        if Handler.throttled:
+            Handler.throttled -= 1
+            self._reply(429, b"slow down", {"Retry-After": "1"})
+        else:
+            self._reply(200, b"ok", {"X-RateLimit-Remaining": "4000", "X-RateLimit-Limit": "5000",
+                                     "X-RateLimit-Reset": str(int(time.time()) + 3600)})
+
+    def _reply(self, status, body, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.throttled = 0
+    Handler.times = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters():
+    config = dict(rate_limit._rate_config, limits=dict(rate_limit._rate_config["limits"]))
+    http_defaults = dict(http._http_config)
+    http.configure_http(backoff_factor=0)
+    rate_limit.reset_rate_limiters()
+    yield
+    rate_limit._rate_config.update(config)
+    rate_limit.reset_rate_limiters()
+    http.configure_http(**http_defaults)
+
+
+def test_token_bucket_paces_after_burst():
+    limiter = RateLimiter("test", rate=10, burst=2)
+    waits = [limiter.reserve() for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.02)
+    assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+
+def test_limiters_are_shared_per_service_and_host():
+    a = get_rate_limiter("github", "https://api.github.com/repos/x/y")
+    assert a is get_rate_limiter("github", "api.github.com")
+    assert a is not get_rate_limiter("github", "uploads.github.com")
+    assert a is not get_rate_limiter(None, "api.github.com")
+    assert a.rate == 15.0
+
+
+def test_retry_after_pauses_every_caller():
+    limiter = RateLimiter("test")
+    assert limiter.reserve() == 0
+    limiter.observe(429, {"retry-after": "2"})
+    assert limiter.reserve() == pytest.approx(2, abs=0.05)
+
+
+def test_exhausted_quota_waits_for_reset_or_gives_up():
+    limiter = RateLimiter("test", max_wait=5)
+    limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 3)})
+    assert 1 < limiter.reserve() <= 3
+    limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 600)})
+    with pytest.raises(RateLimitError):
+        limiter.reserve()
+
+
+def test_low_quota_is_spread_over_the_window():
+    limiter = RateLimiter("test", rate=100, burst=1)
+    limiter.observe(200, {"X-RateLimit-Remaining": "4000", "X-RateLimit-Limit": "5000", "X-RateLimit-Reset": "60"})
+    assert limiter._current_rate() == 100
+    limiter.observe(200, {"X-RateLimit-Remaining": "30", "X-RateLimit-Limit": "5000", "X-RateLimit-Reset": "60"})
+    assert limiter._current_rate() == pytest.approx(0.5)
+
+
+def test_configure_rate_limit():
+    rate_limit.configure_rate_limit("github", rate=2)
+    assert get_rate_limiter("github", "api.github.com").rate == 2
+    rate_limit.configure_rate_limit("github", rate=None)
+    assert get_rate_limiter("github", "api.github.com").rate is None
+
+
+def test_session_honours_retry_after(server):
+    Handler.throttled = 1
+    response = http.get_session().get(server)
+    assert response.status_code == 200
+    assert Handler.times[1] - Handler.times[0] >= 0.95
+
+
+def test_session_requests_are_paced(server):
+    rate_limit.configure_rate_limit("paced", rate=20, burst=1)
+    session = http.get_session("paced")
+    start = time.monotonic()
+    for _ in range(5):
+        session.get(server)
+    assert time.monotonic() - start >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_the_limiter(server):
+    Handler.throttled = 1
+    response = await http.get_async_client().get(server)
+    assert response.status_code == 200
+    assert Handler.times[1] - Handler.times[0] >= 0.95
+    await http.aclose_clients()
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gofannon.reasoning import base
+from gofannon.reasoning.sequential_cot import SequentialCoT
+from gofannon.reasoning.tree_of_thought import TreeOfThought
+
+
+@pytest.fixture
+def fake_openai():
+    """A local chat completions endpoint that counts TCP connections."""
+    connections = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            payload = json.dumps({
+                "id": "c", "object": "chat.completion", "created": 0, "model": "fake",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "ok"}}],
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1", connections
+    server.shutdown()
+    base.close_llm_clients()
+
+
+def chart(base_url, api_key="k"):
+    return [{'model_name': "fake", 'base_url': base_url, 'api_key': api_key, 'temperature': 0}] * 3
+
+
+def test_clients_are_shared_across_levels_and_tools(fake_openai):
+    base_url, connections = fake_openai
+    first, second = TreeOfThought(depth_chart=chart(base_url)), SequentialCoT(depth_chart=chart(base_url))
+    assert first.create_openai_like_client(0) is first.create_openai_like_client(2)
+    assert first.create_openai_like_client(1) is second.create_openai_like_client(1)
+    assert TreeOfThought(depth_chart=chart(base_url, "other")).create_openai_like_client(0) \
+        is not first.create_openai_like_client(0)
+
+    for level in (0, 1, 2, 0):
+        assert first.get_response(level, [{"role": "user", "content": "hi"}]).choices[0].message.content == "ok"
+    # Four requests over one kept-alive connection.
+    assert len(connections) == 1
+
+
+def test_async_clients_are_pooled_per_event_loop(fake_openai):
+    base_url, connections = fake_openai
+    tool = TreeOfThought(depth_chart=chart(base_url))
+
+    async def run():
+        client = tool.create_async_openai_like_client(0)
+        assert tool.create_async_openai_like_client(1) is client
+        responses = [await tool.aget_response(level, [{"role": "user", "content": "hi"}]) for level in range(3)]
+        await base.aclose_llm_clients()
+        return client, responses
+
+    first_client, responses = asyncio.run(run())
+    assert [response.choices[0].message.content for response in responses] == ["ok"] * 3
+    assert len(connections) == 1
+    second_client, _ = asyncio.run(run())
+    assert second_client is not first_client
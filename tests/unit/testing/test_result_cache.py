@@ -0,0 +1,215 @@
+import time
+
+import pytest
+import responses
+
+from gofannon.base import WorkflowContext
+from gofannon.base.cache import (MemoryCache, RedisCache, SQLiteCache, ResultCache,
+                                 make_cache_key, set_default_cache)
+from gofannon.wikipedia.wikipedia_lookup import WikipediaLookup
+
+WIKI_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/Test_Query"
+
+
+@pytest.fixture
+def default_cache():
+    cache = MemoryCache()
+    set_default_cache(cache)
+    yield cache
+    set_default_cache(None)
+
+
+def test_cache_key_is_canonical():
+    assert make_cache_key("tool", {"a": 1, "b": [1, 2]}) == make_cache_key("tool", {"b": [1, 2], "a": 1})
+    assert make_cache_key("tool", {"a": 1}) != make_cache_key("other_tool", {"a": 1})
+
+
+def test_memory_cache_lru_and_ttl():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") is ResultCache.MISSING
+
+    cache.set("short", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is ResultCache.MISSING
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 2, "evictions": 3, "sets": 4}
+
+
+def test_memory_cache_hands_out_copies():
+    cache = MemoryCache()
+    value = {"items": [1, 2]}
+    cache.set("k", value, ttl=None)
+    value["items"].append(3)
+    cache.get("k")["items"].append(4)
+    assert cache.get("k") == {"items": [1, 2]}
+
+
+def test_sqlite_cache_persists_and_evicts(tmp_path):
+    path = tmp_path / "results.sqlite"
+    cache = SQLiteCache(path, max_entries=2)
+    cache.set("a", {"title": "A"}, ttl=60)
+    cache.set("b", ["B"], ttl=60)
+    cache.get("a")
+    cache.set("c", "C", ttl=60)
+    cache.close()
+
+    reopened = SQLiteCache(path, max_entries=2)
+    assert reopened.get("a") == {"title": "A"}
+    assert reopened.get("b") is ResultCache.MISSING
+    assert reopened.get("c") == "C"
+
+
+def test_sqlite_cache_evicts_by_size(tmp_path):
+    cache = SQLiteCache(tmp_path / "results.sqlite", max_bytes=250)
+    for key in "abc":
+        cache.set(key, "x" * 98, ttl=None)  # 100 bytes of JSON each
+        time.sleep(0.001)
+    assert cache.get("a") is ResultCache.MISSING
+    assert cache.get("b") == "x" * 98
+    assert cache.get("c") == "x" * 98
+    assert cache.stats.evictions == 1
+
+
+def test_sqlite_cache_tracks_totals_and_upgrades_old_files(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "results.sqlite"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE results (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                 "expires_at REAL, accessed_at REAL NOT NULL)")
+    conn.execute("INSERT INTO results VALUES ('old', '\"\u00e9\"', NULL, 0)")
+    conn.commit()
+    conn.close()
+
+    cache = SQLiteCache(path, max_bytes=1000)
+    cache.set("a", "x" * 8, ttl=None)
+    cache.set("a", "x" * 18, ttl=None)  # replacing an entry swaps its size
+    cache.set("b", "y", ttl=None)
+    cache.delete("b")
+
+    def totals():
+        return cache._conn.execute("SELECT entries, bytes FROM results_totals").fetchone()
+
+    assert totals() == (2, 4 + 20)
+    cache.close()
+    cache = SQLiteCache(path, max_bytes=1000)
+    assert cache.get("old") == "\u00e9"
+    cache.clear()
+    assert totals() == (0, 0)
+
+
+def test_redis_cache_uses_client_expiry():
+    class FakeRedis(dict):
+        def set(self, key, value, px=None):
+            self[key] = (value, px)
+
+        def get(self, key):
+            entry = dict.get(self, key)
+            return entry[0] if entry else None
+
+    client = FakeRedis()
+    cache = RedisCache(client)
+    cache.set("k", {"v": 1}, ttl=30)
+    assert client["gofannon:result:k"][1] == 30000
+    cache.set("short", 1, ttl=0.25)
+    assert client["gofannon:result:short"][1] == 250
+    cache.set("forever", 1, ttl=None)
+    assert client["gofannon:result:forever"][1] is None
+    assert cache.get("k") == {"v": 1}
+    assert cache.get("missing") is ResultCache.MISSING
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@responses.activate
+def test_cacheable_tool_serves_repeats_from_cache(default_cache):
+    responses.add(responses.GET, WIKI_URL, json={"title": "Test Article"}, status=200)
+    tool = WikipediaLookup()
+
+    first = tool.invoke(query="Test Query")
+    second = tool.execute(WorkflowContext(), query="Test Query").output
+
+    assert first == second
+    assert first["title"] == "Test Article"
+    assert len(responses.calls) == 1
+    assert default_cache.stats.hits == 1
+
+
+@responses.activate
+def test_error_results_are_not_cached(default_cache):
+    responses.add(responses.GET, WIKI_URL, status=404)
+    tool = WikipediaLookup()
+
+    tool.invoke(query="Test Query")
+    tool.invoke(query="Test Query")
+    assert len(responses.calls) == 2
+    assert default_cache.stats.sets == 0
+
+
+@responses.activate
+def test_tools_are_uncached_without_a_backend():
+    responses.add(responses.GET, WIKI_URL, json={"title": "Test Article"}, status=200)
+    tool = WikipediaLookup()
+    tool.invoke(query="Test Query")
+    tool.invoke(query="Test Query")
+    assert len(responses.calls) == 2
+
+
+def test_cache_keys_are_scoped_by_credentials_and_endpoint():
+    from gofannon.github.read_file import ReadFile
+    from gofannon.simpler_grants_gov.base import SimplerGrantsGovBase
+
+    arguments = {"repo_url": "https://github.com/o/r", "file_path": "secret.txt"}
+    assert ReadFile(api_key="tokA")._cache_key(arguments) != ReadFile(api_key="tokB")._cache_key(arguments)
+    assert ReadFile(api_key="tokA")._cache_key(arguments) == ReadFile(api_key="tokA")._cache_key(arguments)
+
+    class Grants(SimplerGrantsGovBase):
+        definition = {}
+
+        def fn(self):
+            pass
+
+    staging = Grants(api_key="k", base_url="https://staging.example")._cache_key({})
+    production = Grants(api_key="k", base_url="https://api.example")._cache_key({})
+    assert staging != production
+
+
+def test_async_invoke_keeps_blocking_cache_io_off_the_event_loop(tmp_path):
+    import asyncio
+    import threading
+
+    from gofannon.base import BaseTool
+
+    cache_threads = []
+
+    class RecordingCache(SQLiteCache):
+        def get(self, key):
+            cache_threads.append(threading.current_thread())
+            return super().get(key)
+
+        def set(self, key, value, ttl):
+            cache_threads.append(threading.current_thread())
+            super().set(key, value, ttl)
+
+    class AsyncTool(BaseTool):
+        cache_ttl = 60
+        definition = {}
+
+        def fn(self, x):
+            return x
+
+        async def afn(self, x):
+            return x * 2
+
+    tool = AsyncTool()
+    tool.result_cache = RecordingCache(tmp_path / "results.sqlite")
+
+    async def run():
+        return [await tool.ainvoke(x=2), await tool.ainvoke(x=2)], threading.current_thread()
+
+    results, loop_thread = asyncio.run(run())
+    assert results == [4, 4]
+    assert len(cache_threads) == 3
+    assert loop_thread not in cache_threads
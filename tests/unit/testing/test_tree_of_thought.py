@@ -0,0 +1,72 @@
+import json
+import threading
+import time
+
+from openai.types.chat import ChatCompletion
+
+from gofannon.reasoning.tree_of_thought import TreeOfThought
+
+LEVEL = {'model_name': "fake", 'base_url': "http://localhost", 'api_key': "k", 'temperature': 0.3}
+
+
+def completion(content):
+    return ChatCompletion.model_validate({
+        "id": "c", "object": "chat.completion", "created": 0, "model": "fake",
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": content}}],
+    })
+
+
+class FakeModel:
+    """Stands in for ``get_response``: sleeps, then answers by prompt type."""
+    def __init__(self, scores, delay=0.1):
+        self.scores = scores
+        self.delay = delay
+        self.in_flight = {1: 0, 2: 0}
+        self.peak = {1: 0, 2: 0}
+        self.lock = threading.Lock()
+
+    def __call__(self, level, messages):
+        prompt = messages[0]["content"]
+        if level == 0:
+            return completion(json.dumps({"branches": [f"Approach {i}" for i in range(len(self.scores))]}))
+        with self.lock:
+            self.in_flight[level] += 1
+            self.peak[level] = max(self.peak[level], self.in_flight[level])
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight[level] -= 1
+        if level == 1:
+            index = int(prompt.split("Approach ")[1].split("'")[0])
+            if self.scores[index] is None:
+                return completion("not json")
+            return completion(json.dumps({"score": self.scores[index], "strengths": [], "weaknesses": []}))
+        return completion(json.dumps({"examples": []}))
+
+
+def test_branches_are_evaluated_concurrently_and_sorted_stably():
+    scores = [5, 9, 5, None, 7, 9]
+    tool = TreeOfThought(depth_chart=[LEVEL, LEVEL, dict(LEVEL, max_concurrency=2)])
+    model = FakeModel(scores)
+    tool.get_response = model
+
+    start = time.time()
+    result = tool.fn("prompt", branches=len(scores), evaluation_depth=2)
+    elapsed = time.time() - start
+
+    # Serially: 6 evaluations + 6 analyses of 0.1s. Concurrently: one round
+    # of evaluations and three rounds of analyses (max_concurrency=2).
+    assert elapsed < 0.7
+    assert model.peak == {1: 6, 2: 2}
+    assert [branch["description"] for branch in result["all_branches"]] == [
+        "Approach 1", "Approach 5", "Approach 4", "Approach 0", "Approach 2", "Approach 3"]
+    assert [entry["stage"] for entry in result["debug_info"]["error_context"]] == ["evaluation_parsing_3"]
+
+
+def test_max_workers_one_is_serial():
+    tool = TreeOfThought(depth_chart=[LEVEL, LEVEL], max_workers=1)
+    model = FakeModel([1, 2, 3], delay=0.01)
+    tool.get_response = model
+    result = tool.fn("prompt", branches=3, evaluation_depth=1)
+    assert model.peak[1] == 1
+    assert result["best_branch"]["score"] == 3